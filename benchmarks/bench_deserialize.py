@@ -0,0 +1,60 @@
+"""
+PA-API レスポンスのデシリアライズ時間を測るベンチマーク。
+
+benchmarks/data/ の SearchItems / GetVariations レスポンス(各10件、全リソース)を
+「generic」(型文字列を毎回解析してプロパティのsetter経由で組み立てる従来の処理)と
+「compiled」(Deserializer のキャッシュ済みプランを使う処理)でデシリアライズし、
+1レスポンスあたりの時間を比べる。両者の結果が等しいことも確認する。
+
+    python benchmarks/bench_deserialize.py --rounds 200
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from paapi5_python_sdk.api_client import ApiClient  # noqa: E402
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+FIXTURES = (
+    ("SearchItems", "search_items_response.json", "SearchItemsResponse"),
+    ("GetVariations", "get_variations_response.json", "GetVariationsResponse"),
+)
+
+
+def bench(client, data, response_type, rounds):
+    began = time.perf_counter()
+    for _ in range(rounds):
+        client.deserialize_data(data, response_type)
+    return (time.perf_counter() - began) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    client = ApiClient("AKIDEXAMPLE", "secret", "webservices.amazon.co.jp", "us-west-2")
+    compiled = client.deserializer
+    print(f"rounds={args.rounds}")
+    for name, filename, response_type in FIXTURES:
+        with open(os.path.join(DATA_DIR, filename), encoding="utf-8") as f:
+            data = json.load(f)
+
+        client.deserializer = None
+        expected = client.deserialize_data(data, response_type)
+        before = bench(client, data, response_type, args.rounds)
+        client.deserializer = compiled
+        if client.deserialize_data(data, response_type) != expected:
+            raise SystemExit(f"{name}: compiled result differs from the generic one")
+        after = bench(client, data, response_type, args.rounds)
+        print(f"{name:14s} generic={before * 1000:7.2f}ms  compiled={after * 1000:7.2f}ms"
+              f"  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
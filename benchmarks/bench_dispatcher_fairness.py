@@ -0,0 +1,107 @@
+"""
+1つのサーバーがリンクを大量に貼っている間の、ほかの(静かな)サーバーの待ち時間を測るベンチマーク。
+
+処理能力は PA-API の上限を想定して、同時に workers 件・1件 delay 秒に制限する。
+「direct」は変更前と同じく on_message ごとにすぐ処理を始める方式(処理能力の空きを到着順に待つ)、
+「dispatcher」は bot.MessageDispatcher を通す方式。
+混雑したサーバーは開始時に burst 件を一度に送り、静かなサーバーはそれぞれ interval 秒ごとに1件送る。
+
+    python benchmarks/bench_dispatcher_fairness.py --burst 200 --quiet-guilds 5
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import bot  # noqa: E402
+
+
+def fake_message(guild_id, channel_id, sent_at):
+    return SimpleNamespace(guild=SimpleNamespace(id=guild_id), channel=SimpleNamespace(id=channel_id),
+                           sent_at=sent_at)
+
+
+async def run(mode, args):
+    loop = asyncio.get_running_loop()
+    capacity = asyncio.Semaphore(args.workers)
+    latencies = {"busy": [], "quiet": []}
+
+    async def process(messages):
+        async with capacity:
+            await asyncio.sleep(args.delay)
+        for message in messages:
+            kind = "busy" if message.guild.id == 0 else "quiet"
+            latencies[kind].append(loop.time() - message.sent_at)
+
+    dispatcher = bot.MessageDispatcher(lambda job: process(job.messages), workers=args.workers,
+                                       guild_limit=args.guild_queue, channel_limit=args.channel_queue,
+                                       overflow=args.overflow)
+    dispatcher.start()
+    tasks = []
+    max_pending = 0
+
+    def submit(message):
+        nonlocal max_pending
+        if mode == "direct":
+            tasks.append(asyncio.create_task(process([message])))
+            max_pending = max(max_pending, sum(1 for task in tasks if not task.done()))
+        else:
+            dispatcher.submit(message, [f"https://www.amazon.co.jp/dp/B{len(tasks):09d}"])
+            tasks.append(None)
+            max_pending = max(max_pending, dispatcher.size)
+
+    for i in range(args.burst):
+        submit(fake_message(0, i % 3, loop.time()))
+    for _ in range(args.rounds):
+        for guild_id in range(1, args.quiet_guilds + 1):
+            submit(fake_message(guild_id, guild_id, loop.time()))
+        await asyncio.sleep(args.interval)
+
+    if mode == "direct":
+        await asyncio.gather(*(task for task in tasks if task))
+    else:
+        while dispatcher.size or dispatcher.active_channels:
+            await asyncio.sleep(args.delay)
+        stats = dispatcher.stats()
+        await dispatcher.close()
+        return latencies, max_pending, stats
+    return latencies, max_pending, None
+
+
+def p99(samples):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * 0.99))] if samples else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--burst", type=int, default=200)
+    parser.add_argument("--quiet-guilds", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--interval", type=float, default=0.1)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--delay", type=float, default=0.02)
+    parser.add_argument("--guild-queue", type=int, default=bot.DISPATCH_GUILD_QUEUE)
+    parser.add_argument("--channel-queue", type=int, default=bot.DISPATCH_CHANNEL_QUEUE)
+    parser.add_argument("--overflow", default=bot.DISPATCH_OVERFLOW, choices=bot.MessageDispatcher.OVERFLOW_POLICIES)
+    args = parser.parse_args()
+
+    print(f"burst={args.burst} quiet_guilds={args.quiet_guilds} workers={args.workers} delay={args.delay}s"
+          f" overflow={args.overflow}")
+    for mode in ("direct", "dispatcher"):
+        latencies, max_pending, stats = asyncio.run(run(mode, args))
+        quiet = latencies["quiet"]
+        print(f"{mode:10s} quiet p50={statistics.median(quiet) * 1000:7.1f}ms p99={p99(quiet) * 1000:7.1f}ms"
+              f"  busy handled={len(latencies['busy']):4d}  max pending={max_pending:4d}")
+        if stats:
+            print(f"{'':10s} dropped={stats['dropped']} merged={stats['merged']} skipped_links={stats['skipped_links']}"
+                  f" rejected={stats['rejected']}")
+
+
+if __name__ == "__main__":
+    main()
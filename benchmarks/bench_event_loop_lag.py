@@ -0,0 +1,121 @@
+"""
+on_message のリンク処理がイベントループをどれだけ止めるかを測るベンチマーク。
+
+遅いリダイレクト解決とPA-API呼び出しを time.sleep で再現し、複数のリンク投稿を
+同時に処理している間のイベントループの遅延(lag)を計測する。
+「inline」は従来どおりコルーチン内で直接ブロッキング処理を呼ぶ場合、
+「executor」は bot.lookup_products([url]) (スレッドプール + GetItemsBatcher) を使う場合。
+
+    python benchmarks/bench_event_loop_lag.py --messages 20 --delay 0.2
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import bot  # noqa: E402
+from paapi5_python_sdk.get_items_batcher import GetItemsBatcher  # noqa: E402
+from paapi5_python_sdk.models.get_items_request import GetItemsRequest  # noqa: E402
+from paapi5_python_sdk.models.get_items_response import GetItemsResponse  # noqa: E402
+from paapi5_python_sdk.models.item import Item  # noqa: E402
+from paapi5_python_sdk.models.item_info import ItemInfo  # noqa: E402
+from paapi5_python_sdk.models.items_result import ItemsResult  # noqa: E402
+from paapi5_python_sdk.models.offer_listing import OfferListing  # noqa: E402
+from paapi5_python_sdk.models.offer_price import OfferPrice  # noqa: E402
+from paapi5_python_sdk.models.offers import Offers  # noqa: E402
+from paapi5_python_sdk.models.partner_type import PartnerType  # noqa: E402
+from paapi5_python_sdk.models.single_string_valued_attribute import SingleStringValuedAttribute  # noqa: E402
+
+TICK = 0.005
+
+
+class FakeApi(object):
+    """GetItemsの応答を delay 秒待ってから返す偽のDefaultApi"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.calls = 0
+
+    def get_items(self, request):
+        self.calls += 1
+        time.sleep(self.delay)
+        items = [Item(asin=asin,
+                      item_info=ItemInfo(title=SingleStringValuedAttribute(display_value="商品")),
+                      offers=Offers(listings=[OfferListing(price=OfferPrice(display_amount="￥1,000"))]))
+                 for asin in request.item_ids]
+        return GetItemsResponse(items_result=ItemsResult(items=items))
+
+
+def install_fakes(delay):
+    def fake_extract_asin(url):
+        time.sleep(delay)
+        return "B%09d" % int(url.rsplit("/", 1)[1])
+
+    api = FakeApi(delay)
+    bot.extract_asin = fake_extract_asin
+    bot.start_amazon_api = lambda: api
+    bot.item_batcher = GetItemsBatcher(api, partner_tag="tag-22", partner_type=PartnerType.ASSOCIATES,
+                                       marketplace="www.amazon.co.jp", resources=bot.AMAZON_RESOURCES,
+                                       max_delay=bot.GETITEMS_BATCH_DELAY, executor=bot.lookup_executor)
+    return api
+
+
+async def measure_lag(stop, samples):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(TICK)
+        samples.append(loop.time() - start - TICK)
+
+
+async def handle_inline(url):
+    # 変更前の on_message と同じく、コルーチン内で直接ブロッキング処理を呼ぶ
+    asin = bot.extract_asin(url)
+    request = GetItemsRequest(partner_tag="tag-22", partner_type=PartnerType.ASSOCIATES,
+                              marketplace="www.amazon.co.jp", item_ids=[asin],
+                              resources=bot.AMAZON_RESOURCES)
+    return asin, bot.parse_item(bot.start_amazon_api().get_items(request).items_result.items[0])
+
+
+async def handle_executor(url):
+    return (await bot.lookup_products([url]))[0]
+
+
+async def run(handler, messages):
+    stop = asyncio.Event()
+    samples = []
+    monitor = asyncio.create_task(measure_lag(stop, samples))
+    await asyncio.sleep(TICK * 2)
+    started = time.perf_counter()
+    await asyncio.gather(*(handler(f"https://amzn.to/{i}") for i in range(messages)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await monitor
+    samples.sort()
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return elapsed, max(samples), p99, statistics.mean(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.2,
+                        help="リダイレクト解決・PA-API呼び出しそれぞれの所要秒数")
+    args = parser.parse_args()
+
+    api = install_fakes(args.delay)
+    print(f"messages={args.messages} delay={args.delay}s workers={bot.LOOKUP_WORKERS}")
+    for name, handler in (("inline", handle_inline), ("executor", handle_executor)):
+        api.calls = 0
+        elapsed, lag_max, lag_p99, lag_mean = asyncio.run(run(handler, args.messages))
+        print(f"{name:9s} total={elapsed:7.3f}s  lag max={lag_max * 1000:8.1f}ms"
+              f"  p99={lag_p99 * 1000:8.1f}ms  mean={lag_mean * 1000:7.2f}ms  GetItems={api.calls}")
+
+
+if __name__ == "__main__":
+    main()
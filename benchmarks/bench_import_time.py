@@ -0,0 +1,74 @@
+"""
+paapi5_python_sdk の import にかかる時間を python -X importtime で測るベンチマーク。
+
+新しいプロセスで各シナリオの import 文を実行し、-X importtime の出力から
+paapi5_python_sdk 配下のモジュール(とそこから読み込まれた依存)の累積時間と、
+SDK自身のモジュールだけにかかった時間を出す。
+「all models」はすべてのモデルを読み込む場合で、従来の __init__ が行っていた処理に相当する。
+
+    python benchmarks/bench_import_time.py --runs 7
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+SCENARIOS = (
+    ("package", "import paapi5_python_sdk"),
+    ("bot", "; ".join((
+        "from paapi5_python_sdk.api.async_default_api import AsyncDefaultApi",
+        "from paapi5_python_sdk.async_api_client import AsyncApiClient",
+        "from paapi5_python_sdk.configuration import Configuration",
+        "from paapi5_python_sdk.get_items_batcher import GetItemsBatcher",
+        "from paapi5_python_sdk.item_cache import ItemCache",
+        "from paapi5_python_sdk.models.partner_type import PartnerType",
+        "from paapi5_python_sdk.rate_limiter import TokenBucketRateLimiter",
+        "from paapi5_python_sdk.rest import RetryPolicy",
+    ))),
+    ("all models", "import paapi5_python_sdk; from paapi5_python_sdk.models import *"),
+)
+
+
+def import_time(statement):
+    """statement の実行にかかった paapi5_python_sdk の累積時間、SDK自身のモジュールの
+    時間(いずれもマイクロ秒)と、読み込まれたモデルモジュールの数を返す"""
+    count = ("; import sys; print(sum(1 for m in list(sys.modules)"
+             " if m.startswith('paapi5_python_sdk.models.')))")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement + count],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    total = 0
+    own = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own_time, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # 見出し行
+        if name.strip().startswith("paapi5_python_sdk"):
+            own += int(own_time)
+            # 一番外側(インデントが1段)の行だけを足すと、入れ子の import を二重に数えない
+            if len(name) - len(name.lstrip()) == 1:
+                total += int(cumulative)
+    return total, own, int(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"runs={args.runs} python={sys.version.split()[0]}")
+    for name, statement in SCENARIOS:
+        samples = [import_time(statement) for _ in range(args.runs)]
+        total = statistics.median(sample[0] for sample in samples)
+        own = statistics.median(sample[1] for sample in samples)
+        print(f"{name:11s} total={total / 1000:7.1f}ms  sdk modules={own / 1000:6.1f}ms"
+              f"  model modules={samples[0][2]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+遅延モデル(lazy_models=True)で応答1件あたりのCPU時間とメモリがどれだけ減るかを測るベンチマーク。
+
+benchmarks/data/search_items_response.json (10件、全リソース)をデシリアライズし、
+bot.parse_item で埋め込みに使う項目だけを先頭の商品から読む。
+「eager」は応答全体を組み立てる従来の方式、「lazy」は読んだ属性だけを組み立てる方式。
+メモリはパース済みJSONを除いた、モデルオブジェクトが追加で確保した量を tracemalloc で測る。
+
+    python benchmarks/bench_lazy_models.py --rounds 500
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import bot  # noqa: E402
+from paapi5_python_sdk.api_client import ApiClient  # noqa: E402
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data",
+                       "search_items_response.json")
+
+
+def handle(client, data):
+    response = client.deserialize_data(data, "SearchItemsResponse")
+    bot.parse_item(response.search_result.items[0])
+    return response
+
+
+def bench_time(client, data, rounds):
+    handle(client, data)  # プランのコンパイルを計測から外す
+    began = time.perf_counter()
+    for _ in range(rounds):
+        handle(client, data)
+    return (time.perf_counter() - began) / rounds
+
+
+def bench_memory(client, data):
+    handle(client, data)
+    tracemalloc.start()
+    response = handle(client, data)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del response
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=500)
+    args = parser.parse_args()
+
+    with open(FIXTURE, encoding="utf-8") as f:
+        data = json.load(f)
+
+    print(f"rounds={args.rounds}")
+    results = {}
+    for name, lazy in (("eager", False), ("lazy", True)):
+        client = ApiClient("AKIDEXAMPLE", "secret", "webservices.amazon.co.jp",
+                           "us-west-2", lazy_models=lazy)
+        results[name] = (bench_time(client, data, args.rounds), bench_memory(client, data))
+        elapsed, size = results[name]
+        print(f"{name:6s} {elapsed * 1e6:8.1f}us/response  {size / 1024:7.1f}KiB/response")
+    print(f"lazy/eager time={results['lazy'][0] / results['eager'][0]:.2f}"
+          f"  memory={results['lazy'][1] / results['eager'][1]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+ApiClient にメトリクス(ApiMetrics)を付けたときの、呼び出し1件あたりの追加コストを測るベンチマーク。
+
+HTTP の送受信は偽の PoolManager に置き換え、benchmarks/data/ の SearchItems レスポンスの
+商品10件を GetItems のレスポンスとして毎回返す。署名・デシリアライズを含む get_items 1件の時間を
+「off」(metrics=None)と「on」(ApiMetrics)で比べ、/metrics 用のテキスト出力1回の時間も測る。
+
+CPUのクロックやキャッシュの状態の変化が片方だけに乗らないよう、off と on を交互に --rounds 回ずつ
+測り、それぞれの中央値と最小値を出す。1件数msの呼び出しでは差がばらつきに埋もれやすいので、
+呼び出し1件ごとに ApiMetrics が行う記録(observe_call と observe_request)だけの時間も別に測る。
+
+    python benchmarks/bench_metrics_overhead.py --calls 200 --rounds 11
+"""
+
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import time
+
+import urllib3
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from paapi5_python_sdk.api.default_api import DefaultApi  # noqa: E402
+from paapi5_python_sdk.api_client import ApiClient  # noqa: E402
+from paapi5_python_sdk.metrics import ApiMetrics, Registry  # noqa: E402
+from paapi5_python_sdk.models.get_items_request import GetItemsRequest  # noqa: E402
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+class FakePoolManager:
+    """常に同じレスポンスを返す urllib3.PoolManager の代わり。"""
+
+    def __init__(self, body):
+        self.body = body
+
+    def request(self, method, url, **kwargs):
+        return urllib3.HTTPResponse(body=io.BytesIO(self.body), status=200, preload_content=False,
+                                    headers={"Content-Type": "application/json",
+                                             "Content-Length": str(len(self.body))})
+
+
+def canned_body():
+    with open(os.path.join(DATA_DIR, "search_items_response.json"), encoding="utf-8") as f:
+        items = json.load(f)["SearchResult"]["Items"]
+    return json.dumps({"ItemsResult": {"Items": items}}).encode("utf-8"), [item["ASIN"] for item in items]
+
+
+def make_api(body, metrics):
+    client = ApiClient(access_key="AKIDEXAMPLE", secret_key="secret", host="webservices.amazon.co.jp",
+                       region="us-west-2", metrics=metrics)
+    client.rest_client.pool_manager = FakePoolManager(body)
+    return DefaultApi(api_client=client)
+
+
+def bench(api, request, calls):
+    began = time.perf_counter()
+    for _ in range(calls):
+        api.get_items(request)
+    return (time.perf_counter() - began) / calls
+
+
+def bench_record(metrics, calls):
+    """get_items 1件で ApiClient と RESTClientObject が行う記録だけを繰り返す"""
+    began = time.perf_counter()
+    for _ in range(calls):
+        started = time.perf_counter()
+        metrics.observe_request("GetItems", 200, time.perf_counter() - started, 400, 146000)
+        metrics.observe_call("GetItems", time.perf_counter() - started)
+    return (time.perf_counter() - began) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=11)
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--renders", type=int, default=1000)
+    args = parser.parse_args()
+
+    body, item_ids = canned_body()
+    request = GetItemsRequest(partner_tag="example-22", partner_type="Associates",
+                              marketplace="www.amazon.co.jp", item_ids=item_ids,
+                              resources=["ItemInfo.Title", "Offers.Listings.Price"])
+    registry = Registry()
+    off = make_api(body, None)
+    on = make_api(body, ApiMetrics(registry))
+    # 1回目のデシリアライズプラン作成などを計測から外す
+    off.get_items(request)
+    on.get_items(request)
+
+    print(f"calls={args.calls} rounds={args.rounds} response={len(body)} bytes")
+    times = {"off": [], "on": []}
+    for round_ in range(args.rounds):
+        # 先に測る方も毎回入れ替える
+        order = [("off", off), ("on", on)] if round_ % 2 == 0 else [("on", on), ("off", off)]
+        for name, api in order:
+            times[name].append(bench(api, request, args.calls))
+    for label, pick in (("median", statistics.median), ("min", min)):
+        before = pick(times["off"])
+        after = pick(times["on"])
+        print(f"get_items {label:6}  off={before * 1e6:8.1f}us  on={after * 1e6:8.1f}us"
+              f"  overhead={(after - before) * 1e6:6.1f}us ({(after / before - 1) * 100:+.1f}%)")
+
+    recorded = statistics.median(bench_record(ApiMetrics(Registry()), args.records) for _ in range(args.rounds))
+    print(f"record            {recorded * 1e6:8.2f}us per call (median of {args.rounds} x {args.records})")
+
+    began = time.perf_counter()
+    for _ in range(args.renders):
+        text = registry.render()
+    rendered = (time.perf_counter() - began) / args.renders
+    print(f"render            {rendered * 1e6:8.2f}us  ({len(text.splitlines())} lines)")
+
+
+if __name__ == "__main__":
+    main()
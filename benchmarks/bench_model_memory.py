@@ -0,0 +1,91 @@
+"""
+モデルを __slots__ にしたことで Item 1件あたりのメモリがどれだけ減ったかを測るベンチマーク。
+
+benchmarks/data/search_items_response.json の Item をデシリアライズし、
+到達できる全オブジェクト(モデル、リスト、値)の合計サイズを sys.getsizeof で数える。
+「__dict__」は従来の生成コードと同じく、__init__ で各属性と discriminator を
+インスタンスの __dict__ に設定するモデルに写した場合のサイズ。
+
+    python benchmarks/bench_model_memory.py
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from paapi5_python_sdk.api_client import ApiClient  # noqa: E402
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data",
+                       "search_items_response.json")
+
+_dict_classes = {}
+
+
+def dict_backed_class(klass):
+    """__slots__ の代わりに __dict__ を使う、従来の生成コード相当のクラス"""
+    cls = _dict_classes.get(klass)
+    if cls is None:
+        slots = klass.__slots__
+
+        def __init__(self, values):
+            for name, value in zip(slots, values):
+                setattr(self, name, value)
+            self.discriminator = None
+        cls = _dict_classes[klass] = type(klass.__name__, (object,), {"__init__": __init__})
+    return cls
+
+
+def to_dict_backed(value):
+    if isinstance(value, list):
+        return [to_dict_backed(v) for v in value]
+    if hasattr(value, "swagger_types") and not isinstance(value, dict):
+        klass = type(value)
+        return dict_backed_class(klass)([to_dict_backed(getattr(value, name))
+                                         for name in klass.__slots__])
+    return value
+
+
+def deep_size(root):
+    seen = set()
+    total = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if obj is None or id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif hasattr(obj, "__dict__"):
+            total += sys.getsizeof(obj.__dict__)
+            stack.extend(vars(obj).values())
+        elif hasattr(type(obj), "__slots__"):
+            stack.extend(getattr(obj, name) for name in type(obj).__slots__)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.parse_args()
+
+    with open(FIXTURE, encoding="utf-8") as f:
+        data = json.load(f)
+    client = ApiClient("AKIDEXAMPLE", "secret", "webservices.amazon.co.jp", "us-west-2")
+    items = client.deserialize_data(data, "SearchItemsResponse").search_result.items
+
+    slots = sum(deep_size(item) for item in items) / len(items)
+    before = sum(deep_size(to_dict_backed(item)) for item in items) / len(items)
+    print(f"items={len(items)}")
+    print(f"__dict__   {before:9.0f} bytes/Item")
+    print(f"__slots__  {slots:9.0f} bytes/Item  ({slots / before:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+PA-API リクエスト1件あたりの SigV4 署名コストを測るベンチマーク。
+
+「AWSV4Auth」はリクエストごとに署名オブジェクトを作り、署名鍵を毎回4段のHMACで
+導出する従来の方式、「AWSV4Signer」はクライアントに1つ持たせて日付ごとに
+署名鍵をキャッシュする方式。どちらも同じ GetItems リクエストに署名する。
+
+    python benchmarks/bench_signing.py --requests 20000
+"""
+
+import argparse
+import datetime
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from paapi5_python_sdk.auth.sign_helper import AWSV4Auth, AWSV4Signer  # noqa: E402
+
+HOST = "webservices.amazon.co.jp"
+REGION = "us-west-2"
+SERVICE = "ProductAdvertisingAPI"
+PATH = "/paapi5/getitems"
+
+PAYLOAD = {
+    "ItemIds": ["B0ABCDEFG%d" % i for i in range(10)],
+    "Resources": [
+        "Images.Primary.Large",
+        "ItemInfo.Title",
+        "ItemInfo.Features",
+        "Offers.Listings.Price",
+        "Offers.Listings.SavingBasis",
+        "Offers.Listings.Promotions",
+    ],
+    "PartnerTag": "example-22",
+    "PartnerType": "Associates",
+    "Marketplace": "www.amazon.co.jp",
+}
+
+
+def headers_for(timestamp):
+    return {
+        "Accept": "application/json",
+        "User-Agent": "paapi5-python-sdk/1.0.0",
+        "x-amz-target": "com.amazon.paapi5.v1.ProductAdvertisingAPIv1.GetItems",
+        "content-encoding": "amz-1.0",
+        "Content-Type": "application/json; charset=utf-8",
+        "host": HOST,
+        "x-amz-date": timestamp.strftime("%Y%m%dT%H%M%SZ"),
+    }
+
+
+def sign_auth(timestamp):
+    AWSV4Auth(access_key="AKIDEXAMPLE", secret_key="secret", host=HOST,
+              region=REGION, service=SERVICE, method_name="POST",
+              timestamp=timestamp, headers=headers_for(timestamp),
+              payload=PAYLOAD, path=PATH).get_headers()
+
+
+def make_sign_signer():
+    signer = AWSV4Signer("AKIDEXAMPLE", "secret", REGION, SERVICE)
+    payload = json.dumps(PAYLOAD).encode("utf-8")
+
+    def sign(timestamp):
+        signer.sign("POST", PATH, headers_for(timestamp), payload, timestamp)
+    return sign
+
+
+def bench(sign, requests):
+    start = datetime.datetime(2024, 1, 1)
+    # 同じ日のうちに1秒ずつずらして署名する(署名鍵の導出は日付が変わるときだけ)
+    timestamps = [start + datetime.timedelta(seconds=i % 86400) for i in range(requests)]
+    began = time.perf_counter()
+    for timestamp in timestamps:
+        sign(timestamp)
+    return (time.perf_counter() - began) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    before = bench(sign_auth, args.requests)
+    after = bench(make_sign_signer(), args.requests)
+    print(f"requests={args.requests}")
+    print(f"AWSV4Auth    {before * 1e6:7.2f}us/request")
+    print(f"AWSV4Signer  {after * 1e6:7.2f}us/request  ({before / after:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
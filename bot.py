@@ -1,131 +1,767 @@
 import os
+import asyncio
+import contextlib
 import discord
+import json
+import logging
+import math
 import re
 import requests
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from flask import Flask
 import threading
-from paapi5_python_sdk.api.default_api import DefaultApi
+from aiohttp import web
+from urllib.parse import unquote, urljoin, urlsplit
+from paapi5_python_sdk.api.async_default_api import AsyncDefaultApi
+from paapi5_python_sdk.async_api_client import AsyncApiClient
+from paapi5_python_sdk.configuration import Configuration
+from paapi5_python_sdk.get_items_batcher import GetItemsBatcher
+from paapi5_python_sdk.item_cache import ItemCache
+from paapi5_python_sdk.item_store import SQLiteItemStore
+from paapi5_python_sdk import metrics
 from paapi5_python_sdk.models.get_items_request import GetItemsRequest
 from paapi5_python_sdk.models.partner_type import PartnerType
-
-app = Flask(__name__)
-
-@app.route("/")
-def health_check():
-    return "OK", 200
-
-def run_http_server():
-    port = int(os.getenv("PORT", "8000"))
-    app.run(host="0.0.0.0", port=port)
-
-http_thread = threading.Thread(target=run_http_server)
-http_thread.daemon = True
-http_thread.start()
+from paapi5_python_sdk.rate_limiter import PRIORITY_BACKGROUND, TokenBucketRateLimiter
+from paapi5_python_sdk.rest import RetryPolicy
+from paapi5_python_sdk.single_flight import SingleFlight
 
 TOKEN = os.getenv('TOKEN')
 AMAZON_ACCESS_KEY = os.getenv('AMAZON_ACCESS_KEY')
 AMAZON_SECRET_KEY = os.getenv('AMAZON_SECRET_KEY')
 AMAZON_ASSOCIATE_TAG = os.getenv('AMAZON_ASSOCIATE_TAG')
 
-# 日本語や全角記号が入ったURLに対応するため、\S+を使用
-AMAZON_URL_REGEX = r"(https?://(?:www\.)?(?:amazon\.co\.jp|amzn\.asia|amzn\.to)/\S+)"
+# 短縮URLのリダイレクト解決はブロッキングなので、イベントループではなくこのスレッドプールで実行する
+LOOKUP_WORKERS = int(os.getenv("LOOKUP_WORKERS", "8"))
+lookup_executor = ThreadPoolExecutor(max_workers=LOOKUP_WORKERS, thread_name_prefix="amazon-lookup")
 
-def fetch_amazon_data(asin):
-    try:
-        api_client = DefaultApi(
-            access_key=AMAZON_ACCESS_KEY,
-            secret_key=AMAZON_SECRET_KEY,
-            host="webservices.amazon.co.jp",
-            region="us-west-2"
-        )
+AMAZON_RESOURCES = [
+    "ItemInfo.Title",
+    "ItemInfo.Features",
+    "Images.Primary.Large",
+    "Offers.Listings.Price",
+    "Offers.Listings.SavingBasis"
+]
+
+# 複数メッセージから同時に来たASINをまとめて1回のGetItems(最大10件)で取得するための待ち時間(秒)
+GETITEMS_BATCH_DELAY = float(os.getenv("GETITEMS_BATCH_DELAY", "0.05"))
+
+# 商品情報キャッシュ: 件数上限と、商品名・画像など(静的)と価格(変動)それぞれの有効期間(秒)
+PRODUCT_CACHE_SIZE = int(os.getenv("PRODUCT_CACHE_SIZE", "2048"))
+PRODUCT_CACHE_STATIC_TTL = float(os.getenv("PRODUCT_CACHE_STATIC_TTL", "86400"))
+PRODUCT_CACHE_PRICE_TTL = float(os.getenv("PRODUCT_CACHE_PRICE_TTL", "300"))
+# 価格の有効期間が切れてからこの秒数までは、古い価格をすぐに表示して裏で取得し直す
+PRODUCT_CACHE_PRICE_STALE = float(os.getenv("PRODUCT_CACHE_PRICE_STALE", "3600"))
+# 再起動してもキャッシュが残るように商品情報を保存するSQLiteファイル(空にすると保存しない)と件数上限
+PRODUCT_CACHE_DB = os.getenv("PRODUCT_CACHE_DB", "product_cache.sqlite3")
+PRODUCT_CACHE_DB_SIZE = int(os.getenv("PRODUCT_CACHE_DB_SIZE", "20000"))
+# 起動時に、保存済みのうち最近使われた何件を裏で読み込み直すか
+PRODUCT_CACHE_WARM_COUNT = int(os.getenv("PRODUCT_CACHE_WARM_COUNT", "200"))
+
+PAAPI_MAX_CONNECTIONS = int(os.getenv("PAAPI_MAX_CONNECTIONS", "8"))
+# PA-APIの利用上限(アカウントごとのTPS/TPD)。超えた分はエラーにせず順番待ちさせる
+PAAPI_TPS = float(os.getenv("PAAPI_TPS", "1"))
+PAAPI_TPD = int(os.getenv("PAAPI_TPD", "8640"))
+PAAPI_BURST = int(os.getenv("PAAPI_BURST", "1"))
+# 順番待ちの最大秒数。これを超えたら取得失敗として扱う
+PAAPI_QUEUE_TIMEOUT = float(os.getenv("PAAPI_QUEUE_TIMEOUT", "30"))
+# TooManyRequestsや5xxのときの最大試行回数(初回を含む)
+PAAPI_MAX_ATTEMPTS = int(os.getenv("PAAPI_MAX_ATTEMPTS", "4"))
+
+# PA-APIの取得がこの回数続けて失敗したら、PAAPI_CIRCUIT_RESET 秒のあいだ呼び出しを止める
+PAAPI_CIRCUIT_FAILURES = int(os.getenv("PAAPI_CIRCUIT_FAILURES", "5"))
+PAAPI_CIRCUIT_RESET = float(os.getenv("PAAPI_CIRCUIT_RESET", "60"))
+
+class CircuitBreaker:
+    """失敗が続いている相手への呼び出しを一時的に止める
+
+    closed: 通常どおり呼び出す
+    open: 呼び出さずにすぐ失敗させる(reset_timeout 秒たつまで)
+    half_open: 試しに1回だけ呼び出し、成功すれば closed、失敗すれば open に戻る
+    """
+
+    def __init__(self, failure_threshold, reset_timeout, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self.trial = False
+        self.rejected = 0
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        if self.trial or self.clock() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self):
+        """呼び出してよければ True を返す"""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self.trial:
+            self.trial = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.trial = False
+
+    def record_failure(self):
+        self.failures += 1
+        self.trial = False
+        if self.failures >= self.failure_threshold:
+            self.opened_at = self.clock()
+
+    def stats(self):
+        return {"state": self.state, "failures": self.failures, "rejected": self.rejected}
+
+paapi_circuit = CircuitBreaker(PAAPI_CIRCUIT_FAILURES, PAAPI_CIRCUIT_RESET)
+
+def record_paapi_batch(error):
+    """GetItemsBatcher の1回の呼び出しの結果を回路遮断器に記録する(商品がないだけなら成功)"""
+    if error is None:
+        paapi_circuit.record_success()
+    else:
+        paapi_circuit.record_failure()
+
+# PA-APIクライアントはプロセス全体で1つだけ作り、接続(keep-alive)を使い回す
+amazon_api = None
+item_batcher = None
+product_store = None
+amazon_api_lock = threading.Lock()
+
+def start_amazon_api():
+    """共有PA-APIクライアントを作成する(作成済みならそれを返す)"""
+    global amazon_api, item_batcher, product_store
+    with amazon_api_lock:
+        if amazon_api is None:
+            if PRODUCT_CACHE_DB:
+                product_store = SQLiteItemStore(PRODUCT_CACHE_DB, max_entries=PRODUCT_CACHE_DB_SIZE)
+            # PA-APIへの同時接続数の上限
+            configuration = Configuration()
+            configuration.connection_pool_maxsize = PAAPI_MAX_CONNECTIONS
+            api_client = AsyncApiClient(
+                access_key=AMAZON_ACCESS_KEY,
+                secret_key=AMAZON_SECRET_KEY,
+                host="webservices.amazon.co.jp",
+                region="us-west-2",
+                configuration=configuration,
+                item_cache=ItemCache(
+                    max_entries=PRODUCT_CACHE_SIZE,
+                    static_ttl=PRODUCT_CACHE_STATIC_TTL,
+                    volatile_ttl=PRODUCT_CACHE_PRICE_TTL,
+                    store=product_store,
+                    stale_while_revalidate=PRODUCT_CACHE_PRICE_STALE
+                ),
+                rate_limiter=TokenBucketRateLimiter(
+                    rate=PAAPI_TPS,
+                    burst=PAAPI_BURST,
+                    per_day=PAAPI_TPD,
+                    timeout=PAAPI_QUEUE_TIMEOUT
+                ),
+                retry_policy=RetryPolicy(max_attempts=PAAPI_MAX_ATTEMPTS),
+                # 埋め込みに使う数項目だけを読むので、モデルはアクセス時に組み立てる
+                lazy_models=True,
+                # 同じ商品が複数チャンネルに同時に貼られたときはリクエストを1つにまとめる
+                single_flight=SingleFlight(),
+                # PA-APIの呼び出し回数・時間・バイト数を /metrics に出す
+                metrics=metrics.ApiMetrics()
+            )
+            amazon_api = AsyncDefaultApi(api_client=api_client)
+            item_batcher = GetItemsBatcher(
+                amazon_api,
+                partner_tag=AMAZON_ASSOCIATE_TAG,
+                partner_type=PartnerType.ASSOCIATES,
+                marketplace="www.amazon.co.jp",
+                resources=AMAZON_RESOURCES,
+                max_delay=GETITEMS_BATCH_DELAY,
+                on_batch=record_paapi_batch
+            )
+        return amazon_api
+
+async def shutdown_amazon_api():
+    """共有PA-APIクライアントの接続を閉じる"""
+    global amazon_api, item_batcher, product_store
+    with amazon_api_lock:
+        api, amazon_api = amazon_api, None
+        store, product_store = product_store, None
+        batcher, item_batcher = item_batcher, None
+    if batcher is not None:
+        # 閉じたクライアントでGetItemsを送らないよう、待っている取得を先に止める
+        await batcher.close()
+    if api is not None:
+        # 裏で進んでいる価格の更新と商品の保存が終わってから閉じる
+        await api.api_client.item_cache.drain()
+        await api.close()
+    if store is not None:
+        store.close()
+
+async def cancel_tasks(tasks):
+    """タスクを止め、終わるまで待つ(None は無視する)"""
+    tasks = [task for task in tasks if task is not None]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+async def warm_product_cache():
+    """保存済みの商品のうち最近使われたものを、対話の邪魔をしない優先度で取得し直す
+
+    キャッシュが有効期限内ならリクエストは送られず、メモリに読み込まれるだけになる。
+    """
+    api = start_amazon_api()
+    if product_store is None or PRODUCT_CACHE_WARM_COUNT <= 0:
+        return
+    asins = await asyncio.get_running_loop().run_in_executor(
+        lookup_executor, product_store.recent_item_ids, PRODUCT_CACHE_WARM_COUNT)
+    for start in range(0, len(asins), GetItemsBatcher.MAX_ITEM_IDS):
         request = GetItemsRequest(
             partner_tag=AMAZON_ASSOCIATE_TAG,
             partner_type=PartnerType.ASSOCIATES,
             marketplace="www.amazon.co.jp",
-            item_ids=[asin],
-            resources=[
-                "ItemInfo.Title",
-                "ItemInfo.Features",
-                "Images.Primary.Large",
-                "Offers.Listings.Price",
-                "Offers.Listings.SavingBasis",
-                "Offers.Listings.Promotions"
-            ]
+            item_ids=asins[start:start + GetItemsBatcher.MAX_ITEM_IDS],
+            resources=AMAZON_RESOURCES
         )
-        response = api_client.get_items(request)
-
-        if response.items_result and response.items_result.items:
-            item = response.items_result.items[0]
-            
-            title = item.item_info.title.display_value if item.item_info and item.item_info.title else "商品名なし"
-            features = []
-            if (item.item_info and item.item_info.features 
-                and item.item_info.features.display_values):
-                features = item.item_info.features.display_values[:3]
-            
-            image_url = ""
-            if item.images and item.images.primary and item.images.primary.large:
-                image_url = item.images.primary.large.url
-
-            # オファー情報
-            if not (item.offers and item.offers.listings and len(item.offers.listings) > 0):
-                return title, None, None, None, None, image_url, features, False
-
-            listing = item.offers.listings[0]
-            current_price = listing.price.display_amount if listing.price else None
-            
-            # SavingBasis(参考価格)がある場合
-            saving_basis = listing.saving_basis
-            if saving_basis and saving_basis.display_amount:
-                strike_price = saving_basis.display_amount
-            else:
-                strike_price = None
-
-            # 割引率の計算
-            discount_percentage = None
-            discount_amount = None
-            if strike_price and current_price:
-                try:
-                    strike_num = float(strike_price.replace(",", "").replace("¥", ""))
-                    current_num = float(current_price.replace(",", "").replace("¥", ""))
-                    if strike_num > current_num:  # 割引されているときだけ
-                        discount_percentage = int(round((strike_num - current_num) / strike_num * 100))
-                        discount_amount = strike_num - current_num
-                except:
-                    pass
-            
-            # タイムセール(簡易判定)
-            is_time_sale = False
-            if listing.promotions:
-                for promo in listing.promotions:
-                    if promo.summary and ("タイムセール" in promo.summary or "time sale" in promo.summary.lower()):
-                        is_time_sale = True
-                        break
-
-            return (title, strike_price, current_price, discount_percentage, discount_amount, 
-                    is_time_sale, image_url, features, True)
-        else:
-            return None, None, None, None, None, None, None, False
+        try:
+            await api.get_items(request, _priority=PRIORITY_BACKGROUND)
+        except Exception as e:
+            print(f"キャッシュの読み込み直しに失敗しました: {e}")
+            return
+
+# 日本語や全角記号が入ったURLに対応するため、\S+を使用
+AMAZON_URL_REGEX = r"(https?://(?:www\.)?(?:amazon\.co\.jp|amzn\.asia|amzn\.to)/\S+)"
+
+FETCH_FAILED = (None, None, None, None, None, None, None, False, None)
+
+def parse_item(item):
+    """PA-APIのItemから埋め込みに使う情報を取り出す"""
+    title = item.item_info.title.display_value if item.item_info and item.item_info.title else "商品名なし"
+    features = []
+    if (item.item_info and item.item_info.features 
+        and item.item_info.features.display_values):
+        features = item.item_info.features.display_values[:3]
+    
+    image_url = ""
+    if item.images and item.images.primary and item.images.primary.large:
+        image_url = item.images.primary.large.url
+
+    # オファー情報
+    if not (item.offers and item.offers.listings and len(item.offers.listings) > 0):
+        return title, None, None, None, None, image_url, features, False
+
+    listing = item.offers.listings[0]
+    current_price = listing.price.display_amount if listing.price else None
+    
+    # SavingBasis(参考価格)がある場合
+    saving_basis = listing.saving_basis
+    if saving_basis and saving_basis.display_amount:
+        strike_price = saving_basis.display_amount
+    else:
+        strike_price = None
+
+    # 割引率の計算
+    discount_percentage = None
+    discount_amount = None
+    if strike_price and current_price:
+        try:
+            strike_num = float(strike_price.replace(",", "").replace("¥", ""))
+            current_num = float(current_price.replace(",", "").replace("¥", ""))
+            if strike_num > current_num:  # 割引されているときだけ
+                discount_percentage = int(round((strike_num - current_num) / strike_num * 100))
+                discount_amount = strike_num - current_num
+        except:
+            pass
+    
+    return (title, strike_price, current_price, discount_percentage, discount_amount,
+            image_url, features, True)
+
+async def fetch_amazon_data(asin):
+    # PA-APIが失敗し続けているあいだは、待たせずにすぐ失敗を返す
+    if not paapi_circuit.allow():
+        return FETCH_FAILED
+    try:
+        start_amazon_api()
     except Exception as e:
+        # GetItemsまで届かなかった失敗はここで記録する(half_open の試行を残したままにしない)
+        paapi_circuit.record_failure()
         print(f"Amazon情報取得エラー: {e}")
-        return None, None, None, None, None, None, None, False
+        return FETCH_FAILED
+    try:
+        # キャッシュの古い価格を返したときは、その取得時刻を埋め込みに表示する
+        item, fetched_at = await item_batcher.get_item_with_fetch_time(asin)
+    except Exception as e:
+        # 成功・失敗はASINごとではなく、GetItemsの呼び出しごとに record_paapi_batch で記録する
+        print(f"Amazon情報取得エラー: {e}")
+        return FETCH_FAILED
+    # 1件の解析に失敗しても、同じメッセージのほかのリンクの埋め込みは送る
+    try:
+        return parse_item(item) + (fetched_at,)
+    except Exception as e:
+        print(f"Amazon情報取得エラー: {e}")
+        return FETCH_FAILED
+
+# URLのパスに含まれるASIN (/dp/, /gp/product/, /gp/aw/d/ など。日本語のスラッグが前に付いていてもよい)
+# AMAZON_URL_REGEX はURLの直後の文字(「、」や「)」など)も拾うので、ASINの後ろは英数字が続かないことだけを見る
+ASIN_PATH_REGEX = re.compile(
+    r"/(?:dp|gp/product|gp/aw/d|exec/obidos/ASIN|o/ASIN)/([A-Z0-9]{10})(?![A-Z0-9])",
+    re.IGNORECASE
+)
+
+# 短縮URL(amzn.to / amzn.asia)をたどる最大回数
+MAX_REDIRECTS = 5
+
+# 短縮URL→ASINの対応を保存するファイルと件数上限
+SHORTLINK_CACHE_PATH = os.getenv("SHORTLINK_CACHE_PATH", "shortlink_cache.json")
+SHORTLINK_CACHE_SIZE = int(os.getenv("SHORTLINK_CACHE_SIZE", "10000"))
+
+# リダイレクト解決用のセッション(接続を使い回す)
+http_session = requests.Session()
+http_session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=LOOKUP_WORKERS))
+http_session.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=LOOKUP_WORKERS))
+
+class ShortLinkCache:
+    """短縮URL→ASINの対応を覚えておくLRUキャッシュ。JSONファイルに保存して再起動後も使う"""
+
+    # この件数だけ新しい対応が増えたらファイルに書き出す
+    SAVE_EVERY = 50
+
+    def __init__(self, path, max_entries):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = None
+        self.unsaved = 0
+        self.lock = threading.Lock()
+
+    def _load(self):
+        self.entries = OrderedDict()
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.entries.update(json.load(f))
+        except Exception as e:
+            print(f"短縮URLキャッシュ読み込みエラー: {e}")
+
+    def get(self, url):
+        with self.lock:
+            if self.entries is None:
+                self._load()
+            asin = self.entries.get(url)
+            if asin:
+                self.entries.move_to_end(url)
+            return asin
+
+    def put(self, url, asin):
+        with self.lock:
+            if self.entries is None:
+                self._load()
+            self.entries[url] = asin
+            self.entries.move_to_end(url)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self.unsaved += 1
+            if self.unsaved >= self.SAVE_EVERY:
+                self._save()
+
+    def save(self):
+        with self.lock:
+            if self.entries is not None and self.unsaved:
+                self._save()
+
+    def _save(self):
+        if not self.path:
+            return
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, self.path)
+            self.unsaved = 0
+        except Exception as e:
+            print(f"短縮URLキャッシュ保存エラー: {e}")
+
+shortlink_cache = ShortLinkCache(SHORTLINK_CACHE_PATH, SHORTLINK_CACHE_SIZE)
+
+def parse_asin(url):
+    """URLにASINが含まれていれば、通信せずにそれを返す"""
+    asin_match = ASIN_PATH_REGEX.search(unquote(urlsplit(url).path))
+    if asin_match:
+        return asin_match.group(1).upper()
+    return None
+
+def resolve_asin(url):
+    """リダイレクト先をたどってASINを探す。ページ本体はダウンロードしない"""
+    for _ in range(MAX_REDIRECTS):
+        response = http_session.head(url, allow_redirects=False, timeout=5)
+        if response.status_code == 405:
+            # HEADを受け付けない場合は、本体を読まないGETで代用する
+            response.close()
+            response = http_session.get(url, allow_redirects=False, stream=True, timeout=5)
+        response.close()
+        location = response.headers.get("Location")
+        if not (response.is_redirect and location):
+            # リダイレクトしないURLは、応答したURL自体にASINがあればそれを使う
+            return parse_asin(response.url or url)
+        url = urljoin(url, location)
+        asin = parse_asin(url)
+        if asin:
+            return asin
+    return None
 
 def extract_asin(url):
     try:
-        parsed_url = requests.get(url, allow_redirects=True, timeout=5).url
-        asin_match = re.search(r"/dp/([A-Z0-9]{10})", parsed_url)
-        if asin_match:
-            return asin_match.group(1)
-        return None
+        asin = parse_asin(url)
+        if asin:
+            return asin
+
+        asin = shortlink_cache.get(url)
+        if asin:
+            return asin
+
+        asin = resolve_asin(url)
+        if asin:
+            shortlink_cache.put(url, asin)
+        return asin
     except Exception as e:
         print(f"ASIN抽出エラー: {e}")
         return None
 
+async def resolve_asin_async(url):
+    """URLからASINを得る。URLにASINがなければスレッドプールでリダイレクトを解決する"""
+    asin = parse_asin(url)
+    if asin:
+        return asin
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(lookup_executor, extract_asin, url)
+
+async def lookup_products(urls):
+    """複数のURLをまとめて処理し、URLと同じ順番で (asin, 商品情報) のリストを返す
+
+    まず全URLのASINを並行して解決し、そのあと全ASINの商品情報を同時に要求する。
+    同時に要求したASINはGetItemsBatcherによって1回のGetItemsにまとめられるので、
+    リンクがN個あっても待ち時間はほぼリンク1個分で済む。
+    """
+    asins = await asyncio.gather(*(resolve_asin_async(url) for url in urls))
+    products = await asyncio.gather(*(fetch_amazon_data(asin) for asin in asins if asin))
+    products = iter(products)
+    return [(asin, next(products)) if asin else (None, None) for asin in asins]
+
+def affiliate_url(asin):
+    return f"https://www.amazon.co.jp/dp/{asin}/?tag={AMAZON_ASSOCIATE_TAG}"
+
+def is_complete(product):
+    """埋め込みに必要な商品名と価格がそろっているか"""
+    title, current_price, has_offer = product[0], product[2], product[7]
+    return bool(title and has_offer and current_price)
+
+def build_embed(asin, product):
+    (title, strike_price, current_price, 
+     discount_percentage, discount_amount,
+     image_url, features, has_offer, fetched_at) = product
+
+    # 価格を取得した時刻(UTC)→JST
+    fetched_utc = datetime.utcfromtimestamp(fetched_at)
+    jst = fetched_utc + timedelta(hours=9)
+    time_str = jst.strftime("%Y/%m/%d %H:%M")
+
+    # 価格表示部分
+    price_line = ""
+    # 定価があれば打ち消し線を入れる
+    if strike_price:
+        price_line += f"~~{strike_price}~~ → "
+
+    price_line += current_price
+
+    # 割引率と値引き額
+    if discount_percentage and discount_percentage > 0 and discount_amount:
+        # 「(XX%OFF)」と 「**¥YYY引き**」を表示
+        off_str = f"({discount_percentage}%OFF)"
+        discount_str = f"**¥{int(discount_amount):,}引き**"  # 3桁区切り
+        price_line += f" {off_str} {discount_str}"
+
+    # 時刻
+    price_line += f" （{time_str}時点）"
+
+    desc = f"**価格**: {price_line}\n"
+    if features:
+        bullet_points = "\n".join([f"- {f}" for f in features])
+        desc += f"\n**特徴**:\n{bullet_points}\n"
+
+    embed = discord.Embed(
+        title=title,
+        url=affiliate_url(asin),
+        description=desc,
+        color=discord.Color.blue()
+    )
+    embed.set_thumbnail(url=image_url)
+    return embed
+
+def build_pending_embed(asin, note):
+    """商品情報がまだない(取得できなかった)ときの、アフィリエイトリンクだけの埋め込み"""
+    return discord.Embed(
+        title=f"Amazonの商品 ({asin})",
+        url=affiliate_url(asin),
+        description=note,
+        color=discord.Color.light_grey()
+    )
+
+# 受け付けたリンクを処理する同時実行数と、キューに溜められる件数の上限(サーバーごと・チャンネルごと)
+DISPATCH_WORKERS = int(os.getenv("DISPATCH_WORKERS", "4"))
+DISPATCH_GUILD_QUEUE = int(os.getenv("DISPATCH_GUILD_QUEUE", "20"))
+DISPATCH_CHANNEL_QUEUE = int(os.getenv("DISPATCH_CHANNEL_QUEUE", "5"))
+# キューが一杯のときの動作
+#   drop_oldest: 一番古い待ちを捨てる
+#   merge: 同じチャンネルの最後の待ちにリンクをまとめる(重複するASINは1回だけ処理する)
+#   busy: 混雑している旨を返信して受け付けない
+DISPATCH_OVERFLOW = os.getenv("DISPATCH_OVERFLOW", "merge")
+# mergeで1件にまとめるリンクの上限(超えた分の新しい商品は処理しない)
+DISPATCH_MAX_LINKS = int(os.getenv("DISPATCH_MAX_LINKS", "10"))
+# mergeで1件にまとめるメッセージの上限。まとめたメッセージはすべて埋め込みを抑制するので、
+# 1回の処理で同じチャンネルに送る編集の数もこれで抑えられる(超えた分は busy と同じく受け付けない)
+DISPATCH_MAX_MESSAGES = int(os.getenv("DISPATCH_MAX_MESSAGES", "10"))
+
+# 1にすると、ASINが分かった時点でアフィリエイトリンクだけの埋め込みを投稿し、価格が取れたら編集する
+PROGRESSIVE_EMBEDS = os.getenv("PROGRESSIVE_EMBEDS", "0") == "1"
+# 価格を取得できなかった商品を取得し直すまでの秒数(カンマ区切りで、試す回数だけ並べる)
+PROGRESSIVE_RETRY_DELAYS = [float(delay) for delay in os.getenv("PROGRESSIVE_RETRY_DELAYS", "30,120").split(",") if delay]
+
+BUSY_MESSAGE = "混雑しているため、このリンクは処理できませんでした。少し時間をおいてもう一度お試しください。"
+
+def link_key(url):
+    """同じ商品のリンクをまとめるためのキー(URLからASINが分かればASIN)"""
+    match = ASIN_PATH_REGEX.search(urlsplit(url).path)
+    return match.group(1).upper() if match else url
+
+class LinkJob:
+    """1件の処理待ち。mergeでまとめられると複数のメッセージのリンクを持つ"""
+
+    def __init__(self, seq, message, urls, queued_at):
+        self.seq = seq
+        self.channel = message.channel
+        self.messages = [message]
+        self.urls = OrderedDict((link_key(url), url) for url in urls)
+        self.queued_at = queued_at
+
+    def merge(self, message, urls, max_links, max_messages):
+        """リンクを追加し、上限を超えて追加できなかったリンクの数を返す
+
+        メッセージが上限に達しているとき、またはリンクが1つも処理されないとき(すべて上限超え)は
+        何も追加せずに None を返す。処理されないメッセージの埋め込みを抑制しないため。
+        """
+        if len(self.messages) >= max_messages:
+            return None
+        keys = [link_key(url) for url in urls]
+        free = max_links - len(self.urls)
+        new_keys = list(OrderedDict.fromkeys(key for key in keys if key not in self.urls))
+        if len(new_keys) == len(set(keys)) and free <= 0:
+            return None
+        self.messages.append(message)
+        for key, url in zip(keys, urls):
+            if key in self.urls or free <= 0:
+                continue
+            self.urls[key] = url
+            free -= 1
+        return sum(1 for key in new_keys if key not in self.urls)
+
+class GuildQueue:
+    """1つのサーバーの、チャンネルごとの処理待ち"""
+
+    def __init__(self):
+        self.channels = OrderedDict()
+        self.size = 0
+
+    def drop_oldest(self, channel_id=None):
+        """指定したチャンネル(省略時はサーバー全体)で一番古い待ちを捨てる"""
+        if channel_id is None:
+            channel_id = min((c for c, jobs in self.channels.items() if jobs),
+                             key=lambda c: self.channels[c][0].seq)
+        jobs = self.channels[channel_id]
+        jobs.popleft()
+        self.size -= 1
+        if not jobs:
+            del self.channels[channel_id]
+
+    def pop(self, active_channels):
+        """処理中でないチャンネルから、順番に1件取り出す"""
+        for _ in range(len(self.channels)):
+            channel_id, jobs = next(iter(self.channels.items()))
+            self.channels.move_to_end(channel_id)
+            if channel_id in active_channels:
+                continue
+            job = jobs.popleft()
+            if not jobs:
+                del self.channels[channel_id]
+            self.size -= 1
+            return channel_id, job
+        return None, None
+
+class MessageDispatcher:
+    """on_message と商品の取得処理の間に入る、件数上限つきのキュー
+
+    サーバーごと・チャンネルごとに待ちの件数を制限し、サーバー間は順番(ラウンドロビン)に、
+    同じサーバーの中ではチャンネルを順番に取り出す。1つのチャンネルの処理は1件ずつ行うので、
+    埋め込みはリンクが貼られた順に並ぶ。リンクが大量に貼られたサーバーがあっても、
+    ほかのサーバーの待ち時間はそのサーバーの件数に左右されない。
+    """
+
+    OVERFLOW_POLICIES = ("drop_oldest", "merge", "busy")
+
+    def __init__(self, handler, workers, guild_limit, channel_limit, overflow,
+                 max_links=DISPATCH_MAX_LINKS, max_messages=DISPATCH_MAX_MESSAGES):
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"DISPATCH_OVERFLOW は {', '.join(self.OVERFLOW_POLICIES)} のいずれかです: {overflow}")
+        self.handler = handler
+        self.workers = workers
+        self.guild_limit = guild_limit
+        self.channel_limit = channel_limit
+        self.overflow = overflow
+        self.max_links = max_links
+        self.max_messages = max_messages
+
+        self.guilds = OrderedDict()
+        self.active_channels = set()
+        # Python 3.9 の asyncio.Event は作成時のイベントループに結び付くので、start() で作る
+        self.wakeup = None
+        self.tasks = []
+        self.seq = 0
+
+        self.size = 0
+        self.submitted = 0
+        self.processed = 0
+        self.dropped = 0
+        self.merged = 0
+        self.skipped_links = 0
+        self.rejected = 0
+        self.waits = deque(maxlen=1024)
+
+    def submit(self, message, urls):
+        """リンクを処理待ちに入れる。busy で受け付けなかったときは False を返す"""
+        loop = asyncio.get_running_loop()
+        guild_id = message.guild.id if message.guild else None
+        channel_id = message.channel.id
+        self.submitted += 1
+
+        guild = self.guilds.get(guild_id)
+        if guild is None:
+            guild = self.guilds[guild_id] = GuildQueue()
+        jobs = guild.channels.get(channel_id)
+        if jobs is None:
+            jobs = guild.channels[channel_id] = deque()
+
+        if len(jobs) >= self.channel_limit or guild.size >= self.guild_limit:
+            skipped = None
+            if self.overflow == "merge" and jobs:
+                skipped = jobs[-1].merge(message, urls, self.max_links, self.max_messages)
+            if skipped is not None:
+                self.skipped_links += skipped
+                self.merged += 1
+                return True
+            if self.overflow == "drop_oldest":
+                guild.drop_oldest(channel_id if len(jobs) >= self.channel_limit else None)
+                # 捨てたことでこのチャンネルの待ちが空になった場合は登録し直す
+                guild.channels.setdefault(channel_id, jobs)
+                self.size -= 1
+                self.dropped += 1
+            else:
+                if not jobs:
+                    del guild.channels[channel_id]
+                self.rejected += 1
+                return False
+
+        self.seq += 1
+        jobs.append(LinkJob(self.seq, message, urls, loop.time()))
+        guild.size += 1
+        self.size += 1
+        if self.wakeup is not None:
+            self.wakeup.set()
+        return True
+
+    def stats(self):
+        """キューの深さと件数を dict で返す"""
+        waits = sorted(self.waits)
+        return {
+            "queued": self.size,
+            "running": len(self.active_channels),
+            "guilds": len(self.guilds),
+            "max_guild_depth": max((guild.size for guild in self.guilds.values()), default=0),
+            "submitted": self.submitted,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "merged": self.merged,
+            "skipped_links": self.skipped_links,
+            "rejected": self.rejected,
+            "wait_p99": waits[int(len(waits) * 0.99)] if waits else 0.0,
+        }
+
+    def depths(self):
+        """サーバーごとの待ち件数"""
+        return {guild_id: guild.size for guild_id, guild in self.guilds.items()}
+
+    def start(self):
+        self.wakeup = asyncio.Event()
+        for _ in range(self.workers):
+            self.tasks.append(asyncio.create_task(self._worker()))
+
+    async def close(self):
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+    def _next(self):
+        for _ in range(len(self.guilds)):
+            guild_id, guild = next(iter(self.guilds.items()))
+            self.guilds.move_to_end(guild_id)
+            if not guild.channels:
+                del self.guilds[guild_id]
+                continue
+            channel_id, job = guild.pop(self.active_channels)
+            if job is not None:
+                self.size -= 1
+                return channel_id, job
+        return None, None
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            channel_id, job = self._next()
+            if job is None:
+                self.wakeup.clear()
+                await self.wakeup.wait()
+                continue
+            self.active_channels.add(channel_id)
+            self.waits.append(loop.time() - job.queued_at)
+            try:
+                await self.handler(job)
+            except Exception as e:
+                print(f"リンク処理エラー: {e}")
+            finally:
+                self.active_channels.discard(channel_id)
+                self.processed += 1
+                # このチャンネルの次の待ちを取り出せるようになった
+                self.wakeup.set()
+
+warm_task = None
+
 intents = discord.Intents.default()
 intents.message_content = True
 client = discord.Client(intents=intents)
 
+@client.event
+async def setup_hook():
+    start_amazon_api()
+    dispatcher.start()
+    # タスクへの参照を持っておかないと、実行中にガベージコレクションされることがある
+    global warm_task
+    warm_task = asyncio.create_task(warm_product_cache())
+
 @client.event
 async def on_ready():
     print(f'Botがログインしました: {client.user}')
@@ -139,77 +775,386 @@ async def on_message(message):
     if not urls:
         return
 
-    checking_message = None
+    # 処理はディスパッチャーのワーカーが順番に行う
+    if not dispatcher.submit(message, urls):
+        output_stats.message()
+        output_stats.call("send")
+        await message.channel.send(BUSY_MESSAGE)
+
+# 1つのメッセージに載せられる埋め込みの上限(Discordの制限)
+MAX_EMBEDS_PER_MESSAGE = 10
+
+class OutputStats:
+    """処理したメッセージ数と、そのために使ったDiscordのREST呼び出し数(種類ごと)"""
+
+    def __init__(self, registry):
+        self.messages = registry.counter(
+            "amazonbot_messages_handled_total", "Discord messages with Amazon links handled.")
+        self.calls = registry.counter(
+            "amazonbot_discord_rest_calls_total", "Discord REST calls made to answer messages.", ("kind",))
+
+    def message(self, count=1):
+        self.messages.inc(amount=count)
+
+    def call(self, kind, count=1):
+        self.calls.inc((kind,), count)
+
+    def stats(self):
+        messages = self.messages.value()
+        rest_calls = sum(value for _, _, value in self.calls.samples())
+        return {
+            "messages": messages,
+            "rest_calls": rest_calls,
+            "calls_per_message": rest_calls / messages if messages else 0.0,
+        }
+
+output_stats = OutputStats(metrics.REGISTRY)
+
+class RateLimitCounter(logging.Handler):
+    """discord.py が 429 を受けたときに出す警告を数える(429 は discord.py の中で再試行される)
+
+    discord.py は 429 のたびに "We are being rate limited" を出し、グローバルな制限のときは
+    続けて "Global rate limit has been hit" も出す。429 は前者で1回だけ数え、後者はその内訳として別に数える。
+    """
+
+    def __init__(self, registry):
+        super().__init__(logging.WARNING)
+        self.counter = registry.counter(
+            "amazonbot_discord_rate_limited_total", "Discord 429 responses reported by discord.py.")
+        self.global_counter = registry.counter(
+            "amazonbot_discord_global_rate_limited_total",
+            "Discord 429 responses caused by the global rate limit (included in amazonbot_discord_rate_limited_total).")
+
+    def emit(self, record):
+        if not isinstance(record.msg, str):
+            return
+        if record.msg.startswith("We are being rate limited"):
+            self.counter.inc()
+        elif record.msg.startswith("Global rate limit has been hit"):
+            self.global_counter.inc()
+
+logging.getLogger("discord.http").addHandler(RateLimitCounter(metrics.REGISTRY))
+
+# 入力中インジケーターを送り直す間隔(discord.py の typing() と同じ)
+TYPING_INTERVAL = 5
+
+@contextlib.asynccontextmanager
+async def typing_indicator(channel):
+    """入力中インジケーターを表示する
+
+    discord.py の typing() と同じく TYPING_INTERVAL 秒ごとに送り直すが、REST呼び出しの回数を
+    正しく数えるため、送るたびに output_stats に記録する。
+    """
+    async def keep_typing():
+        try:
+            while True:
+                await asyncio.sleep(TYPING_INTERVAL)
+                output_stats.call("typing")
+                await channel.typing()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            pass
+
+    output_stats.call("typing")
+    await channel.typing()
+    task = asyncio.create_task(keep_typing())
     try:
-        checking_message = await message.channel.send("リンクを確認中です...🔍")
+        yield
+    finally:
+        task.cancel()
 
-        for url in urls:
-            asin = extract_asin(url)
-            if not asin:
-                await message.channel.send("ASINが取得できませんでした。❌")
-                continue
+def asin_error_line(url):
+    """ASINが分からなかったリンクのエラーの文言(どのリンクか分かるよう、埋め込みを出さない形でURLを添える)"""
+    return f"<{url}>: ASINが取得できませんでした。❌"
 
-            (title, strike_price, current_price, 
-             discount_percentage, discount_amount, 
-             is_time_sale, image_url, features, has_offer) = fetch_amazon_data(asin)
+async def send_results(channel, lines, embeds):
+    """エラーの文言と埋め込みを、10個ずつまとめたメッセージで投稿し、埋め込みを載せたメッセージを返す"""
+    content = "\n".join(lines) or None
+    messages = []
+    for start in range(0, len(embeds), MAX_EMBEDS_PER_MESSAGE):
+        output_stats.call("send")
+        messages.append(await channel.send(content=content, embeds=embeds[start:start + MAX_EMBEDS_PER_MESSAGE]))
+        content = None
+    if content:
+        output_stats.call("send")
+        await channel.send(content)
+    return messages
 
-            if not (title and has_offer and current_price):
-                await message.channel.send("商品情報を取得できませんでした。リンクが正しいか確認してください。")
-                continue
+async def process_links(job):
+    """1件の処理待ちのリンクを商品の埋め込みにして投稿する
 
-            affiliate_url = f"https://www.amazon.co.jp/dp/{asin}/?tag={AMAZON_ASSOCIATE_TAG}"
-
-            # 現在のUTC→JST
-            now_utc = datetime.utcnow()
-            jst = now_utc + timedelta(hours=9)
-            time_str = jst.strftime("%Y/%m/%d %H:%M")
-
-            # 価格表示部分
-            price_line = ""
-            # 定価があれば打ち消し線を入れる
-            if strike_price:
-                price_line += f"~~{strike_price}~~ → "
-
-            price_line += current_price
-
-            # 割引率と値引き額
-            if discount_percentage and discount_percentage > 0 and discount_amount:
-                # 「(XX%OFF)」と 「**¥YYY引き**」を表示
-                off_str = f"({discount_percentage}%OFF)"
-                discount_str = f"**¥{int(discount_amount):,}引き**"  # 3桁区切り
-                if is_time_sale:
-                    off_str = f"**{off_str} タイムセール中!**"
-                price_line += f" {off_str} {discount_str}"
-
-            # 時刻
-            price_line += f" （{time_str}時点）"
-
-            desc = f"**価格**: {price_line}\n"
-            if features:
-                bullet_points = "\n".join([f"- {f}" for f in features])
-                desc += f"\n**特徴**:\n{bullet_points}\n"
-
-            embed_color = discord.Color.orange() if is_time_sale else discord.Color.blue()
-            embed = discord.Embed(
-                title=title,
-                url=affiliate_url,
-                description=desc,
-                color=embed_color
-            )
-            embed.set_thumbnail(url=image_url)
+    確認中の表示は入力中インジケーターで行い、埋め込みは10個まで1つのメッセージにまとめる。
+    元のメッセージの埋め込みの抑制は投稿と並行して行う。チャンネルごとのレート制限に
+    かかりにくいよう、リンクN個に対するREST呼び出しは 1 + ceil(N/10) + 元のメッセージ数 になる
+    (取得に5秒以上かかったときは入力中インジケーターの送り直しが加わる)。
+    """
+    lines = []
+    embeds = []
+    output_stats.message(len(job.messages))
+    try:
+        async with typing_indicator(job.channel):
+            posted = set()
+            urls = list(job.urls.values())
+            for url, (asin, product) in zip(urls, await lookup_products(urls)):
+                if not asin:
+                    lines.append(asin_error_line(url))
+                    continue
+                # 短縮URLなど、別のリンクが同じ商品を指していたときは1回だけ投稿する
+                if asin in posted:
+                    continue
+                posted.add(asin)
+
+                if not is_complete(product):
+                    lines.append(f"{asin}: 商品情報を取得できませんでした。リンクが正しいか確認してください。")
+                    continue
+
+                embeds.append(build_embed(asin, product))
+
+        # 元のメッセージの埋め込みを抑制する(まとめられたメッセージすべて)。投稿と同時に行う
+        output_stats.call("suppress", len(job.messages))
+        results = await asyncio.gather(
+            send_results(job.channel, lines, embeds),
+            *(message.edit(suppress=True) for message in job.messages),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"on_messageエラー: {result}")
 
-            await message.channel.send(embed=embed)
+    except Exception as e:
+        print(f"on_messageエラー: {e}")
+
+def progressive_embed(asin, product, final):
+    if product is not None and is_complete(product):
+        return build_embed(asin, product)
+    if final:
+        return build_pending_embed(asin, "商品情報を取得できませんでした。")
+    return build_pending_embed(asin, "価格を取得中です...")
+
+async def edit_progressive(messages, asins, products, changed, final):
+    """changed の商品を含むメッセージの埋め込みを、いまの商品情報で描き直す"""
+    for number, message in enumerate(messages):
+        chunk = range(number * MAX_EMBEDS_PER_MESSAGE, min(len(asins), (number + 1) * MAX_EMBEDS_PER_MESSAGE))
+        if not any(i in changed for i in chunk):
+            continue
+        output_stats.call("edit")
+        try:
+            await message.edit(embeds=[progressive_embed(asins[i], products[i], final) for i in chunk])
+        except Exception as e:
+            print(f"埋め込みの編集エラー: {e}")
+
+async def retry_progressive(messages, asins, products):
+    """価格を取得できなかった商品を間隔をあけて取得し直し、取れたら埋め込みを編集する"""
+    for attempt, delay in enumerate(PROGRESSIVE_RETRY_DELAYS, 1):
+        await asyncio.sleep(delay)
+        pending = [i for i, product in enumerate(products) if not is_complete(product)]
+        refetched = await asyncio.gather(*(fetch_amazon_data(asins[i]) for i in pending))
+        changed = set()
+        for i, product in zip(pending, refetched):
+            if is_complete(product):
+                products[i] = product
+                changed.add(i)
+        final = attempt == len(PROGRESSIVE_RETRY_DELAYS)
+        if final:
+            # 最後まで取れなかった商品は「取得できませんでした」に変える
+            changed.update(i for i in pending if i not in changed)
+        await edit_progressive(messages, asins, products, changed, final)
+        if len(changed) == len(pending):
+            return
+
+# 再取得のタスク(参照を持っておかないとガベージコレクションされることがある)
+retry_tasks = set()
+
+async def process_links_progressive(job):
+    """process_links の段階表示版
+
+    ASINが分かった時点でアフィリエイトリンクだけの埋め込みを投稿し、商品情報が届いたら
+    同じメッセージを編集する。PA-APIが混んでいて取得できなかった商品は、ワーカーを
+    ふさがないよう別のタスクで PROGRESSIVE_RETRY_DELAYS の間隔で取得し直す。
+    """
+    lines = []
+    asins = []
+    output_stats.message(len(job.messages))
+    try:
+        async with typing_indicator(job.channel):
+            urls = list(job.urls.values())
+            for url, asin in zip(urls, await asyncio.gather(*(resolve_asin_async(url) for url in urls))):
+                if not asin:
+                    lines.append(asin_error_line(url))
+                elif asin not in asins:
+                    asins.append(asin)
+
+        # 取得は投稿と並行して始めておく
+        fetches = asyncio.gather(*(fetch_amazon_data(asin) for asin in asins))
+        output_stats.call("suppress", len(job.messages))
+        results = await asyncio.gather(
+            send_results(job.channel, lines, [progressive_embed(asin, None, False) for asin in asins]),
+            *(message.edit(suppress=True) for message in job.messages),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"on_messageエラー: {result}")
+        messages = results[0] if isinstance(results[0], list) else []
 
-            # 元のメッセージの埋め込みを抑制する (ここを追加)
-        await message.edit(suppress=True) #★
+        products = list(await fetches)
+        final = not PROGRESSIVE_RETRY_DELAYS
+        changed = {i for i, product in enumerate(products) if final or is_complete(product)}
+        await edit_progressive(messages, asins, products, changed, final)
+        if not final and not all(is_complete(product) for product in products):
+            task = asyncio.create_task(retry_progressive(messages, asins, products))
+            retry_tasks.add(task)
+            task.add_done_callback(retry_tasks.discard)
 
     except Exception as e:
         print(f"on_messageエラー: {e}")
+
+dispatch_wait_seconds = metrics.REGISTRY.histogram(
+    "amazonbot_dispatch_wait_seconds", "Time a link job waited in the dispatcher queue.")
+job_duration_seconds = metrics.REGISTRY.histogram(
+    "amazonbot_job_duration_seconds", "Time to answer a link job, from lookup to the last Discord call.")
+
+async def handle_job(job):
+    """ディスパッチャーから渡された1件を処理し、待ち時間と処理時間を記録する"""
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    dispatch_wait_seconds.observe(started - job.queued_at)
+    try:
+        await (process_links_progressive if PROGRESSIVE_EMBEDS else process_links)(job)
     finally:
-        if checking_message:
-            await checking_message.delete()
+        job_duration_seconds.observe(loop.time() - started)
+
+dispatcher = MessageDispatcher(
+    handle_job,
+    workers=DISPATCH_WORKERS,
+    guild_limit=DISPATCH_GUILD_QUEUE,
+    channel_limit=DISPATCH_CHANNEL_QUEUE,
+    overflow=DISPATCH_OVERFLOW
+)
+
+# ヘルスチェック用HTTPサーバー(Botと同じイベントループで動かす)
+PORT = int(os.getenv("PORT", "8000"))
+# イベントループの遅れを測る間隔(秒)と、/readyz が準備完了とみなす遅れの上限(秒)
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", "0.5"))
+READY_MAX_LOOP_LAG = float(os.getenv("READY_MAX_LOOP_LAG", "1.0"))
+
+# 直近に測ったイベントループの遅れ(秒)と、その分布
+loop_lag = 0.0
+loop_lag_seconds = metrics.REGISTRY.histogram(
+    "amazonbot_event_loop_lag_seconds", "Event loop lag, sampled every LOOP_LAG_INTERVAL seconds.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0))
+
+async def monitor_loop_lag():
+    """一定間隔で眠り、予定より何秒遅れて起きたかを loop_lag に記録する"""
+    global loop_lag
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(LOOP_LAG_INTERVAL)
+        loop_lag = max(0.0, loop.time() - start - LOOP_LAG_INTERVAL)
+        loop_lag_seconds.observe(loop_lag)
+
+def gateway_connected():
+    return client.is_ready() and not client.is_closed() and math.isfinite(client.latency)
+
+def readiness():
+    """準備できているかと、その判断に使った値を返す"""
+    checks = {
+        "gateway": gateway_connected(),
+        "loop_lag": loop_lag <= READY_MAX_LOOP_LAG,
+        "paapi": paapi_circuit.state != "open",
+    }
+    details = {
+        "checks": checks,
+        "loop_lag_seconds": round(loop_lag, 4),
+        "paapi_circuit": paapi_circuit.state,
+    }
+    return all(checks.values()), details
+
+def collect_bot_metrics():
+    """/metrics を出すたびに、各部品の stats() からメトリクスを作る"""
+    result = metrics.gauges_from_stats(
+        "amazonbot_dispatcher", "Link dispatcher", dispatcher.stats(),
+        counters=("submitted", "processed", "dropped", "merged", "skipped_links", "rejected"),
+        names={"wait_p99": "wait_seconds_p99"})
+    result += metrics.gauges_from_stats(
+        "amazonbot_paapi_circuit", "PA-API circuit breaker",
+        dict(paapi_circuit.stats(), open=paapi_circuit.state == "open"), counters=("rejected",))
+    result += metrics.gauges_from_stats(
+        "amazonbot_gateway", "Discord gateway",
+        {"connected": gateway_connected(),
+         "latency_seconds": client.latency if math.isfinite(client.latency) else -1})
+    result += metrics.gauges_from_stats(
+        "amazonbot_event_loop", "Event loop", {"last_lag_seconds": loop_lag})
+    result += metrics.gauges_from_stats(
+        "amazonbot_discord", "Discord output", {"calls_per_message": output_stats.stats()["calls_per_message"]})
+    if item_batcher is not None:
+        result += metrics.gauges_from_stats(
+            "amazonbot_getitems_batcher", "GetItems batcher", item_batcher.stats(),
+            counters=("batches", "items_requested", "items_coalesced"))
+    if product_store is not None:
+        result += metrics.gauges_from_stats(
+            "amazonbot_product_store", "Persistent product cache", product_store.stats(),
+            counters=("reads", "hits", "evictions"))
+    return result
+
+metrics.REGISTRY.add_collector(collect_bot_metrics)
 
-if TOKEN:
-    client.run(TOKEN)
-else:
-    print("TOKENが設定されていません。BOTは起動せず、Flaskサーバーのみ稼働します。")
+async def handle_root(request):
+    return web.Response(text="OK")
+
+async def handle_healthz(request):
+    # イベントループが応答できていれば生きている
+    return web.Response(text="OK")
+
+async def handle_readyz(request):
+    ready, details = readiness()
+    return web.json_response(dict(details, ready=ready), status=200 if ready else 503)
+
+async def handle_metrics(request):
+    return web.Response(text=metrics.REGISTRY.render(),
+                        headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"})
+
+async def start_http_server():
+    """ヘルスチェック用HTTPサーバーを起動し、終了時に cleanup() する AppRunner を返す"""
+    app = web.Application()
+    app.router.add_get("/", handle_root)
+    app.router.add_get("/healthz", handle_healthz)
+    app.router.add_get("/readyz", handle_readyz)
+    app.router.add_get("/metrics", handle_metrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "0.0.0.0", PORT).start()
+    return runner
+
+async def main():
+    runner = await start_http_server()
+    lag_task = asyncio.create_task(monitor_loop_lag())
+    try:
+        if not TOKEN:
+            print("TOKENが設定されていません。BOTは起動せず、HTTPサーバーのみ稼働します。")
+            await asyncio.Event().wait()
+        async with client:
+            try:
+                await client.start(TOKEN)
+            finally:
+                await dispatcher.close()
+                # 起動時の取得と段階表示の再取得を止めてから、PA-APIの接続を閉じる
+                await cancel_tasks([warm_task, *retry_tasks])
+                # PA-APIの接続はイベントループが動いているうちに閉じる
+                await shutdown_amazon_api()
+    finally:
+        lag_task.cancel()
+        await runner.cleanup()
+
+if __name__ == "__main__":
+    if TOKEN:
+        discord.utils.setup_logging()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shortlink_cache.save()
+        lookup_executor.shutdown(wait=False)
@@ -36,93 +36,20 @@ from paapi5_python_sdk.api.default_api import DefaultApi
 # import ApiClient
 from paapi5_python_sdk.api_client import ApiClient
 from paapi5_python_sdk.configuration import Configuration
-# import models into sdk package
-from paapi5_python_sdk.models.availability import Availability
-from paapi5_python_sdk.models.browse_node import BrowseNode
-from paapi5_python_sdk.models.browse_node_ancestor import BrowseNodeAncestor
-from paapi5_python_sdk.models.browse_node_child import BrowseNodeChild
-from paapi5_python_sdk.models.browse_node_info import BrowseNodeInfo
-from paapi5_python_sdk.models.browse_nodes_result import BrowseNodesResult
-from paapi5_python_sdk.models.by_line_info import ByLineInfo
-from paapi5_python_sdk.models.classifications import Classifications
-from paapi5_python_sdk.models.condition import Condition
-from paapi5_python_sdk.models.content_info import ContentInfo
-from paapi5_python_sdk.models.content_rating import ContentRating
-from paapi5_python_sdk.models.contributor import Contributor
-from paapi5_python_sdk.models.customer_reviews import CustomerReviews
-from paapi5_python_sdk.models.delivery_flag import DeliveryFlag
-from paapi5_python_sdk.models.dimension_based_attribute import DimensionBasedAttribute
-from paapi5_python_sdk.models.duration_price import DurationPrice
-from paapi5_python_sdk.models.error_data import ErrorData
-from paapi5_python_sdk.models.external_ids import ExternalIds
-from paapi5_python_sdk.models.get_browse_nodes_request import GetBrowseNodesRequest
-from paapi5_python_sdk.models.get_browse_nodes_resource import GetBrowseNodesResource
-from paapi5_python_sdk.models.get_browse_nodes_response import GetBrowseNodesResponse
-from paapi5_python_sdk.models.get_items_request import GetItemsRequest
-from paapi5_python_sdk.models.get_items_resource import GetItemsResource
-from paapi5_python_sdk.models.get_items_response import GetItemsResponse
-from paapi5_python_sdk.models.get_variations_request import GetVariationsRequest
-from paapi5_python_sdk.models.get_variations_resource import GetVariationsResource
-from paapi5_python_sdk.models.get_variations_response import GetVariationsResponse
-from paapi5_python_sdk.models.image_size import ImageSize
-from paapi5_python_sdk.models.image_type import ImageType
-from paapi5_python_sdk.models.images import Images
-from paapi5_python_sdk.models.item import Item
-from paapi5_python_sdk.models.item_id_type import ItemIdType
-from paapi5_python_sdk.models.item_info import ItemInfo
-from paapi5_python_sdk.models.items_result import ItemsResult
-from paapi5_python_sdk.models.language_type import LanguageType
-from paapi5_python_sdk.models.languages import Languages
-from paapi5_python_sdk.models.manufacture_info import ManufactureInfo
-from paapi5_python_sdk.models.max_price import MaxPrice
-from paapi5_python_sdk.models.merchant import Merchant
-from paapi5_python_sdk.models.min_price import MinPrice
-from paapi5_python_sdk.models.min_reviews_rating import MinReviewsRating
-from paapi5_python_sdk.models.min_saving_percent import MinSavingPercent
-from paapi5_python_sdk.models.multi_valued_attribute import MultiValuedAttribute
-from paapi5_python_sdk.models.offer_availability import OfferAvailability
-from paapi5_python_sdk.models.offer_condition import OfferCondition
-from paapi5_python_sdk.models.offer_condition_note import OfferConditionNote
-from paapi5_python_sdk.models.offer_count import OfferCount
-from paapi5_python_sdk.models.offer_delivery_info import OfferDeliveryInfo
-from paapi5_python_sdk.models.offer_listing import OfferListing
-from paapi5_python_sdk.models.offer_loyalty_points import OfferLoyaltyPoints
-from paapi5_python_sdk.models.offer_merchant_info import OfferMerchantInfo
-from paapi5_python_sdk.models.offer_price import OfferPrice
-from paapi5_python_sdk.models.offer_program_eligibility import OfferProgramEligibility
-from paapi5_python_sdk.models.offer_promotion import OfferPromotion
-from paapi5_python_sdk.models.offer_savings import OfferSavings
-from paapi5_python_sdk.models.offer_shipping_charge import OfferShippingCharge
-from paapi5_python_sdk.models.offer_sub_condition import OfferSubCondition
-from paapi5_python_sdk.models.offer_summary import OfferSummary
-from paapi5_python_sdk.models.offers import Offers
-from paapi5_python_sdk.models.partner_type import PartnerType
-from paapi5_python_sdk.models.price import Price
-from paapi5_python_sdk.models.price_type import PriceType
-from paapi5_python_sdk.models.product_advertising_api_client_exception import ProductAdvertisingAPIClientException
-from paapi5_python_sdk.models.product_advertising_api_service_exception import ProductAdvertisingAPIServiceException
-from paapi5_python_sdk.models.product_info import ProductInfo
-from paapi5_python_sdk.models.properties import Properties
-from paapi5_python_sdk.models.rating import Rating
-from paapi5_python_sdk.models.refinement import Refinement
-from paapi5_python_sdk.models.refinement_bin import RefinementBin
-from paapi5_python_sdk.models.rental_offer_listing import RentalOfferListing
-from paapi5_python_sdk.models.rental_offers import RentalOffers
-from paapi5_python_sdk.models.search_items_request import SearchItemsRequest
-from paapi5_python_sdk.models.search_items_resource import SearchItemsResource
-from paapi5_python_sdk.models.search_items_response import SearchItemsResponse
-from paapi5_python_sdk.models.search_refinements import SearchRefinements
-from paapi5_python_sdk.models.search_result import SearchResult
-from paapi5_python_sdk.models.single_boolean_valued_attribute import SingleBooleanValuedAttribute
-from paapi5_python_sdk.models.single_integer_valued_attribute import SingleIntegerValuedAttribute
-from paapi5_python_sdk.models.single_string_valued_attribute import SingleStringValuedAttribute
-from paapi5_python_sdk.models.sort_by import SortBy
-from paapi5_python_sdk.models.technical_info import TechnicalInfo
-from paapi5_python_sdk.models.trade_in_info import TradeInInfo
-from paapi5_python_sdk.models.trade_in_price import TradeInPrice
-from paapi5_python_sdk.models.unit_based_attribute import UnitBasedAttribute
-from paapi5_python_sdk.models.variation_attribute import VariationAttribute
-from paapi5_python_sdk.models.variation_dimension import VariationDimension
-from paapi5_python_sdk.models.variation_summary import VariationSummary
-from paapi5_python_sdk.models.variations_result import VariationsResult
-from paapi5_python_sdk.models.website_sales_rank import WebsiteSalesRank
+# import models into sdk package on first use (see paapi5_python_sdk.models)
+from paapi5_python_sdk import models as _models
+
+__all__ = ['AWSV4Auth', 'ApiClient', 'Configuration', 'DefaultApi'] + _models.__all__
+
+
+def __getattr__(name):
+    if name in _models.__all__:
+        value = getattr(_models, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(
+        "module {0!r} has no attribute {1!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_models.__all__))
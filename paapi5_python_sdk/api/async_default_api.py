@@ -0,0 +1,164 @@
+# coding: utf-8
+
+"""
+  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+  Licensed under the Apache License, Version 2.0 (the "License").
+  You may not use this file except in compliance with the License.
+  A copy of the License is located at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+  or in the "license" file accompanying this file. This file is distributed
+  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+  express or implied. See the License for the specific language governing
+  permissions and limitations under the License.
+"""
+
+"""
+    ProductAdvertisingAPI
+
+    https://webservices.amazon.com/paapi5/documentation/index.html  # noqa: E501
+"""
+
+import asyncio
+
+from paapi5_python_sdk.api.default_api import (
+    DefaultApi, GET_VARIATIONS_PAGING, SEARCH_ITEMS_PAGING)
+from paapi5_python_sdk.async_api_client import AsyncApiClient
+
+
+class AsyncDefaultApi(DefaultApi):
+    """asyncio version of DefaultApi.
+
+    Every operation is a coroutine:
+
+    >>> api = AsyncDefaultApi(access_key, secret_key, host, region)
+    >>> response = await api.get_items(get_items_request)
+
+    Parameter validation is inherited from DefaultApi; requests are sent by
+    an AsyncApiClient. `async_req` is not supported.
+    """
+
+    def __init__(self,
+                 access_key=None,
+                 secret_key=None,
+                 host=None,
+                 region=None,
+                 api_client=None):
+        if not host:
+            host = "webservices.amazon.com"
+        if not region:
+            region = "us-east-1"
+        if api_client is None:
+            api_client = AsyncApiClient(access_key=access_key,
+                                        secret_key=secret_key,
+                                        host=host,
+                                        region=region)
+        super(AsyncDefaultApi, self).__init__(api_client=api_client)
+
+    async def close(self):
+        """Closes the underlying AsyncApiClient."""
+        await self.api_client.close()
+
+    async def get_browse_nodes(self, get_browse_nodes_request, **kwargs):  # noqa: E501
+        """get_browse_nodes  # noqa: E501
+
+        :param GetBrowseNodesRequest get_browse_nodes_request: GetBrowseNodesRequest (required)
+        :return: GetBrowseNodesResponse
+        """
+        return await DefaultApi.get_browse_nodes(self, get_browse_nodes_request, **kwargs)  # noqa: E501
+
+    async def get_items(self, get_items_request, **kwargs):  # noqa: E501
+        """get_items  # noqa: E501
+
+        If the api client has an item_cache, the call is served from it and
+        only uncached items are requested.
+
+        :param GetItemsRequest get_items_request: GetItemsRequest (required)
+        :return: GetItemsResponse
+        """
+        if (self.api_client.item_cache is not None and
+                kwargs.get('_preload_content', True)):
+            return await self.api_client.item_cache.get_items_async(self, get_items_request, **kwargs)  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return await self.get_items_with_http_info(get_items_request, **kwargs)  # noqa: E501
+
+    async def get_variations(self, get_variations_request, **kwargs):  # noqa: E501
+        """get_variations  # noqa: E501
+
+        :param GetVariationsRequest get_variations_request: GetVariationsRequest (required)
+        :return: GetVariationsResponse
+        """
+        return await DefaultApi.get_variations(self, get_variations_request, **kwargs)  # noqa: E501
+
+    async def search_items(self, search_items_request, **kwargs):  # noqa: E501
+        """search_items  # noqa: E501
+
+        :param SearchItemsRequest search_items_request: SearchItemsRequest (required)
+        :return: SearchItemsResponse
+        """
+        return await DefaultApi.search_items(self, search_items_request, **kwargs)  # noqa: E501
+
+    async def iter_search_items(self, search_items_request, max_pages=None, prefetch=False, **kwargs):  # noqa: E501
+        """Async generator over the Items of every SearchItems result page.
+
+        Each page is requested when the items of the previous one have been
+        consumed; requests wait on the rate limiter like any other call.
+        With `prefetch`, the next page is fetched in a task while the items
+        of the current one are consumed. `aclose()` (or
+        `contextlib.aclosing`) cancels that task, but a request it already
+        sent still counts against the quota.
+
+        >>> async for item in api.iter_search_items(search_items_request):
+        ...     print(item.asin)
+
+        :param SearchItemsRequest search_items_request: SearchItemsRequest (required)
+        :param int max_pages: Maximum number of pages to request.
+        :param bool prefetch: Fetch the next page in the background.
+        :return: async iterator of Item
+        """
+        async for item in self._iter_pages(self.search_items,
+                                           search_items_request,
+                                           SEARCH_ITEMS_PAGING, max_pages,
+                                           prefetch, kwargs):
+            yield item
+
+    async def iter_variations(self, get_variations_request, max_pages=None, prefetch=False, **kwargs):  # noqa: E501
+        """Async generator over the Items of every GetVariations result page.
+
+        :param GetVariationsRequest get_variations_request: GetVariationsRequest (required)
+        :param int max_pages: Maximum number of pages to request.
+        :param bool prefetch: Fetch the next page in the background.
+        :return: async iterator of Item
+        """
+        async for item in self._iter_pages(self.get_variations,
+                                           get_variations_request,
+                                           GET_VARIATIONS_PAGING, max_pages,
+                                           prefetch, kwargs):
+            yield item
+
+    async def _iter_pages(self, operation, request, paging, max_pages,
+                          prefetch, kwargs):
+        pages = paging.pages(request, max_pages)
+        page = next(pages)
+        pending = None
+        if prefetch:
+            pending = asyncio.ensure_future(operation(page, **kwargs))
+        try:
+            while page is not None:
+                if pending is not None:
+                    response = await pending
+                    pending = None
+                else:
+                    response = await operation(page, **kwargs)
+                items = paging.items(response)
+                page = pages.send(response)
+                if page is not None and prefetch:
+                    pending = asyncio.ensure_future(operation(page, **kwargs))
+                for item in items:
+                    yield item
+        finally:
+            if pending is not None:
+                pending.cancel()
+            pages.close()
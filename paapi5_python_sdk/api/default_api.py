@@ -26,6 +26,7 @@ from __future__ import absolute_import
 """
 
 
+import copy
 import re  # noqa: F401
 
 # python 2 and python 3 compatibility library
@@ -99,6 +100,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_priority')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -149,6 +151,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _priority=params.get('_priority'),
             collection_formats=collection_formats)
 
     def get_items(self, get_items_request, **kwargs):  # noqa: E501
@@ -159,6 +162,9 @@ class DefaultApi(object):
         >>> thread = api.get_items(get_items_request, async_req=True)
         >>> result = thread.get()
 
+        If the api client has an item_cache, synchronous calls are served
+        from it and only uncached items are requested.
+
         :param async_req bool
         :param GetItemsRequest get_items_request: GetItemsRequest (required)
         :return: GetItemsResponse
@@ -168,6 +174,9 @@ class DefaultApi(object):
         kwargs['_return_http_data_only'] = True
         if kwargs.get('async_req'):
             return self.get_items_with_http_info(get_items_request, **kwargs)  # noqa: E501
+        elif (self.api_client.item_cache is not None and
+                kwargs.get('_preload_content', True)):
+            return self.api_client.item_cache.get_items(self, get_items_request, **kwargs)  # noqa: E501
         else:
             (data) = self.get_items_with_http_info(get_items_request, **kwargs)  # noqa: E501
             return data
@@ -192,6 +201,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_priority')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -242,6 +252,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _priority=params.get('_priority'),
             collection_formats=collection_formats)
 
     def get_variations(self, get_variations_request, **kwargs):  # noqa: E501
@@ -285,6 +296,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_priority')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -335,6 +347,7 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _priority=params.get('_priority'),
             collection_formats=collection_formats)
 
     def search_items(self, search_items_request, **kwargs):  # noqa: E501
@@ -378,6 +391,7 @@ class DefaultApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_priority')
 
         params = locals()
         for key, val in six.iteritems(params['kwargs']):
@@ -428,4 +442,137 @@ class DefaultApi(object):
             _return_http_data_only=params.get('_return_http_data_only'),
             _preload_content=params.get('_preload_content', True),
             _request_timeout=params.get('_request_timeout'),
+            _priority=params.get('_priority'),
             collection_formats=collection_formats)
+
+    def iter_search_items(self, search_items_request, max_pages=None, prefetch=False, **kwargs):  # noqa: E501
+        """Iterates over the Items of every SearchItems result page.
+
+        Pages are requested in order starting at `item_page` (1 by default),
+        each one when the items of the previous page have been consumed.
+        Every request waits on the api client's rate limiter like any other
+        call (pass `_priority` to queue them as background work). Iteration
+        stops after the last page, and closing the iterator early stops
+        requesting further pages.
+
+        With `prefetch`, the next page is fetched with async_req while the
+        items of the current one are consumed. This hides the latency of
+        each page, but a prefetched request cannot be cancelled: stopping
+        early still spends that request and its rate limiter token.
+
+        >>> for item in api.iter_search_items(search_items_request):
+        ...     print(item.asin)
+
+        :param SearchItemsRequest search_items_request: SearchItemsRequest (required)
+        :param int max_pages: Maximum number of pages to request.
+        :param bool prefetch: Fetch the next page in the background.
+        :return: iterator of Item
+        """
+        return self._iter_pages(self.search_items, search_items_request,
+                                SEARCH_ITEMS_PAGING, max_pages, prefetch,
+                                kwargs)
+
+    def iter_variations(self, get_variations_request, max_pages=None, prefetch=False, **kwargs):  # noqa: E501
+        """Iterates over the Items of every GetVariations result page.
+
+        Works like `iter_search_items`, paging with `variation_page`.
+
+        :param GetVariationsRequest get_variations_request: GetVariationsRequest (required)
+        :param int max_pages: Maximum number of pages to request.
+        :param bool prefetch: Fetch the next page in the background.
+        :return: iterator of Item
+        """
+        return self._iter_pages(self.get_variations, get_variations_request,
+                                GET_VARIATIONS_PAGING, max_pages, prefetch,
+                                kwargs)
+
+    def _iter_pages(self, operation, request, paging, max_pages, prefetch,
+                    kwargs):
+        kwargs.pop('async_req', None)
+        pages = paging.pages(request, max_pages)
+        page = next(pages)
+        pending = None
+        if prefetch:
+            pending = operation(page, async_req=True, **kwargs)
+        try:
+            while page is not None:
+                if pending is not None:
+                    response = pending.get()
+                    pending = None
+                else:
+                    response = operation(page, **kwargs)
+                items = paging.items(response)
+                page = pages.send(response)
+                if page is not None and prefetch:
+                    pending = operation(page, async_req=True, **kwargs)
+                for item in items:
+                    yield item
+        finally:
+            # a prefetched page still in flight is dropped
+            pages.close()
+
+
+class Paging(object):
+    """Describes how an operation pages through its results.
+
+    :param page_attr: Request attribute holding the page number.
+    :param result_attr: Response attribute holding the result with `items`.
+    :param last_page: Function (request, result) returning the number of the
+        last page, or None when unknown.
+    :param max_page: Highest page number PA-API serves, or None.
+    """
+
+    def __init__(self, page_attr, result_attr, last_page, max_page=None):
+        self.page_attr = page_attr
+        self.result_attr = result_attr
+        self.last_page = last_page
+        self.max_page = max_page
+
+    def items(self, response):
+        """Returns the Items of a page response (an empty list at the end)."""
+        result = getattr(response, self.result_attr)
+        return (result.items if result is not None else None) or []
+
+    def pages(self, request, max_pages=None):
+        """Generates the request of each page.
+
+        Yields the first page request, then expects each page's response to
+        be sent in and answers with the next page request, or None when the
+        response was the last page.
+        """
+        page = getattr(request, self.page_attr) or 1
+        fetched = 0
+        while True:
+            page_request = copy.copy(request)
+            setattr(page_request, self.page_attr, page)
+            fetched += 1
+            response = yield page_request
+            result = getattr(response, self.result_attr)
+            if not self.items(response):
+                break
+            last_page = self.last_page(request, result)
+            if self.max_page is not None:
+                last_page = min(last_page or self.max_page, self.max_page)
+            if ((last_page is not None and page >= last_page) or
+                    (max_pages is not None and fetched >= max_pages)):
+                break
+            page += 1
+        yield None
+
+
+def _search_items_last_page(request, result):
+    if result.total_result_count is None:
+        return None
+    per_page = request.item_count or 10
+    return -(-result.total_result_count // per_page)
+
+
+def _get_variations_last_page(request, result):
+    summary = result.variation_summary
+    return summary.page_count if summary is not None else None
+
+
+SEARCH_ITEMS_PAGING = Paging('item_page', 'search_result',
+                             _search_items_last_page, max_page=10)
+GET_VARIATIONS_PAGING = Paging('variation_page', 'variations_result',
+                               _get_variations_last_page)
@@ -32,6 +32,8 @@ from multiprocessing.pool import ThreadPool
 import os
 import re
 import tempfile
+import threading
+import time
 
 # python 2 and python 3 compatibility library
 import six
@@ -41,7 +43,9 @@ from paapi5_python_sdk.configuration import Configuration
 import paapi5_python_sdk.models
 from paapi5_python_sdk import rest
 
-from paapi5_python_sdk.auth.sign_helper import AWSV4Auth
+from paapi5_python_sdk.auth.sign_helper import AWSV4Signer
+from paapi5_python_sdk.deserializer import Deserializer
+from paapi5_python_sdk.rate_limiter import PRIORITY_INTERACTIVE
 
 class ApiClient(object):
     """Generic API client for Swagger client library builds.
@@ -61,8 +65,33 @@ class ApiClient(object):
         the API.
     :param cookie: a cookie to include in the header when making calls
         to the API
+    :param pool_threads: The number of threads to use for async requests
+        to the API. The thread pool is only created on the first request
+        made with async_req=True.
+    :param item_cache: Optional ItemCache consulted by `DefaultApi.get_items`.
+    :param rate_limiter: Optional TokenBucketRateLimiter every request waits
+        on before it is signed and sent.
+    :param retry_policy: Optional rest.RetryPolicy used to retry throttled
+        and 5xx responses. Without one, failures are raised immediately.
+    :param lazy_models: If True, response models keep the parsed JSON and
+        build each attribute on first access instead of decoding the whole
+        response up front.
+    :param single_flight: Optional SingleFlight; identical calls in flight
+        at the same time then share one request and one result. A shared
+        call made with `_preload_content=False` returns a response whose
+        body is already read: use its `data`, not `read()` or `stream()`.
+    :param metrics: Optional metrics.ApiMetrics recording calls, HTTP
+        requests, latencies and bytes in the Prometheus format.
+
+    A single instance is safe to share between threads; keeping one for the
+    lifetime of the process reuses the keep-alive connections held by its
+    connection pool. Call `close` (or use it as a context manager) when done.
     """
 
+    # whether responses returned with _preload_content=False are already
+    # read, so coalesced calls can share them as they are
+    SHARE_RAW_RESPONSES = False
+
     PRIMITIVE_TYPES = (float, bool, bytes, six.text_type) + six.integer_types
     NATIVE_TYPES_MAPPING = {
         'int': int,
@@ -83,13 +112,23 @@ class ApiClient(object):
                  configuration=None,
                  header_name=None,
                  header_value=None,
-                 cookie=None):
+                 cookie=None,
+                 pool_threads=None,
+                 item_cache=None,
+                 rate_limiter=None,
+                 retry_policy=None,
+                 lazy_models=False,
+                 single_flight=None,
+                 metrics=None):
         if configuration is None:
             configuration = Configuration()
         self.configuration = configuration
+        self.pool_threads = pool_threads
 
-        self.pool = ThreadPool()
-        self.rest_client = rest.RESTClientObject(configuration)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self.rest_client = rest.RESTClientObject(configuration,
+                                                 metrics=metrics)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -101,10 +140,50 @@ class ApiClient(object):
         self.secret_key = secret_key
         self.host = host
         self.region = region
+        self.item_cache = item_cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.single_flight = single_flight
+        self.metrics = metrics
+        self._signer = None
+        self.deserializer = Deserializer(paapi5_python_sdk.models,
+                                         self.NATIVE_TYPES_MAPPING,
+                                         self.PRIMITIVE_TYPES,
+                                         self.__deserialize_generic,
+                                         lazy=lazy_models)
+        if metrics is not None:
+            metrics.watch(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def __del__(self):
-        self.pool.close()
-        self.pool.join()
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def close(self):
+        """Shuts down the async thread pool and the HTTP connection pool."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+            pool.join()
+        self.rest_client.close()
+        if self.metrics is not None:
+            self.metrics.unwatch(self)
+
+    @property
+    def pool(self):
+        """Thread pool used for async_req calls, created on first use."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPool(self.pool_threads)
+        return self._pool
 
     @property
     def user_agent(self):
@@ -123,8 +202,133 @@ class ApiClient(object):
             query_params=None, header_params=None, body=None, post_params=None,
             files=None, response_type=None, auth_settings=None,
             _return_http_data_only=None, collection_formats=None,
-            _preload_content=True, _request_timeout=None):
-
+            _preload_content=True, _request_timeout=None, _priority=None):
+        if self.metrics is None:
+            return self.__call(resource_path, method, api_name, path_params,
+                               query_params, header_params, body, post_params,
+                               files, response_type, auth_settings,
+                               _return_http_data_only, collection_formats,
+                               _preload_content, _request_timeout, _priority)
+
+        started = time.perf_counter()
+        try:
+            result = self.__call(resource_path, method, api_name, path_params,
+                                 query_params, header_params, body,
+                                 post_params, files, response_type,
+                                 auth_settings, _return_http_data_only,
+                                 collection_formats, _preload_content,
+                                 _request_timeout, _priority)
+        except Exception as e:
+            self.metrics.observe_call(api_name, time.perf_counter() - started,
+                                      e)
+            raise
+        self.metrics.observe_call(api_name, time.perf_counter() - started)
+        return result
+
+    def __call(self, resource_path, method, api_name, path_params,
+               query_params, header_params, body, post_params, files,
+               response_type, auth_settings, _return_http_data_only,
+               collection_formats, _preload_content, _request_timeout,
+               _priority):
+        (resource_path, url, query_params, header_params, post_params,
+         body) = self._prepare_request(resource_path, path_params,
+                                       query_params, header_params, body,
+                                       post_params, files, collection_formats)
+
+        def send():
+            return self.__send(resource_path, method, api_name, url,
+                               query_params, header_params, body, post_params,
+                               response_type, auth_settings,
+                               _return_http_data_only, _preload_content,
+                               _request_timeout, _priority)
+
+        key = self._flight_key(method, api_name, url, query_params,
+                               header_params, body, response_type,
+                               _return_http_data_only, _preload_content)
+        if key is None:
+            return send()
+        if not _preload_content and not self.SHARE_RAW_RESPONSES:
+            # an unread urllib3 response can only be consumed once, so the
+            # shared call reads it and every caller gets the buffered copy
+            return self.single_flight.do(
+                key, lambda: self._buffer_response(send()))
+        return self.single_flight.do(key, send)
+
+    @staticmethod
+    def _buffer_response(result):
+        """Reads the body of a raw call result into a RESTResponse."""
+        response = result[0] if isinstance(result, tuple) else result
+        if isinstance(response, rest.RESTResponse):
+            return result
+        try:
+            data = response.read()
+        finally:
+            response.release_conn()
+        response = rest.RESTResponse(response, data)
+        if isinstance(result, tuple):
+            return (response,) + result[1:]
+        return response
+
+    def __send(self, resource_path, method, api_name, url, query_params,
+               header_params, body, post_params, response_type,
+               auth_settings, _return_http_data_only, _preload_content,
+               _request_timeout, _priority):
+        if self.retry_policy is not None:
+            self.retry_policy.on_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            # wait for a request slot before signing, so the signature stays
+            # fresh; every attempt is signed again with its own timestamp
+            if self.rate_limiter is not None:
+                waited = time.perf_counter()
+                self.rate_limiter.acquire(
+                    PRIORITY_INTERACTIVE if _priority is None else _priority)
+                if self.metrics is not None:
+                    self.metrics.rate_limit_wait_seconds.observe(
+                        time.perf_counter() - waited)
+
+            request_headers = dict(header_params)
+            # auth setting
+            self.update_params_for_auth(request_headers, query_params, auth_settings, api_name, method, body, resource_path)
+
+            # perform request and return response
+            try:
+                response_data = self.request(
+                    method, url, query_params=query_params,
+                    headers=request_headers, post_params=post_params,
+                    body=body, _preload_content=_preload_content,
+                    _request_timeout=_request_timeout)
+                break
+            except rest.ApiException as e:
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+
+        return self._build_result(response_data, response_type,
+                                  _return_http_data_only, _preload_content)
+
+    def _flight_key(self, method, api_name, url, query_params, header_params,
+                    body, response_type, _return_http_data_only,
+                    _preload_content):
+        """Returns the single-flight key of a prepared call, or None if it
+        must not be shared with identical concurrent calls."""
+        if self.single_flight is None:
+            return None
+        return (method, api_name, url, tuple(query_params or ()),
+                tuple(sorted(header_params.items())), body, response_type,
+                bool(_return_http_data_only), bool(_preload_content))
+
+    def _prepare_request(self, resource_path, path_params, query_params,
+                         header_params, body, post_params, files,
+                         collection_formats):
+        """Sanitizes the parameters of a call before it is signed and sent.
+
+        :return: tuple of (resource_path, url, query_params, header_params,
+                 post_params, body). The body is returned as the JSON bytes
+                 that are signed and sent.
+        """
         if self.access_key is None or self.secret_key is None:
             raise ValueError("Missing Credentials (Access Key and SecretKey). Please specify credentials.")
 
@@ -165,23 +369,38 @@ class ApiClient(object):
             post_params = self.parameters_to_tuples(post_params,
                                                     collection_formats)
 
-        # auth setting
-        self.update_params_for_auth(header_params, query_params, auth_settings, api_name, method, body, resource_path)
-
         # body
         if body:
-            body = self.sanitize_for_serialization(body)
+            body = self.serialize_body(body)
 
         # request url
         url = "https://" + self.host + resource_path
 
-        # perform request and return response
-        response_data = self.request(
-            method, url, query_params=query_params, headers=header_params,
-            post_params=post_params, body=body,
-            _preload_content=_preload_content,
-            _request_timeout=_request_timeout)
+        return (resource_path, url, query_params, header_params, post_params,
+                body)
+
+    def serialize_body(self, body):
+        """Serializes a request body to the JSON bytes sent on the wire.
+
+        The same bytes are hashed for the SigV4 signature and passed as is to
+        the REST client, so they are produced exactly once per call.
+
+        :param body: The request model, or bytes already serialized.
+        :return: bytes
+        """
+        if isinstance(body, bytes):
+            return body
+        return json.dumps(self.sanitize_for_serialization(body),
+                          separators=(',', ':')).encode('utf-8')
+
+    def _retry_delay(self, attempt, exception):
+        """Returns the seconds to wait before retrying, or None to raise."""
+        if self.retry_policy is None:
+            return None
+        return self.retry_policy.next_delay(attempt, exception)
 
+    def _build_result(self, response_data, response_type,
+                      _return_http_data_only, _preload_content):
         self.last_response = response_data
 
         return_data = response_data
@@ -254,17 +473,48 @@ class ApiClient(object):
         if response_type == "file":
             return self.__deserialize_file(response)
 
-        # fetch data from response object
+        # fetch data from response object; the raw body is bytes and is
+        # released once parsed, so only the decoded objects stay alive
         try:
             data = json.loads(response.data)
         except ValueError:
             data = response.data
+            if isinstance(data, bytes):
+                data = data.decode('utf8')
+        response.data = None
+
+        return self.__deserialize(data, response_type)
 
+    def deserialize_data(self, data, response_type):
+        """Deserializes already parsed JSON data into an object.
+
+        :param data: dict, list or str.
+        :param response_type: class literal for
+            deserialized object, or string of class name.
+
+        :return: deserialized object.
+        """
         return self.__deserialize(data, response_type)
 
     def __deserialize(self, data, klass):
         """Deserializes dict, list, str into an object.
 
+        Uses the compiled plans of `self.deserializer`, or the generic
+        path when it is set to None.
+
+        :param data: dict, list or str.
+        :param klass: class literal, or string of class name.
+
+        :return: object.
+        """
+        if self.deserializer is not None:
+            return self.deserializer.deserialize(data, klass)
+        return self.__deserialize_generic(data, klass)
+
+    def __deserialize_generic(self, data, klass):
+        """Deserializes dict, list, str into an object, resolving the type
+        on every call.
+
         :param data: dict, list or str.
         :param klass: class literal, or string of class name.
 
@@ -276,12 +526,12 @@ class ApiClient(object):
         if type(klass) == str:
             if klass.startswith('list['):
                 sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
+                return [self.__deserialize_generic(sub_data, sub_kls)
                         for sub_data in data]
 
             if klass.startswith('dict('):
                 sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
+                return {k: self.__deserialize_generic(v, sub_kls)
                         for k, v in six.iteritems(data)}
 
             # convert str to class
@@ -306,7 +556,7 @@ class ApiClient(object):
                  body=None, post_params=None, files=None,
                  response_type=None, auth_settings=None, async_req=None,
                  _return_http_data_only=None, collection_formats=None,
-                 _preload_content=True, _request_timeout=None):
+                 _preload_content=True, _request_timeout=None, _priority=None):
         """Makes the HTTP request (synchronous) and returns deserialized data.
 
         To make an async request, set the async_req parameter.
@@ -336,6 +586,9 @@ class ApiClient(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param _priority: rate limiter queue priority for this request,
+                          lower is served first. Defaults to
+                          PRIORITY_INTERACTIVE.
         :return:
             If async_req parameter is True,
             the request will be called asynchronously.
@@ -349,7 +602,8 @@ class ApiClient(object):
                                    body, post_params, files,
                                    response_type, auth_settings,
                                    _return_http_data_only, collection_formats,
-                                   _preload_content, _request_timeout)
+                                   _preload_content, _request_timeout,
+                                   _priority)
         else:
             thread = self.pool.apply_async(self.__call_api, (resource_path,
                                            method, api_name, path_params, query_params,
@@ -358,7 +612,8 @@ class ApiClient(object):
                                            response_type, auth_settings,
                                            _return_http_data_only,
                                            collection_formats,
-                                           _preload_content, _request_timeout))
+                                           _preload_content, _request_timeout,
+                                           _priority))
         return thread
 
     def request(self, method, url, query_params=None, headers=None,
@@ -515,6 +770,17 @@ class ApiClient(object):
     def get_amz_date(self, utc_timestamp):
         return utc_timestamp.strftime('%Y%m%dT%H%M%SZ')
 
+    def _get_signer(self, service):
+        """Returns the SigV4 signer, rebuilt if the credentials changed."""
+        signer = self._signer
+        if (signer is None or signer.access_key != self.access_key or
+                signer.secret_key != self.secret_key or
+                signer.region != self.region or signer.service != service):
+            signer = self._signer = AWSV4Signer(self.access_key,
+                                                self.secret_key,
+                                                self.region, service)
+        return signer
+
     def update_params_for_auth(self, headers, querys, auth_settings, api_name, method, body, resource_path):
         """Updates header and query params based on authentication setting.
 
@@ -530,17 +796,12 @@ class ApiClient(object):
             headers['Content-Type'] = 'application/json; charset=utf-8'
             headers['host'] = self.host
             headers['x-amz-date'] = self.get_amz_date(utc_timestamp)
-            aws_v4_auth = AWSV4Auth(access_key=self.access_key,
-                                  secret_key=self.secret_key,
-                                  host=self.host,
-                                  region=self.region,
-                                  service=service,
-                                  method_name=method,
-                                  timestamp=utc_timestamp,
-                                  headers=headers,
-                                  payload=self.sanitize_for_serialization(body),
-                                  path=resource_path)
-            auth_headers = aws_v4_auth.get_headers()
+            if body is None:
+                body = b''
+            elif not isinstance(body, bytes):
+                body = self.serialize_body(body)
+            self._get_signer(service).sign(method, resource_path, headers,
+                                           body, utc_timestamp)
 
             return
 
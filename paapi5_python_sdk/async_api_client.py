@@ -0,0 +1,195 @@
+# coding: utf-8
+
+# flake8: noqa
+
+from __future__ import absolute_import
+
+"""
+  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+  Licensed under the Apache License, Version 2.0 (the "License").
+  You may not use this file except in compliance with the License.
+  A copy of the License is located at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+  or in the "license" file accompanying this file. This file is distributed
+  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+  express or implied. See the License for the specific language governing
+  permissions and limitations under the License.
+"""
+
+"""
+    ProductAdvertisingAPI
+
+    https://webservices.amazon.com/paapi5/documentation/index.html  # noqa: E501
+"""
+
+import asyncio
+import time
+
+from paapi5_python_sdk import rest
+from paapi5_python_sdk.api_client import ApiClient
+from paapi5_python_sdk.async_rest import AsyncRESTClientObject
+from paapi5_python_sdk.rate_limiter import PRIORITY_INTERACTIVE
+
+
+class AsyncApiClient(ApiClient):
+    """asyncio API client built on aiohttp.
+
+    `call_api` is a coroutine; everything else (request preparation, AWS
+    SigV4 signing, rate limiting, retries and deserialization) is shared
+    with ApiClient. Use it through AsyncDefaultApi.
+
+    Close it with `await client.close()` or `async with`.
+    """
+
+    # the body of every response is read before it is returned
+    SHARE_RAW_RESPONSES = True
+
+    def __init__(self, *args, **kwargs):
+        super(AsyncApiClient, self).__init__(*args, **kwargs)
+        self.rest_client = AsyncRESTClientObject(self.configuration,
+                                                 metrics=self.metrics)
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with AsyncApiClient")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Closes the aiohttp session and its pooled connections."""
+        await self.rest_client.close()
+        if self.metrics is not None:
+            self.metrics.unwatch(self)
+
+    @property
+    def pool(self):
+        raise TypeError("AsyncApiClient does not support async_req; "
+                        "await the call instead")
+
+    async def call_api(self, resource_path, method, api_name,
+                       path_params=None, query_params=None, header_params=None,
+                       body=None, post_params=None, files=None,
+                       response_type=None, auth_settings=None, async_req=None,
+                       _return_http_data_only=None, collection_formats=None,
+                       _preload_content=True, _request_timeout=None,
+                       _priority=None):
+        """Makes the HTTP request and returns deserialized data.
+
+        Takes the same parameters as ApiClient.call_api, except that
+        async_req is not supported.
+        """
+        if async_req:
+            raise TypeError("AsyncApiClient does not support async_req; "
+                            "await the call instead")
+        if self.metrics is None:
+            return await self._call(resource_path, method, api_name,
+                                    path_params, query_params, header_params,
+                                    body, post_params, files, response_type,
+                                    auth_settings, _return_http_data_only,
+                                    collection_formats, _preload_content,
+                                    _request_timeout, _priority)
+
+        started = time.perf_counter()
+        try:
+            result = await self._call(resource_path, method, api_name,
+                                      path_params, query_params,
+                                      header_params, body, post_params, files,
+                                      response_type, auth_settings,
+                                      _return_http_data_only,
+                                      collection_formats, _preload_content,
+                                      _request_timeout, _priority)
+        except Exception as e:
+            self.metrics.observe_call(api_name, time.perf_counter() - started,
+                                      e)
+            raise
+        self.metrics.observe_call(api_name, time.perf_counter() - started)
+        return result
+
+    async def _call(self, resource_path, method, api_name, path_params,
+                    query_params, header_params, body, post_params, files,
+                    response_type, auth_settings, _return_http_data_only,
+                    collection_formats, _preload_content, _request_timeout,
+                    _priority):
+        (resource_path, url, query_params, header_params, post_params,
+         body) = self._prepare_request(resource_path, path_params,
+                                       query_params, header_params, body,
+                                       post_params, files, collection_formats)
+
+        def send():
+            return self._send(resource_path, method, api_name, url,
+                              query_params, header_params, body, post_params,
+                              response_type, auth_settings,
+                              _return_http_data_only, _preload_content,
+                              _request_timeout, _priority)
+
+        key = self._flight_key(method, api_name, url, query_params,
+                               header_params, body, response_type,
+                               _return_http_data_only, _preload_content)
+        if key is None:
+            return await send()
+        return await self.single_flight.do_async(key, send)
+
+    async def _send(self, resource_path, method, api_name, url, query_params,
+                    header_params, body, post_params, response_type,
+                    auth_settings, _return_http_data_only, _preload_content,
+                    _request_timeout, _priority):
+        if self.retry_policy is not None:
+            self.retry_policy.on_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            # wait for a request slot before signing, so the signature stays
+            # fresh; every attempt is signed again with its own timestamp
+            if self.rate_limiter is not None:
+                waited = time.perf_counter()
+                await self.rate_limiter.acquire_async(
+                    PRIORITY_INTERACTIVE if _priority is None else _priority)
+                if self.metrics is not None:
+                    self.metrics.rate_limit_wait_seconds.observe(
+                        time.perf_counter() - waited)
+
+            request_headers = dict(header_params)
+            # auth setting
+            self.update_params_for_auth(request_headers, query_params, auth_settings, api_name, method, body, resource_path)
+
+            # perform request and return response
+            try:
+                response_data = await self.request(
+                    method, url, query_params=query_params,
+                    headers=request_headers, post_params=post_params,
+                    body=body, _preload_content=_preload_content,
+                    _request_timeout=_request_timeout)
+                break
+            except rest.ApiException as e:
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+
+        return self._build_result(response_data, response_type,
+                                  _return_http_data_only, _preload_content)
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      post_params=None, body=None, _preload_content=True,
+                      _request_timeout=None):
+        """Makes the HTTP request using AsyncRESTClientObject."""
+        if method not in ('GET', 'HEAD', 'OPTIONS', 'POST', 'PUT', 'PATCH',
+                          'DELETE'):
+            raise ValueError(
+                "http method must be `GET`, `HEAD`, `OPTIONS`,"
+                " `POST`, `PATCH`, `PUT` or `DELETE`."
+            )
+        return await self.rest_client.request(
+            method, url,
+            query_params=query_params,
+            headers=headers,
+            post_params=post_params,
+            body=body,
+            _preload_content=_preload_content,
+            _request_timeout=_request_timeout)
@@ -0,0 +1,259 @@
+# coding: utf-8
+
+# flake8: noqa
+
+from __future__ import absolute_import
+
+"""
+  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+  Licensed under the Apache License, Version 2.0 (the "License").
+  You may not use this file except in compliance with the License.
+  A copy of the License is located at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+  or in the "license" file accompanying this file. This file is distributed
+  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+  express or implied. See the License for the specific language governing
+  permissions and limitations under the License.
+"""
+
+"""
+    ProductAdvertisingAPI
+
+    https://webservices.amazon.com/paapi5/documentation/index.html  # noqa: E501
+"""
+
+
+import io
+import json
+import logging
+import re
+import ssl
+import time
+
+import certifi
+from six.moves.urllib.parse import urlencode
+
+try:
+    import aiohttp
+except ImportError:
+    raise ImportError('The asyncio PA-API client requires aiohttp.')
+
+from paapi5_python_sdk.metrics import operation_of
+from paapi5_python_sdk.rest import ApiException
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRESTResponse(io.IOBase):
+
+    def __init__(self, resp, data):
+        self.aiohttp_response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+        self.data = data
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.aiohttp_response.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.aiohttp_response.headers.get(name, default)
+
+
+class AsyncRESTClientObject(object):
+    """aiohttp based counterpart of rest.RESTClientObject.
+
+    The aiohttp session (and its connection pool) is created on the first
+    request, inside the running event loop, and reused until `close`.
+    """
+
+    def __init__(self, configuration, pools_size=4, maxsize=None,
+                 metrics=None):
+        self.metrics = metrics
+        if maxsize is None:
+            if configuration.connection_pool_maxsize is not None:
+                maxsize = configuration.connection_pool_maxsize
+            else:
+                maxsize = 4
+        self.maxsize = maxsize
+
+        # ca_certs
+        if configuration.ssl_ca_cert:
+            ca_certs = configuration.ssl_ca_cert
+        else:
+            # if not set certificate file, use Mozilla's root certificates.
+            ca_certs = certifi.where()
+
+        self.ssl_context = ssl.create_default_context(cafile=ca_certs)
+        if configuration.cert_file:
+            self.ssl_context.load_cert_chain(
+                configuration.cert_file, keyfile=configuration.key_file)
+        if not configuration.verify_ssl:
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+
+        self.proxy = configuration.proxy
+        self.session = None
+        self._closed = False
+
+    def _get_session(self):
+        if self._closed:
+            raise RuntimeError('The REST client has been closed.')
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.maxsize,
+                                             ssl=self.ssl_context)
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    async def close(self):
+        """Closes the aiohttp session and its pooled connections.
+
+        The client cannot send requests afterwards.
+        """
+        self._closed = True
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      body=None, post_params=None, _preload_content=True,
+                      _request_timeout=None):
+        """Perform requests.
+
+        :param method: http request method
+        :param url: http request url
+        :param query_params: query parameters in the url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _preload_content: if False, the response body is not
+                                 logged; it is returned as bytes either way.
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        """
+        if self.metrics is None:
+            return await self._request(method, url, query_params, headers,
+                                       body, post_params, _preload_content,
+                                       _request_timeout)
+
+        headers = headers or {}
+        started = time.perf_counter()
+        status, response_bytes = 0, 0
+        try:
+            r = await self._request(method, url, query_params, headers, body,
+                                    post_params, _preload_content,
+                                    _request_timeout)
+            status = r.status
+            response_bytes = len(r.data)
+            return r
+        except ApiException as e:
+            status = e.status or 0
+            response_bytes = len(e.body.encode('utf8')) if e.body else 0
+            raise
+        finally:
+            self.metrics.observe_request(
+                operation_of(headers), status, time.perf_counter() - started,
+                len(body) if isinstance(body, bytes) else 0, response_bytes)
+
+    async def _request(self, method, url, query_params=None, headers=None,
+                       body=None, post_params=None, _preload_content=True,
+                       _request_timeout=None):
+        """Sends the request; see `request`."""
+        method = method.upper()
+        assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
+                          'PATCH', 'OPTIONS']
+
+        if post_params and body:
+            raise ValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        headers = headers or {}
+
+        timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = aiohttp.ClientTimeout(total=_request_timeout)
+            elif (isinstance(_request_timeout, tuple) and
+                  len(_request_timeout) == 2):
+                timeout = aiohttp.ClientTimeout(
+                    connect=_request_timeout[0],
+                    sock_read=_request_timeout[1])
+
+        if 'Content-Type' not in headers:
+            headers['Content-Type'] = 'application/json'
+
+        args = {
+            'method': method,
+            'url': url,
+            'headers': headers,
+            'proxy': self.proxy,
+        }
+        if timeout is not None:
+            args['timeout'] = timeout
+
+        if query_params:
+            url += '?' + urlencode(query_params)
+            args['url'] = url
+
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            if re.search('json', headers['Content-Type'], re.IGNORECASE):
+                if isinstance(body, bytes):
+                    # already serialized (and signed) by ApiClient
+                    args['data'] = body
+                elif body is not None:
+                    args['data'] = json.dumps(body)
+            elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
+                args['data'] = aiohttp.FormData(post_params)
+            elif headers['Content-Type'] == 'multipart/form-data':
+                # must del headers['Content-Type'], or the correct
+                # Content-Type which generated by aiohttp will be
+                # overwritten.
+                del headers['Content-Type']
+                data = aiohttp.FormData()
+                for param in post_params:
+                    k, v = param
+                    if isinstance(v, tuple) and len(v) == 3:
+                        data.add_field(k, value=v[1], filename=v[0],
+                                       content_type=v[2])
+                    else:
+                        data.add_field(k, v)
+                args['data'] = data
+            # Pass a `string` parameter directly in the body to support
+            # other content types than Json when `body` argument is provided
+            # in serialized form
+            elif isinstance(body, (str, bytes)):
+                args['data'] = body
+            else:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        try:
+            async with self._get_session().request(**args) as r:
+                data = await r.read()
+        except aiohttp.ClientSSLError as e:
+            msg = "{0}\n{1}".format(type(e).__name__, str(e))
+            raise ApiException(status=0, reason=msg)
+
+        r = AsyncRESTResponse(r, data)
+        # the body stays bytes, json.loads parses it directly
+        if _preload_content and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("response body: %s", data.decode('utf8'))
+
+        if not 200 <= r.status <= 299:
+            raise ApiException(http_resp=r)
+
+        return r
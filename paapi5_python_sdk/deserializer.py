@@ -0,0 +1,305 @@
+# coding: utf-8
+
+"""
+  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+  Licensed under the Apache License, Version 2.0 (the "License").
+  You may not use this file except in compliance with the License.
+  A copy of the License is located at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+  or in the "license" file accompanying this file. This file is distributed
+  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+  express or implied. See the License for the specific language governing
+  permissions and limitations under the License.
+"""
+
+"""
+    ProductAdvertisingAPI
+
+    https://webservices.amazon.com/paapi5/documentation/index.html  # noqa: E501
+"""
+
+import re
+import threading
+
+import six
+
+_LIST_TYPE = re.compile(r'list\[(.*)\]$')
+_DICT_TYPE = re.compile(r'dict\(([^,]*), (.*)\)$')
+
+
+class Deserializer(object):
+    """Table-driven deserializer for the swagger models.
+
+    Every type string (`'list[OfferListing]'`, `'Item'`, `'str'`, ...) is
+    parsed once into a decoder function, and every model class into a plan
+    of (JSON key, attribute, decoder) entries built from its `swagger_types`
+    and `attribute_map`. Responses are then decoded by walking the plans,
+    without regular expressions, name lookups or property setters.
+
+    The objects built are the same as with ApiClient's generic path: every
+    private slot behind a property is filled with the decoded value, or the
+    default `__init__` gives it. Models whose constructor cannot run without
+    arguments, dict based models and non-dict payloads are handed to
+    `fallback`.
+
+    With `lazy` set, models are returned as instances of lazy subclasses (see
+    `lazy_model_class`) that keep the parsed JSON and decode each attribute
+    the first time it is read.
+
+    :param models: Module the model classes are looked up in.
+    :param native_types: Mapping of native type names to Python types.
+    :param primitive_types: Types decoded by calling the type on the value.
+    :param fallback: Function (data, klass) used for everything the plans do
+        not cover (dates, unusual models).
+    :param lazy: Build lazy models instead of decoding whole responses.
+    """
+
+    def __init__(self, models, native_types, primitive_types, fallback,
+                 lazy=False):
+        self.models = models
+        self.native_types = native_types
+        self.primitive_types = primitive_types
+        self.fallback = fallback
+        self.lazy = lazy
+        self._decoders = {}
+        self._compiling = {}
+        self._lock = threading.RLock()
+
+    def deserialize(self, data, klass):
+        """Deserializes parsed JSON data into `klass`.
+
+        :param data: dict, list or str.
+        :param klass: class literal, or string of class name.
+        :return: object.
+        """
+        decoder = self._decoders.get(klass)
+        if decoder is None:
+            decoder = self.decoder(klass)
+        return decoder(data)
+
+    def decoder(self, klass):
+        """Returns the (cached) decoder function for a type."""
+        decoder = self._decoders.get(klass)
+        if decoder is not None:
+            return decoder
+        with self._lock:
+            decoder = (self._decoders.get(klass) or
+                       self._compiling.get(klass))
+            if decoder is None:
+                outermost = not self._compiling
+                try:
+                    decoder = self._compile(klass)
+                    if outermost:
+                        # publish once every nested plan is complete
+                        self._decoders.update(self._compiling)
+                finally:
+                    if outermost:
+                        self._compiling.clear()
+        return decoder
+
+    def _compile(self, klass):
+        # model decoders are registered before their fields are compiled,
+        # so recursive models (BrowseNodeAncestor) terminate
+        if isinstance(klass, six.string_types):
+            match = _LIST_TYPE.match(klass)
+            if match:
+                decoder = _list_decoder(self.decoder(match.group(1)))
+            else:
+                match = _DICT_TYPE.match(klass)
+                if match:
+                    decoder = _dict_decoder(self.decoder(match.group(2)))
+                elif klass in self.native_types:
+                    decoder = self.decoder(self.native_types[klass])
+                else:
+                    decoder = self.decoder(getattr(self.models, klass))
+        elif klass in self.primitive_types:
+            decoder = _primitive_decoder(klass)
+        elif klass is object:
+            decoder = _identity
+        elif not isinstance(getattr(klass, 'swagger_types', None), dict):
+            decoder = self._fallback_decoder(klass)
+        elif (not klass.swagger_types and
+                not hasattr(klass, 'get_real_child_model')):
+            # enums and free-form models are kept as plain JSON values
+            decoder = _identity
+        else:
+            plan = _ModelPlan.build(klass)
+            if plan is None:
+                decoder = self._fallback_decoder(klass)
+            else:
+                if self.lazy:
+                    decoder = plan.lazy_decoder(self.fallback)
+                else:
+                    decoder = plan.decoder(self.fallback)
+                self._compiling[klass] = decoder
+                plan.compile_fields(self.decoder)
+        self._compiling[klass] = decoder
+        return decoder
+
+    def _fallback_decoder(self, klass):
+        fallback = self.fallback
+
+        def decode(data):
+            if data is None:
+                return None
+            return fallback(data, klass)
+        return decode
+
+
+class _ModelPlan(object):
+    """Field table of one model class."""
+
+    def __init__(self, klass, fields):
+        self.klass = klass
+        # (JSON key, slot, default value, attribute type) entries
+        self.fields = fields
+        self.fields_by_slot = {}
+        self.lazy_class = None
+
+    def compile_fields(self, decoder):
+        """Replaces the attribute type names by their decoders."""
+        self.fields_by_slot = dict(
+            (slot, (key, default, decoder(attr_type)))
+            for key, slot, default, attr_type in self.fields)
+        self.fields = [(key, self.klass.__dict__[slot].__set__, default,
+                        self.fields_by_slot[slot][2])
+                       for key, slot, default, _ in self.fields]
+
+    @classmethod
+    def build(cls, klass):
+        """Returns the plan of `klass`, or None if it needs the generic path."""
+        if (issubclass(klass, dict) or
+                hasattr(klass, 'get_real_child_model') or
+                '__slots__' not in klass.__dict__):
+            return None
+        try:
+            instance = klass()
+        except (TypeError, ValueError):
+            # e.g. request models with required arguments
+            return None
+        slots = klass.__slots__
+        fields = []
+        for attr, attr_type in six.iteritems(klass.swagger_types):
+            slot = '_' + attr
+            if slot not in slots:
+                return None
+            fields.append((klass.attribute_map[attr], slot,
+                           getattr(instance, slot), attr_type))
+        if len(fields) != len(slots):
+            return None
+        return cls(klass, fields)
+
+    def decoder(self, fallback):
+        plan = self
+        klass = self.klass
+        new = klass.__new__
+
+        def decode(data):
+            if data is None:
+                return None
+            if type(data) is not dict:
+                return fallback(data, klass)
+            instance = new(klass)
+            for key, set_slot, default, field_decoder in plan.fields:
+                if key in data:
+                    set_slot(instance, field_decoder(data[key]))
+                else:
+                    set_slot(instance, default)
+            return instance
+        return decode
+
+    def lazy_decoder(self, fallback):
+        klass = self.klass
+        lazy_class = self.lazy_class = lazy_model_class(self)
+        new = lazy_class.__new__
+
+        def decode(data):
+            if data is None:
+                return None
+            if type(data) is not dict:
+                return fallback(data, klass)
+            instance = new(lazy_class)
+            instance._lazy_data = data
+            return instance
+        return decode
+
+
+def lazy_model_class(plan):
+    """Creates the lazy subclass of a model.
+
+    Instances hold the parsed JSON of the model in `_lazy_data`. Reading a
+    property looks up its private slot, which is empty at first, so
+    `__getattr__` decodes that single value from the JSON and stores it; the
+    rest of the object graph is only decoded when it is read. The public API
+    (properties, setters, `to_dict`, equality) is that of the model class.
+
+    The lazy classes are not importable, so pickling or copying an instance
+    decodes it fully and yields an instance of the model class itself.
+    """
+    klass = plan.klass
+
+    def __getattr__(self, name):
+        field = plan.fields_by_slot.get(name)
+        if field is None:
+            raise AttributeError(name)
+        key, default, field_decoder = field
+        data = self._lazy_data
+        value = field_decoder(data[key]) if key in data else default
+        setattr(self, name, value)
+        return value
+
+    def __reduce__(self):
+        return _restore_model, (klass, dict(
+            (slot, getattr(self, slot)) for slot in plan.fields_by_slot))
+
+    return type('Lazy' + klass.__name__, (klass,), {
+        '__module__': klass.__module__,
+        '__doc__': klass.__doc__,
+        '__slots__': ('_lazy_data',),
+        '__getattr__': __getattr__,
+        '__reduce__': __reduce__,
+    })
+
+
+def _restore_model(klass, slots):
+    """Unpickles a lazy model as an instance of its model class."""
+    instance = klass.__new__(klass)
+    for slot, value in six.iteritems(slots):
+        setattr(instance, slot, value)
+    return instance
+
+
+def _identity(data):
+    return data
+
+
+def _primitive_decoder(klass):
+    def decode(data):
+        if data is None or type(data) is klass:
+            return data
+        try:
+            return klass(data)
+        except UnicodeEncodeError:
+            return six.text_type(data)
+        except TypeError:
+            return data
+    return decode
+
+
+def _list_decoder(item_decoder):
+    def decode(data):
+        if data is None:
+            return None
+        return [item_decoder(item) for item in data]
+    return decode
+
+
+def _dict_decoder(value_decoder):
+    def decode(data):
+        if data is None:
+            return None
+        return {k: value_decoder(v) for k, v in six.iteritems(data)}
+    return decode
@@ -0,0 +1,257 @@
+# coding: utf-8
+
+"""
+  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+  Licensed under the Apache License, Version 2.0 (the "License").
+  You may not use this file except in compliance with the License.
+  A copy of the License is located at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+  or in the "license" file accompanying this file. This file is distributed
+  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+  express or implied. See the License for the specific language governing
+  permissions and limitations under the License.
+"""
+
+"""
+    ProductAdvertisingAPI
+
+    https://webservices.amazon.com/paapi5/documentation/index.html  # noqa: E501
+"""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+
+from paapi5_python_sdk.models.get_items_request import GetItemsRequest
+
+
+class ItemLookupError(Exception):
+    """Raised for a single item id that a batched GetItems call did not return.
+
+    :param item_id: The item id that was requested.
+    :param code: The PA-API error code (e.g. `InvalidParameterValue`).
+    :param message: The PA-API error message.
+    """
+
+    def __init__(self, item_id, code, message):
+        super(ItemLookupError, self).__init__(
+            "{0}: {1} ({2})".format(item_id, message, code))
+        self.item_id = item_id
+        self.code = code
+        self.message = message
+
+
+class GetItemsBatcher(object):
+    """Coalesces concurrent single-item lookups into batched GetItems calls.
+
+    Callers await `get_item(item_id)`. Item ids requested within `max_delay`
+    seconds of each other are sent together, up to `max_batch_size` (the
+    PA-API limit is 10) per request, and every caller receives its own
+    `Item` or `ItemLookupError`. Duplicate ids in the same window share one
+    slot in the request.
+
+    With an AsyncDefaultApi the requests are awaited directly; the blocking
+    `DefaultApi.get_items` call runs in `executor` (the event loop's default
+    executor when None).
+
+    :param api: AsyncDefaultApi or DefaultApi used to send the requests.
+    :param partner_tag: Partner tag for every request.
+    :param partner_type: Partner type for every request.
+    :param marketplace: Target marketplace for every request.
+    :param resources: Resources requested for every item.
+    :param max_delay: Seconds to wait for more ids before sending a batch.
+    :param max_batch_size: Maximum number of item ids per request.
+    :param executor: concurrent.futures executor for the blocking call.
+    :param on_batch: Optional function called once per batch with the
+        exception the GetItems call raised, or None when it returned (even
+        if some items were not found). Lets a circuit breaker count calls
+        rather than waiting callers.
+    :param request_options: Additional GetItemsRequest keyword arguments.
+    """
+
+    MAX_ITEM_IDS = 10
+
+    def __init__(self, api, partner_tag, partner_type, marketplace, resources,
+                 max_delay=0.05, max_batch_size=MAX_ITEM_IDS, executor=None,
+                 on_batch=None, **request_options):
+        if not 1 <= max_batch_size <= self.MAX_ITEM_IDS:
+            raise ValueError(
+                "max_batch_size must be between 1 and %d" % self.MAX_ITEM_IDS)
+        self.api = api
+        self.partner_tag = partner_tag
+        self.partner_type = partner_type
+        self.marketplace = marketplace
+        self.resources = list(resources)
+        self.max_delay = max_delay
+        self.max_batch_size = max_batch_size
+        self.executor = executor
+        self.on_batch = on_batch
+        self.request_options = request_options
+
+        self._pending = OrderedDict()
+        self._flush_handle = None
+        self._tasks = set()
+
+        self.batches = 0
+        self.items_requested = 0
+        self.items_coalesced = 0
+
+    async def get_item(self, item_id):
+        """Looks up a single item as part of the next batch.
+
+        :param item_id: The item id (ASIN) to look up.
+        :return: Item
+        :raises ItemLookupError: if the response has no item for `item_id`.
+        """
+        item, _ = await self.get_item_with_fetch_time(item_id)
+        return item
+
+    async def get_item_with_fetch_time(self, item_id):
+        """Like `get_item`, but also returns when the item data was fetched.
+
+        With an ItemCache on the api client this is the time the cached data
+        was fetched from PA-API, otherwise the time the response arrived.
+
+        :param item_id: The item id (ASIN) to look up.
+        :return: tuple (Item, fetched_at as a time.time() timestamp)
+        :raises ItemLookupError: if the response has no item for `item_id`.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiters = self._pending.get(item_id)
+        if waiters is None:
+            self._pending[item_id] = [future]
+        else:
+            waiters.append(future)
+            self.items_coalesced += 1
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_delay, self._flush)
+        return await future
+
+    def stats(self):
+        """Returns the batching counters as a dict."""
+        return {
+            'batches': self.batches,
+            'items_requested': self.items_requested,
+            'items_coalesced': self.items_coalesced,
+            'pending': len(self._pending),
+        }
+
+    async def close(self):
+        """Cancels the pending lookups and the batches in flight.
+
+        Callers still waiting on `get_item` receive CancelledError. Call this
+        before closing the api so no batch is sent on a closed client.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, OrderedDict()
+        for waiters in pending.values():
+            for future in waiters:
+                future.cancel()
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        while self._pending:
+            batch = OrderedDict()
+            while self._pending and len(batch) < self.max_batch_size:
+                item_id, waiters = self._pending.popitem(last=False)
+                batch[item_id] = waiters
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _build_request(self, item_ids):
+        return GetItemsRequest(partner_tag=self.partner_tag,
+                               partner_type=self.partner_type,
+                               marketplace=self.marketplace,
+                               item_ids=item_ids,
+                               resources=self.resources,
+                               **self.request_options)
+
+    async def _run_batch(self, batch):
+        item_ids = list(batch)
+        self.batches += 1
+        self.items_requested += len(item_ids)
+        request = self._build_request(item_ids)
+        is_async = asyncio.iscoroutinefunction(self.api.get_items)
+        get_items = self.api.get_items
+        fetch_times = {}
+        item_cache = getattr(getattr(self.api, 'api_client', None),
+                             'item_cache', None)
+        if item_cache is not None:
+            get_items = functools.partial(
+                item_cache.get_items_async if is_async
+                else item_cache.get_items,
+                self.api, fetch_times=fetch_times)
+        try:
+            if is_async:
+                response = await get_items(request)
+            else:
+                response = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, functools.partial(get_items, request))
+        except asyncio.CancelledError:
+            for waiters in batch.values():
+                for future in waiters:
+                    future.cancel()
+            raise
+        except Exception as e:
+            if self.on_batch is not None:
+                self.on_batch(e)
+            for waiters in batch.values():
+                for future in waiters:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        if self.on_batch is not None:
+            self.on_batch(None)
+        received_at = time.time()
+        for item_id, result in self._split_response(item_ids, response).items():
+            for future in batch[item_id]:
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(
+                        (result, fetch_times.get(item_id, received_at)))
+
+    def _split_response(self, item_ids, response):
+        """Maps every requested item id to its Item or ItemLookupError."""
+        results = {}
+        if response.items_result and response.items_result.items:
+            for item in response.items_result.items:
+                results[item.asin] = item
+
+        errors = response.errors or []
+        for item_id in item_ids:
+            if item_id in results:
+                continue
+            error = next((e for e in errors
+                          if e.message and item_id in e.message), None)
+            if error is None and len(errors) == 1 and len(item_ids) == 1:
+                error = errors[0]
+            if error is not None:
+                results[item_id] = ItemLookupError(item_id, error.code,
+                                                   error.message)
+            else:
+                results[item_id] = ItemLookupError(
+                    item_id, 'ItemNotReturned',
+                    'The item was not returned in the GetItems response.')
+        return results
@@ -0,0 +1,432 @@
+# coding: utf-8
+
+"""
+  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+  Licensed under the Apache License, Version 2.0 (the "License").
+  You may not use this file except in compliance with the License.
+  A copy of the License is located at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+  or in the "license" file accompanying this file. This file is distributed
+  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+  express or implied. See the License for the specific language governing
+  permissions and limitations under the License.
+"""
+
+"""
+    ProductAdvertisingAPI
+
+    https://webservices.amazon.com/paapi5/documentation/index.html  # noqa: E501
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from paapi5_python_sdk.models.item_id_type import ItemIdType
+from paapi5_python_sdk.rate_limiter import PRIORITY_BACKGROUND
+
+logger = logging.getLogger(__name__)
+
+# Top level Item keys whose content changes quickly (prices, availability).
+VOLATILE_KEYS = frozenset(['Offers', 'RentalOffers'])
+
+MAX_ITEM_IDS = 10
+
+
+def resource_key(resource):
+    """Returns the top level Item JSON key filled by a GetItems resource."""
+    return resource.split('.', 1)[0]
+
+
+class ItemCache(object):
+    """In-process LRU cache for GetItems results.
+
+    Items are cached as the raw JSON returned by PA-API, keyed by
+    (marketplace, item id, resource set, other request options), so a hit
+    is deserialized exactly like a fresh response.
+
+    The static part of an item (title, features, images, ...) is kept for
+    `static_ttl` seconds. The volatile part (`Offers`) expires after
+    `volatile_ttl` seconds; an item with only stale offers is refreshed by a
+    GetItems call that asks for the volatile resources alone.
+
+    With `stale_while_revalidate`, offers that expired less than that many
+    seconds ago are still returned at once, and the refresh is made in the
+    background at PRIORITY_BACKGROUND (a task for AsyncDefaultApi, the api
+    client's thread pool for DefaultApi). Pass a dict as `fetch_times` to
+    learn when the returned data of each item was fetched.
+
+    Enable it by passing an instance as `item_cache` to ApiClient; every
+    `DefaultApi.get_items` call made with that client then goes through it.
+
+    An optional persistent `store` (e.g. SQLiteItemStore) acts as a second
+    level: items missing from memory are looked up there, and fetched items
+    are written through to it, so the cache survives a restart. The store
+    is never accessed while the cache lock is held; `get_items_async` reads
+    it in a worker thread and writes to it in the background (call `drain`
+    before closing the store).
+
+    :param max_entries: Maximum number of cached items (LRU eviction).
+    :param static_ttl: Lifetime in seconds of static item data.
+    :param volatile_ttl: Lifetime in seconds of offer data.
+    :param store: Optional persistent second level store.
+    :param stale_while_revalidate: Seconds past `volatile_ttl` during which
+        stale offers are served while they are refreshed in the background.
+    """
+
+    def __init__(self, max_entries=1024, static_ttl=86400, volatile_ttl=300,
+                 clock=time.time, store=None, stale_while_revalidate=0):
+        self.max_entries = max_entries
+        self.static_ttl = static_ttl
+        self.volatile_ttl = volatile_ttl
+        self.clock = clock
+        self.store = store
+        self.stale_while_revalidate = stale_while_revalidate
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._revalidating = set()
+        self._tasks = set()
+        self._store_executor = None
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Returns the cache counters as a dict."""
+        hits = self.hits + self.stale_hits
+        lookups = hits + self.misses + self.refreshes
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'refreshes': self.refreshes,
+            'evictions': self.evictions,
+            'hit_ratio': float(hits) / lookups if lookups else 0.0,
+            'revalidating': len(self._revalidating),
+        }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_items(self, api, get_items_request, fetch_times=None, **kwargs):
+        """Serves a GetItems request from the cache, fetching what is missing.
+
+        :param api: DefaultApi used for cache misses.
+        :param get_items_request: GetItemsRequest
+        :param fetch_times: Optional dict updated with the time the returned
+                            data of each item id was fetched.
+        :return: GetItemsResponse
+        """
+        api_client = api.api_client
+        if get_items_request.item_id_type not in (None, ItemIdType.ASIN):
+            return api.get_items_with_http_info(get_items_request, **kwargs)
+
+        plan = self.plan(api_client, get_items_request)
+        kwargs['_return_http_data_only'] = True
+        kwargs['_preload_content'] = False
+        if plan.revalidate is not None:
+            api_client.pool.apply_async(self._revalidate,
+                                        (api, plan.revalidate, kwargs))
+        responses = []
+        for sub_request in plan.requests:
+            response = api.get_items_with_http_info(sub_request, **kwargs)
+            responses.append(json.loads(response.data))
+        result = self.complete(plan, responses)
+        self._write_store(plan)
+        if fetch_times is not None:
+            fetch_times.update(plan.fetch_times)
+        return api_client.deserialize_data(result, 'GetItemsResponse')
+
+    async def get_items_async(self, api, get_items_request, fetch_times=None,
+                              **kwargs):
+        """Coroutine version of `get_items` for AsyncDefaultApi.
+
+        The GetItems calls needed for uncached items are sent concurrently.
+        """
+        api_client = api.api_client
+        if get_items_request.item_id_type not in (None, ItemIdType.ASIN):
+            return await api.get_items_with_http_info(get_items_request,
+                                                      **kwargs)
+
+        plan = self._new_plan(api_client, get_items_request)
+        item_ids = self._unloaded(plan)
+        loaded = None
+        if item_ids:
+            loaded = await asyncio.get_running_loop().run_in_executor(
+                self._executor(), self._read_store, plan, item_ids)
+        self._classify(plan, loaded)
+        kwargs['_return_http_data_only'] = True
+        kwargs['_preload_content'] = False
+        if plan.revalidate is not None:
+            task = asyncio.ensure_future(
+                self._revalidate_async(api, plan.revalidate, kwargs))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        responses = await asyncio.gather(*(
+            api.get_items_with_http_info(sub_request, **kwargs)
+            for sub_request in plan.requests))
+        responses = [json.loads(response.data) for response in responses]
+        result = self.complete(plan, responses)
+        self._write_store_later(plan)
+        if fetch_times is not None:
+            fetch_times.update(plan.fetch_times)
+        return api_client.deserialize_data(result, 'GetItemsResponse')
+
+    def plan(self, api_client, get_items_request):
+        """Splits a request into cached items and the GetItems calls needed.
+
+        :return: _CachePlan whose `requests` must be sent and their parsed
+                 JSON bodies passed to `complete`.
+        """
+        plan = self._new_plan(api_client, get_items_request)
+        item_ids = self._unloaded(plan)
+        self._classify(plan, self._read_store(plan, item_ids)
+                       if item_ids else None)
+        return plan
+
+    async def drain(self):
+        """Waits for the background refreshes and store writes."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _new_plan(self, api_client, get_items_request):
+        resources = list(get_items_request.resources or [])
+        options = dict(api_client.sanitize_for_serialization(get_items_request))
+        for name in ('ItemIds', 'Resources', 'Marketplace'):
+            options.pop(name, None)
+        options = json.dumps(options, sort_keys=True)
+        prefix = (get_items_request.marketplace, frozenset(resources), options)
+
+        plan = _CachePlan(get_items_request, prefix)
+        if self.store is not None:
+            plan.store_prefix = json.dumps(
+                [get_items_request.marketplace, sorted(resources), options])
+        return plan
+
+    def _unloaded(self, plan):
+        """Returns the ids of the requested items to look up in the store."""
+        if self.store is None:
+            return []
+        with self._lock:
+            return [item_id for item_id
+                    in OrderedDict.fromkeys(plan.request.item_ids)
+                    if plan.prefix + (item_id,) not in self._entries]
+
+    def _read_store(self, plan, item_ids):
+        rows = self.store.get_many(plan.store_prefix, item_ids)
+        return dict((item_id, _CacheEntry(*row))
+                    for item_id, row in rows.items())
+
+    def _classify(self, plan, loaded):
+        get_items_request = plan.request
+        resources = list(get_items_request.resources or [])
+        volatile = [r for r in resources if resource_key(r) in VOLATILE_KEYS]
+        prefix = plan.prefix
+        now = self.clock()
+        missing, stale, revalidate = [], [], {}
+        with self._lock:
+            for item_id in get_items_request.item_ids:
+                if item_id in plan.items or item_id in missing or item_id in stale:
+                    continue
+                key = prefix + (item_id,)
+                entry = self._entries.get(key)
+                if entry is None and loaded and item_id in loaded:
+                    entry = loaded[item_id]
+                    self._store(key, entry)
+                if entry is None or now - entry.fetched_at >= self.static_ttl:
+                    self.misses += 1
+                    missing.append(item_id)
+                    continue
+                self._entries.move_to_end(key)
+                age = now - entry.volatile_fetched_at
+                if not volatile or age < self.volatile_ttl:
+                    self.hits += 1
+                elif age < self.volatile_ttl + self.stale_while_revalidate:
+                    self.stale_hits += 1
+                    if key not in self._revalidating:
+                        self._revalidating.add(key)
+                        revalidate[item_id] = entry
+                else:
+                    self.refreshes += 1
+                    stale.append(item_id)
+                    plan.stale[item_id] = entry
+                    continue
+                plan.items[item_id] = entry.data
+                plan.fetch_times[item_id] = entry.volatile_fetched_at
+
+        plan.requests.extend(_sub_requests(get_items_request, missing,
+                                           resources))
+        plan.requests.extend(_sub_requests(get_items_request, stale,
+                                           volatile))
+        if revalidate:
+            plan.revalidate = _CachePlan(get_items_request, prefix)
+            plan.revalidate.store_prefix = plan.store_prefix
+            plan.revalidate.stale = revalidate
+            plan.revalidate.requests.extend(_sub_requests(
+                get_items_request, list(revalidate), volatile))
+
+    def complete(self, plan, responses):
+        """Caches fetched items and assembles the GetItemsResponse JSON.
+
+        The changes for the persistent store are left in `plan.store_puts`
+        and `plan.store_deletes`, to be written without the cache lock.
+
+        :param plan: The _CachePlan returned by `plan`.
+        :param responses: Parsed JSON bodies of `plan.requests`, in order.
+        :return: dict in the GetItemsResponse wire format.
+        """
+        now = self.clock()
+        errors = []
+        with self._lock:
+            for sub_request, data in zip(plan.requests, responses):
+                errors.extend(data.get('Errors') or [])
+                items = (data.get('ItemsResult') or {}).get('Items') or []
+                for item in items:
+                    item_id = item.get('ASIN')
+                    key = plan.prefix + (item_id,)
+                    entry = plan.stale.get(item_id)
+                    if entry is not None:
+                        merged = dict((k, v) for k, v in entry.data.items()
+                                      if k not in VOLATILE_KEYS)
+                        merged.update(item)
+                        entry = _CacheEntry(merged, entry.fetched_at, now)
+                    else:
+                        entry = _CacheEntry(item, now, now)
+                    self._store(key, entry)
+                    plan.fetch_times[item_id] = entry.volatile_fetched_at
+                    if self.store is not None:
+                        plan.store_puts.append((item_id, entry.data,
+                                                entry.fetched_at,
+                                                entry.volatile_fetched_at))
+                    plan.items[item_id] = entry.data
+                for item_id in sub_request.item_ids:
+                    if item_id not in plan.items:
+                        self._entries.pop(plan.prefix + (item_id,), None)
+                        if self.store is not None:
+                            plan.store_deletes.append(item_id)
+
+        result = {}
+        ordered = [plan.items[item_id]
+                   for item_id in OrderedDict.fromkeys(plan.request.item_ids)
+                   if item_id in plan.items]
+        if ordered:
+            # Deserialization only reads the cached JSON, so it is not copied.
+            result['ItemsResult'] = {'Items': ordered}
+        if errors:
+            result['Errors'] = errors
+        return result
+
+    def _revalidate(self, api, plan, kwargs):
+        """Refreshes the offers of the items in `plan` (thread pool)."""
+        kwargs = dict(kwargs, _priority=PRIORITY_BACKGROUND)
+        try:
+            responses = [
+                json.loads(api.get_items_with_http_info(sub_request,
+                                                        **kwargs).data)
+                for sub_request in plan.requests]
+            self.complete(plan, responses)
+            self._write_store(plan)
+        except Exception as e:
+            logger.warning("background item refresh failed: %s", e)
+        finally:
+            self._done_revalidating(plan)
+
+    async def _revalidate_async(self, api, plan, kwargs):
+        """Coroutine version of `_revalidate`."""
+        kwargs = dict(kwargs, _priority=PRIORITY_BACKGROUND)
+        try:
+            responses = await asyncio.gather(*(
+                api.get_items_with_http_info(sub_request, **kwargs)
+                for sub_request in plan.requests))
+            self.complete(plan, [json.loads(response.data)
+                                 for response in responses])
+            self._write_store_later(plan)
+        except Exception as e:
+            logger.warning("background item refresh failed: %s", e)
+        finally:
+            self._done_revalidating(plan)
+
+    def _done_revalidating(self, plan):
+        with self._lock:
+            for item_id in plan.stale:
+                self._revalidating.discard(plan.prefix + (item_id,))
+
+    def _write_store(self, plan):
+        if plan.store_puts or plan.store_deletes:
+            self.store.write(plan.store_prefix, plan.store_puts,
+                             plan.store_deletes)
+
+    def _write_store_later(self, plan):
+        if plan.store_puts or plan.store_deletes:
+            task = asyncio.get_running_loop().run_in_executor(
+                self._executor(), self._write_store, plan)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _executor(self):
+        # one thread, so store reads and writes run in the order they were
+        # made and an older write never replaces a newer one
+        with self._lock:
+            if self._store_executor is None:
+                self._store_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='item-store')
+            return self._store_executor
+
+    def _store(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+class _CacheEntry(object):
+
+    __slots__ = ('data', 'fetched_at', 'volatile_fetched_at')
+
+    def __init__(self, data, fetched_at, volatile_fetched_at):
+        self.data = data
+        self.fetched_at = fetched_at
+        self.volatile_fetched_at = volatile_fetched_at
+
+
+class _CachePlan(object):
+
+    def __init__(self, request, prefix):
+        self.request = request
+        self.prefix = prefix
+        self.store_prefix = None
+        self.items = {}
+        self.stale = {}
+        self.fetch_times = {}
+        self.requests = []
+        self.revalidate = None
+        self.store_puts = []
+        self.store_deletes = []
+
+
+def _sub_requests(get_items_request, item_ids, resources):
+    requests = []
+    for start in range(0, len(item_ids), MAX_ITEM_IDS):
+        sub_request = copy.copy(get_items_request)
+        sub_request.item_ids = item_ids[start:start + MAX_ITEM_IDS]
+        sub_request.resources = resources
+        requests.append(sub_request)
+    return requests
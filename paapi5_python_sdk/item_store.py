@@ -0,0 +1,229 @@
+# coding: utf-8
+
+"""
+  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+  Licensed under the Apache License, Version 2.0 (the "License").
+  You may not use this file except in compliance with the License.
+  A copy of the License is located at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+  or in the "license" file accompanying this file. This file is distributed
+  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+  express or implied. See the License for the specific language governing
+  permissions and limitations under the License.
+"""
+
+"""
+    ProductAdvertisingAPI
+
+    https://webservices.amazon.com/paapi5/documentation/index.html  # noqa: E501
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteItemStore(object):
+    """Persistent second-level store for ItemCache, backed by SQLite.
+
+    Each row holds the compact JSON of one item with the times its static
+    and volatile (offer) data were fetched, so cached items survive a
+    restart. The database is opened in WAL mode on first use; once it holds
+    more than `max_entries` rows the least recently used ones are deleted.
+    Reads only query the database; the access times they imply are saved
+    with the next write.
+
+    Errors from the database are logged and treated as misses, so a broken
+    or read-only file never fails a lookup.
+
+    :param path: Database file path.
+    :param max_entries: Maximum number of stored items.
+    """
+
+    # check the size limit once every this many writes
+    EVICT_EVERY = 100
+
+    def __init__(self, path, max_entries=10000, clock=time.time):
+        self.path = path
+        self.max_entries = max_entries
+        self.clock = clock
+
+        self._conn = None
+        self._closed = False
+        self._lock = threading.Lock()
+        self._writes = 0
+        # (prefix, item_id) -> time of the last read, saved by `write`
+        self._touched = {}
+
+        self.reads = 0
+        self.hits = 0
+        self.evictions = 0
+
+    def stats(self):
+        """Returns the store counters as a dict."""
+        return {
+            'reads': self.reads,
+            'hits': self.hits,
+            'evictions': self.evictions,
+        }
+
+    def _connect(self):
+        if self._closed:
+            # handled like any other database error: a miss or a lost write
+            raise sqlite3.ProgrammingError(
+                'Cannot operate on a closed item store.')
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False,
+                                   isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS items ('
+                ' prefix TEXT NOT NULL,'
+                ' item_id TEXT NOT NULL,'
+                ' data TEXT NOT NULL,'
+                ' fetched_at REAL NOT NULL,'
+                ' volatile_fetched_at REAL NOT NULL,'
+                ' accessed_at REAL NOT NULL,'
+                ' PRIMARY KEY (prefix, item_id))')
+            conn.execute('CREATE INDEX IF NOT EXISTS items_accessed_at'
+                         ' ON items (accessed_at)')
+            self._conn = conn
+        return self._conn
+
+    def get(self, prefix, item_id):
+        """Returns (data, fetched_at, volatile_fetched_at), or None.
+
+        :param prefix: String identifying the request options.
+        :param item_id: The item id.
+        """
+        return self.get_many(prefix, [item_id]).get(item_id)
+
+    def get_many(self, prefix, item_ids):
+        """Returns {item_id: (data, fetched_at, volatile_fetched_at)}.
+
+        Reads do not write: the access time of the returned items is updated
+        with the next `write`.
+        """
+        item_ids = list(item_ids)
+        if not item_ids:
+            return {}
+        now = self.clock()
+        with self._lock:
+            self.reads += len(item_ids)
+            try:
+                rows = self._connect().execute(
+                    'SELECT item_id, data, fetched_at, volatile_fetched_at'
+                    ' FROM items WHERE prefix = ? AND item_id IN ({0})'.format(
+                        ','.join('?' * len(item_ids))),
+                    [prefix] + item_ids).fetchall()
+            except sqlite3.Error as e:
+                logger.warning("item store read failed: %s", e)
+                return {}
+            found = {}
+            for row in rows:
+                try:
+                    data = json.loads(row[1])
+                except ValueError as e:
+                    # a truncated or hand-edited row is a miss, not an error
+                    logger.warning("item store row %s is unreadable: %s",
+                                   row[0], e)
+                    continue
+                found[row[0]] = (data, row[2], row[3])
+                self._touched[(prefix, row[0])] = now
+            self.hits += len(found)
+        return found
+
+    def put(self, prefix, item_id, data, fetched_at, volatile_fetched_at):
+        """Stores (or replaces) an item."""
+        self.write(prefix, [(item_id, data, fetched_at, volatile_fetched_at)])
+
+    def delete(self, prefix, item_id):
+        """Removes an item if it is stored."""
+        self.write(prefix, deletes=[item_id])
+
+    def write(self, prefix, puts=(), deletes=()):
+        """Stores and removes items in one transaction.
+
+        :param puts: (item_id, data, fetched_at, volatile_fetched_at) tuples.
+        :param deletes: Ids of the items to remove.
+        """
+        now = self.clock()
+        records = [(prefix, item_id,
+                    json.dumps(data, separators=(',', ':'), ensure_ascii=False),
+                    fetched_at, volatile_fetched_at, now)
+                   for item_id, data, fetched_at, volatile_fetched_at in puts]
+        deletes = [(prefix, item_id) for item_id in deletes]
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute('BEGIN')
+                try:
+                    self._save_touched(conn)
+                    conn.executemany(
+                        'INSERT OR REPLACE INTO items (prefix, item_id, data,'
+                        ' fetched_at, volatile_fetched_at, accessed_at)'
+                        ' VALUES (?, ?, ?, ?, ?, ?)', records)
+                    conn.executemany(
+                        'DELETE FROM items WHERE prefix = ? AND item_id = ?',
+                        deletes)
+                    self._writes += len(records)
+                    if self._writes >= self.EVICT_EVERY:
+                        self._writes = 0
+                        self._evict(conn)
+                    conn.execute('COMMIT')
+                except BaseException:
+                    conn.execute('ROLLBACK')
+                    raise
+            except sqlite3.Error as e:
+                logger.warning("item store write failed: %s", e)
+
+    def recent_item_ids(self, limit):
+        """Returns the ids of the most recently used items, newest first."""
+        with self._lock:
+            try:
+                rows = self._connect().execute(
+                    'SELECT DISTINCT item_id FROM items'
+                    ' ORDER BY accessed_at DESC LIMIT ?', (limit,)).fetchall()
+            except sqlite3.Error as e:
+                logger.warning("item store read failed: %s", e)
+                return []
+        return [row[0] for row in rows]
+
+    def close(self):
+        """Saves the pending access times and closes the database.
+
+        Later reads and writes are treated as misses and lost writes.
+        """
+        with self._lock:
+            self._closed = True
+            if self._conn is not None:
+                try:
+                    self._save_touched(self._conn)
+                except sqlite3.Error as e:
+                    logger.warning("item store write failed: %s", e)
+                self._conn.close()
+                self._conn = None
+
+    def _save_touched(self, conn):
+        touched, self._touched = self._touched, {}
+        conn.executemany('UPDATE items SET accessed_at = ?'
+                         ' WHERE prefix = ? AND item_id = ?',
+                         [(accessed_at,) + key
+                          for key, accessed_at in touched.items()])
+
+    def _evict(self, conn):
+        count = conn.execute('SELECT COUNT(*) FROM items').fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            conn.execute(
+                'DELETE FROM items WHERE rowid IN (SELECT rowid FROM items'
+                ' ORDER BY accessed_at LIMIT ?)', (excess,))
+            self.evictions += excess
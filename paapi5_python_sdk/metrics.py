@@ -0,0 +1,409 @@
+# coding: utf-8
+
+"""
+  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+  Licensed under the Apache License, Version 2.0 (the "License").
+  You may not use this file except in compliance with the License.
+  A copy of the License is located at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+  or in the "license" file accompanying this file. This file is distributed
+  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+  express or implied. See the License for the specific language governing
+  permissions and limitations under the License.
+"""
+
+"""
+    ProductAdvertisingAPI
+
+    https://webservices.amazon.com/paapi5/documentation/index.html  # noqa: E501
+"""
+
+import bisect
+import math
+import threading
+import weakref
+from collections import OrderedDict
+
+# Latency buckets in seconds, from a cache-speed call to a queued, retried one.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                   10.0, 30.0)
+
+
+class Counter(object):
+    """Monotonic counter with optional labels.
+
+    :param name: Metric name.
+    :param documentation: Help text.
+    :param labelnames: Names of the labels; `inc` takes their values as a
+                       tuple in the same order.
+    """
+
+    type = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels=()):
+        return self._values.get(labels, 0)
+
+    def samples(self):
+        with self._lock:
+            values = list(self._values.items())
+        for labels, value in values:
+            yield self.name, dict(zip(self.labelnames, labels)), value
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    type = 'gauge'
+
+    def set(self, value, labels=()):
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(object):
+    """Distribution of observed values in cumulative buckets.
+
+    :param buckets: Upper bounds of the buckets; `+Inf` is added.
+    """
+
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(),
+                 buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, labels=()):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1),
+                                                0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def samples(self):
+        with self._lock:
+            values = [(labels, list(counts), total)
+                      for labels, (counts, total) in self._values.items()]
+        for labels, counts, total in values:
+            labels = dict(zip(self.labelnames, labels))
+            cumulative = 0
+            for upper, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield (self.name + '_bucket',
+                       dict(labels, le=_format_value(upper)), cumulative)
+            yield self.name + '_sum', labels, total
+            yield self.name + '_count', labels, cumulative
+
+
+class Registry(object):
+    """Set of metrics rendered together in the Prometheus text format.
+
+    Besides metrics updated as events happen, a registry can hold collectors:
+    functions called at every `render` that return metrics built from
+    counters kept elsewhere (e.g. `ItemCache.stats()`). Metrics of the same
+    name returned by several collectors are rendered as one family.
+
+    `counter`, `gauge` and `histogram` return the metric already registered
+    under the name if it has the same type and labels, so several users
+    (e.g. two ApiMetrics) can share it.
+    """
+
+    def __init__(self):
+        self._metrics = OrderedDict()
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(
+                    "Duplicated metric name: {0}".format(metric.name))
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._get_or_register(Counter, name, documentation,
+                                     labelnames)
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._get_or_register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name, documentation, labelnames=(),
+                  buckets=DEFAULT_BUCKETS):
+        return self._get_or_register(Histogram, name, documentation,
+                                     labelnames, buckets)
+
+    def _get_or_register(self, cls, name, documentation, labelnames, *args):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation,
+                                                   labelnames, *args)
+            elif (type(metric) is not cls or
+                    metric.labelnames != tuple(labelnames)):
+                raise ValueError(
+                    "Duplicated metric name: {0}".format(name))
+        return metric
+
+    def add_collector(self, collector):
+        """Adds a function returning a list of metrics to render."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def remove_collector(self, collector):
+        """Removes a collector added with `add_collector`."""
+        with self._lock:
+            if collector in self._collectors:
+                self._collectors.remove(collector)
+
+    def collect(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        for collector in collectors:
+            metrics.extend(collector())
+        return metrics
+
+    def render(self):
+        """Returns every metric in the Prometheus text exposition format."""
+        families = OrderedDict()
+        for metric in self.collect():
+            family = families.setdefault(metric.name, [])
+            if family and family[0].type != metric.type:
+                raise ValueError(
+                    "Duplicated metric name: {0}".format(metric.name))
+            family.append(metric)
+        lines = []
+        for name, family in families.items():
+            lines.append('# HELP {0} {1}'.format(
+                name, _escape_help(family[0].documentation)))
+            lines.append('# TYPE {0} {1}'.format(name, family[0].type))
+            for metric in family:
+                for sample, labels, value in metric.samples():
+                    lines.append('{0}{1} {2}'.format(
+                        sample, _format_labels(labels), _format_value(value)))
+        return '\n'.join(lines) + '\n'
+
+
+def gauges_from_stats(prefix, documentation, stats, counters=(), names=None,
+                      labels=None):
+    """Builds metrics from a `stats()` dict for a registry collector.
+
+    Numeric values become `<prefix>_<name>` gauges, the keys in `counters`
+    become `<prefix>_<name>_total` counters. Other values are skipped.
+
+    :param names: Optional dict renaming stats keys, e.g. to give a metric
+        its unit (`{'wait_time_total': 'wait_seconds'}`). The name defaults
+        to the key, without a trailing `_total`.
+    :param labels: Optional dict of labels set on every metric.
+    """
+    names = names or {}
+    labels = labels or {}
+    labelnames, labelvalues = tuple(labels), tuple(labels.values())
+    metrics = []
+    for key, value in stats.items():
+        if isinstance(value, bool):
+            value = int(value)
+        if not isinstance(value, (int, float)):
+            continue
+        name = names.get(key, key)
+        if name.endswith('_total'):
+            name = name[:-len('_total')]
+        if key in counters:
+            metric = Counter('{0}_{1}_total'.format(prefix, name),
+                             '{0} ({1}).'.format(documentation, key),
+                             labelnames)
+            metric.inc(labelvalues, value)
+        else:
+            metric = Gauge('{0}_{1}'.format(prefix, name),
+                           '{0} ({1}).'.format(documentation, key),
+                           labelnames)
+            metric.set(value, labelvalues)
+        metrics.append(metric)
+    return metrics
+
+
+class ApiMetrics(object):
+    """Prometheus metrics of an ApiClient.
+
+    Pass an instance as `metrics` to ApiClient (or AsyncApiClient). Each
+    call is then counted by operation, HTTP status and PA-API error code
+    and timed (including rate limiter waits and retries). Each HTTP request
+    is counted and timed by the REST client, which also counts the request
+    and response bytes. The item cache, rate limiter, retry policy and
+    single-flight counters of the client are exported at render time, until
+    the client is closed or garbage collected.
+
+    Instances on the same registry share the call metrics. When several
+    clients are watched at once, give each ApiMetrics its own `client` name
+    so their helper counters are told apart by a `client` label.
+
+    :param registry: Registry the metrics are added to.
+    :param client: Optional value of the `client` label of the helper
+        counters.
+    """
+
+    def __init__(self, registry=None, client=None):
+        if registry is None:
+            registry = REGISTRY
+        self.registry = registry
+        self.client = client
+        self._watched = weakref.WeakKeyDictionary()
+        self.calls = registry.counter(
+            'paapi_calls_total',
+            'PA-API calls by operation, HTTP status and error code.',
+            ('operation', 'status', 'error_code'))
+        self.call_seconds = registry.histogram(
+            'paapi_call_duration_seconds',
+            'PA-API call time including rate limiter waits and retries.',
+            ('operation',))
+        self.requests = registry.counter(
+            'paapi_http_requests_total',
+            'HTTP requests sent to PA-API (one per attempt).',
+            ('operation', 'status'))
+        self.request_seconds = registry.histogram(
+            'paapi_http_request_duration_seconds',
+            'Time of one HTTP request to PA-API.',
+            ('operation',))
+        self.request_bytes = registry.counter(
+            'paapi_request_bytes_total',
+            'Request body bytes sent to PA-API.',
+            ('operation',))
+        self.response_bytes = registry.counter(
+            'paapi_response_bytes_total',
+            'Response body bytes received from PA-API.',
+            ('operation',))
+        self.rate_limit_wait_seconds = registry.histogram(
+            'paapi_rate_limit_wait_seconds',
+            'Time spent waiting for a rate limiter slot.')
+
+    def observe_call(self, operation, seconds, error=None):
+        """Records a finished call; `error` is the exception it raised."""
+        status, error_code = 200, ''
+        if error is not None:
+            status = getattr(error, 'status', None) or 0
+            error_codes = getattr(error, 'error_codes', None)
+            error_code = (error_codes[0] if error_codes else None) or ''
+        self.calls.inc((operation, str(status), error_code))
+        self.call_seconds.observe(seconds, (operation,))
+
+    def observe_request(self, operation, status, seconds, request_bytes,
+                        response_bytes):
+        """Records one HTTP request made by the REST client."""
+        self.requests.inc((operation, str(status)))
+        self.request_seconds.observe(seconds, (operation,))
+        if request_bytes:
+            self.request_bytes.inc((operation,), request_bytes)
+        if response_bytes:
+            self.response_bytes.inc((operation,), response_bytes)
+
+    def watch(self, api_client):
+        """Exports the counters of the helpers attached to `api_client`.
+
+        Only a weak reference to the client is kept; its collector is
+        removed by `unwatch` or once the client is garbage collected.
+        """
+        client_ref = weakref.ref(api_client)
+        labels = {'client': self.client} if self.client is not None else None
+
+        def collect():
+            api_client = client_ref()
+            if api_client is None:
+                self.registry.remove_collector(collect)
+                return []
+            metrics = []
+            if api_client.item_cache is not None:
+                metrics.extend(gauges_from_stats(
+                    'paapi_item_cache', 'GetItems item cache',
+                    api_client.item_cache.stats(),
+                    counters=('hits', 'stale_hits', 'misses', 'refreshes',
+                              'evictions'), labels=labels))
+            if api_client.rate_limiter is not None:
+                metrics.extend(gauges_from_stats(
+                    'paapi_rate_limiter', 'PA-API rate limiter',
+                    api_client.rate_limiter.stats(),
+                    counters=('acquired', 'queued', 'timeouts',
+                              'wait_time_total'),
+                    names={'wait_time_total': 'wait_seconds',
+                           'wait_time_max': 'wait_seconds_max',
+                           'wait_time_avg': 'wait_seconds_avg'},
+                    labels=labels))
+            if api_client.retry_policy is not None:
+                metrics.extend(gauges_from_stats(
+                    'paapi_retry', 'PA-API retry policy',
+                    api_client.retry_policy.stats(),
+                    counters=('requests', 'retries', 'throttled', 'exhausted',
+                              'budget_exhausted', 'retry_wait_total'),
+                    names={'retry_wait_total': 'wait_seconds'},
+                    labels=labels))
+            if api_client.single_flight is not None:
+                metrics.extend(gauges_from_stats(
+                    'paapi_single_flight', 'Coalesced PA-API calls',
+                    api_client.single_flight.stats(),
+                    counters=('calls', 'coalesced'), labels=labels))
+            return metrics
+
+        self.unwatch(api_client)
+        self._watched[api_client] = collect
+        self.registry.add_collector(collect)
+
+    def unwatch(self, api_client):
+        """Stops exporting the counters of `api_client`."""
+        collect = self._watched.pop(api_client, None)
+        if collect is not None:
+            self.registry.remove_collector(collect)
+
+
+def operation_of(headers):
+    """Returns the PA-API operation named in a signed request's headers."""
+    target = headers.get('x-amz-target') if headers else None
+    return target.rsplit('.', 1)[-1] if target else ''
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join('{0}="{1}"'.format(name, _escape_label(value))
+                          for name, value in labels.items()) + '}'
+
+
+def _format_value(value):
+    if value == math.inf:
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return repr(value)
+    return str(value)
+
+
+def _escape_label(value):
+    return (str(value).replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n'))
+
+
+def _escape_help(text):
+    return text.replace('\\', '\\\\').replace('\n', '\\n')
+
+
+# Registry used when none is given.
+REGISTRY = Registry()
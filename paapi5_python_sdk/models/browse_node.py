@@ -65,6 +65,18 @@ class BrowseNode(object):
         'sales_rank': 'SalesRank'
     }
 
+    __slots__ = (
+        '_ancestor',
+        '_children',
+        '_context_free_name',
+        '_display_name',
+        '_id',
+        '_is_root',
+        '_sales_rank',
+    )
+
+    discriminator = None
+
     def __init__(self, ancestor=None, children=None, context_free_name=None, display_name=None, id=None, is_root=None, sales_rank=None):  # noqa: E501
         """BrowseNode - a model defined in Swagger"""  # noqa: E501
 
@@ -75,7 +87,6 @@ class BrowseNode(object):
         self._id = None
         self._is_root = None
         self._sales_rank = None
-        self.discriminator = None
 
         if ancestor is not None:
             self.ancestor = ancestor
@@ -279,7 +290,8 @@ class BrowseNode(object):
         if not isinstance(other, BrowseNode):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in BrowseNode.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -56,6 +56,15 @@ class BrowseNodeAncestor(object):
         'id': 'Id'
     }
 
+    __slots__ = (
+        '_ancestor',
+        '_context_free_name',
+        '_display_name',
+        '_id',
+    )
+
+    discriminator = None
+
     def __init__(self, ancestor=None, context_free_name=None, display_name=None, id=None):  # noqa: E501
         """BrowseNodeAncestor - a model defined in Swagger"""  # noqa: E501
 
@@ -63,7 +72,6 @@ class BrowseNodeAncestor(object):
         self._context_free_name = None
         self._display_name = None
         self._id = None
-        self.discriminator = None
 
         if ancestor is not None:
             self.ancestor = ancestor
@@ -198,7 +206,8 @@ class BrowseNodeAncestor(object):
         if not isinstance(other, BrowseNodeAncestor):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in BrowseNodeAncestor.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
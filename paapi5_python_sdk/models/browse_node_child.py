@@ -54,13 +54,20 @@ class BrowseNodeChild(object):
         'id': 'Id'
     }
 
+    __slots__ = (
+        '_context_free_name',
+        '_display_name',
+        '_id',
+    )
+
+    discriminator = None
+
     def __init__(self, context_free_name=None, display_name=None, id=None):  # noqa: E501
         """BrowseNodeChild - a model defined in Swagger"""  # noqa: E501
 
         self._context_free_name = None
         self._display_name = None
         self._id = None
-        self.discriminator = None
 
         if context_free_name is not None:
             self.context_free_name = context_free_name
@@ -172,7 +179,8 @@ class BrowseNodeChild(object):
         if not isinstance(other, BrowseNodeChild):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in BrowseNodeChild.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -55,12 +55,18 @@ class BrowseNodeInfo(object):
         'website_sales_rank': 'WebsiteSalesRank'
     }
 
+    __slots__ = (
+        '_browse_nodes',
+        '_website_sales_rank',
+    )
+
+    discriminator = None
+
     def __init__(self, browse_nodes=None, website_sales_rank=None):  # noqa: E501
         """BrowseNodeInfo - a model defined in Swagger"""  # noqa: E501
 
         self._browse_nodes = None
         self._website_sales_rank = None
-        self.discriminator = None
 
         if browse_nodes is not None:
             self.browse_nodes = browse_nodes
@@ -149,7 +155,8 @@ class BrowseNodeInfo(object):
         if not isinstance(other, BrowseNodeInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in BrowseNodeInfo.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -52,11 +52,16 @@ class BrowseNodesResult(object):
         'browse_nodes': 'BrowseNodes'
     }
 
+    __slots__ = (
+        '_browse_nodes',
+    )
+
+    discriminator = None
+
     def __init__(self, browse_nodes=None):  # noqa: E501
         """BrowseNodesResult - a model defined in Swagger"""  # noqa: E501
 
         self._browse_nodes = None
-        self.discriminator = None
 
         if browse_nodes is not None:
             self.browse_nodes = browse_nodes
@@ -122,7 +127,8 @@ class BrowseNodesResult(object):
         if not isinstance(other, BrowseNodesResult):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in BrowseNodesResult.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
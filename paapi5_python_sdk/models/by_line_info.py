@@ -57,13 +57,20 @@ class ByLineInfo(object):
         'manufacturer': 'Manufacturer'
     }
 
+    __slots__ = (
+        '_brand',
+        '_contributors',
+        '_manufacturer',
+    )
+
+    discriminator = None
+
     def __init__(self, brand=None, contributors=None, manufacturer=None):  # noqa: E501
         """ByLineInfo - a model defined in Swagger"""  # noqa: E501
 
         self._brand = None
         self._contributors = None
         self._manufacturer = None
-        self.discriminator = None
 
         if brand is not None:
             self.brand = brand
@@ -175,7 +182,8 @@ class ByLineInfo(object):
         if not isinstance(other, ByLineInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in ByLineInfo.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -54,12 +54,18 @@ class Classifications(object):
         'product_group': 'ProductGroup'
     }
 
+    __slots__ = (
+        '_binding',
+        '_product_group',
+    )
+
+    discriminator = None
+
     def __init__(self, binding=None, product_group=None):  # noqa: E501
         """Classifications - a model defined in Swagger"""  # noqa: E501
 
         self._binding = None
         self._product_group = None
-        self.discriminator = None
 
         if binding is not None:
             self.binding = binding
@@ -148,7 +154,8 @@ class Classifications(object):
         if not isinstance(other, Classifications):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in Classifications.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -57,9 +57,12 @@ class Condition(object):
     attribute_map = {
     }
 
+    __slots__ = ()
+
+    discriminator = None
+
     def __init__(self):  # noqa: E501
         """Condition - a model defined in Swagger"""  # noqa: E501
-        self.discriminator = None
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -101,7 +104,8 @@ class Condition(object):
         if not isinstance(other, Condition):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in Condition.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
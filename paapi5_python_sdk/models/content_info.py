@@ -60,6 +60,15 @@ class ContentInfo(object):
         'publication_date': 'PublicationDate'
     }
 
+    __slots__ = (
+        '_edition',
+        '_languages',
+        '_pages_count',
+        '_publication_date',
+    )
+
+    discriminator = None
+
     def __init__(self, edition=None, languages=None, pages_count=None, publication_date=None):  # noqa: E501
         """ContentInfo - a model defined in Swagger"""  # noqa: E501
 
@@ -67,7 +76,6 @@ class ContentInfo(object):
         self._languages = None
         self._pages_count = None
         self._publication_date = None
-        self.discriminator = None
 
         if edition is not None:
             self.edition = edition
@@ -202,7 +210,8 @@ class ContentInfo(object):
         if not isinstance(other, ContentInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in ContentInfo.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -52,11 +52,16 @@ class ContentRating(object):
         'audience_rating': 'AudienceRating'
     }
 
+    __slots__ = (
+        '_audience_rating',
+    )
+
+    discriminator = None
+
     def __init__(self, audience_rating=None):  # noqa: E501
         """ContentRating - a model defined in Swagger"""  # noqa: E501
 
         self._audience_rating = None
-        self.discriminator = None
 
         if audience_rating is not None:
             self.audience_rating = audience_rating
@@ -122,7 +127,8 @@ class ContentRating(object):
         if not isinstance(other, ContentRating):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in ContentRating.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
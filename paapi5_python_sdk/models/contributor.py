@@ -56,6 +56,15 @@ class Contributor(object):
         'role_type': 'RoleType'
     }
 
+    __slots__ = (
+        '_locale',
+        '_name',
+        '_role',
+        '_role_type',
+    )
+
+    discriminator = None
+
     def __init__(self, locale=None, name=None, role=None, role_type=None):  # noqa: E501
         """Contributor - a model defined in Swagger"""  # noqa: E501
 
@@ -63,7 +72,6 @@ class Contributor(object):
         self._name = None
         self._role = None
         self._role_type = None
-        self.discriminator = None
 
         if locale is not None:
             self.locale = locale
@@ -198,7 +206,8 @@ class Contributor(object):
         if not isinstance(other, Contributor):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in Contributor.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
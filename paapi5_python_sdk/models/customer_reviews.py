@@ -54,12 +54,18 @@ class CustomerReviews(object):
         'star_rating': 'StarRating'
     }
 
+    __slots__ = (
+        '_count',
+        '_star_rating',
+    )
+
+    discriminator = None
+
     def __init__(self, count=None, star_rating=None):  # noqa: E501
         """CustomerReviews - a model defined in Swagger"""  # noqa: E501
 
         self._count = None
         self._star_rating = None
-        self.discriminator = None
 
         if count is not None:
             self.count = count
@@ -148,7 +154,8 @@ class CustomerReviews(object):
         if not isinstance(other, CustomerReviews):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in CustomerReviews.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -58,6 +58,15 @@ class DimensionBasedAttribute(object):
         'width': 'Width'
     }
 
+    __slots__ = (
+        '_height',
+        '_length',
+        '_weight',
+        '_width',
+    )
+
+    discriminator = None
+
     def __init__(self, height=None, length=None, weight=None, width=None):  # noqa: E501
         """DimensionBasedAttribute - a model defined in Swagger"""  # noqa: E501
 
@@ -65,7 +74,6 @@ class DimensionBasedAttribute(object):
         self._length = None
         self._weight = None
         self._width = None
-        self.discriminator = None
 
         if height is not None:
             self.height = height
@@ -200,7 +208,8 @@ class DimensionBasedAttribute(object):
         if not isinstance(other, DimensionBasedAttribute):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in DimensionBasedAttribute.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -55,12 +55,18 @@ class DurationPrice(object):
         'duration': 'Duration'
     }
 
+    __slots__ = (
+        '_price',
+        '_duration',
+    )
+
+    discriminator = None
+
     def __init__(self, price=None, duration=None):  # noqa: E501
         """DurationPrice - a model defined in Swagger"""  # noqa: E501
 
         self._price = None
         self._duration = None
-        self.discriminator = None
 
         if price is not None:
             self.price = price
@@ -149,7 +155,8 @@ class DurationPrice(object):
         if not isinstance(other, DurationPrice):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in DurationPrice.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
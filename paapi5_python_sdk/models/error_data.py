@@ -52,12 +52,18 @@ class ErrorData(object):
         'message': 'Message'
     }
 
+    __slots__ = (
+        '_code',
+        '_message',
+    )
+
+    discriminator = None
+
     def __init__(self, code=None, message=None):  # noqa: E501
         """ErrorData - a model defined in Swagger"""  # noqa: E501
 
         self._code = None
         self._message = None
-        self.discriminator = None
 
         if code is not None:
             self.code = code
@@ -146,7 +152,8 @@ class ErrorData(object):
         if not isinstance(other, ErrorData):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in ErrorData.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -56,13 +56,20 @@ class ExternalIds(object):
         'up_cs': 'UPCs'
     }
 
+    __slots__ = (
+        '_ea_ns',
+        '_isb_ns',
+        '_up_cs',
+    )
+
+    discriminator = None
+
     def __init__(self, ea_ns=None, isb_ns=None, up_cs=None):  # noqa: E501
         """ExternalIds - a model defined in Swagger"""  # noqa: E501
 
         self._ea_ns = None
         self._isb_ns = None
         self._up_cs = None
-        self.discriminator = None
 
         if ea_ns is not None:
             self.ea_ns = ea_ns
@@ -174,7 +181,8 @@ class ExternalIds(object):
         if not isinstance(other, ExternalIds):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in ExternalIds.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -63,6 +63,17 @@ class GetBrowseNodesRequest(object):
         'resources': 'Resources'
     }
 
+    __slots__ = (
+        '_browse_node_ids',
+        '_languages_of_preference',
+        '_marketplace',
+        '_partner_tag',
+        '_partner_type',
+        '_resources',
+    )
+
+    discriminator = None
+
     def __init__(self, browse_node_ids=None, languages_of_preference=None, marketplace=None, partner_tag=None, partner_type=None, resources=None):  # noqa: E501
         """GetBrowseNodesRequest - a model defined in Swagger"""  # noqa: E501
 
@@ -72,7 +83,6 @@ class GetBrowseNodesRequest(object):
         self._partner_tag = None
         self._partner_type = None
         self._resources = None
-        self.discriminator = None
 
         self.browse_node_ids = browse_node_ids
         if languages_of_preference is not None:
@@ -256,7 +266,8 @@ class GetBrowseNodesRequest(object):
         if not isinstance(other, GetBrowseNodesRequest):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in GetBrowseNodesRequest.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -55,12 +55,18 @@ class GetBrowseNodesResponse(object):
         'errors': 'Errors'
     }
 
+    __slots__ = (
+        '_browse_nodes_result',
+        '_errors',
+    )
+
+    discriminator = None
+
     def __init__(self, browse_nodes_result=None, errors=None):  # noqa: E501
         """GetBrowseNodesResponse - a model defined in Swagger"""  # noqa: E501
 
         self._browse_nodes_result = None
         self._errors = None
-        self.discriminator = None
 
         if browse_nodes_result is not None:
             self.browse_nodes_result = browse_nodes_result
@@ -149,7 +155,8 @@ class GetBrowseNodesResponse(object):
         if not isinstance(other, GetBrowseNodesResponse):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in GetBrowseNodesResponse.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -80,6 +80,23 @@ class GetItemsRequest(object):
         'resources': 'Resources'
     }
 
+    __slots__ = (
+        '_condition',
+        '_currency_of_preference',
+        '_item_ids',
+        '_item_id_type',
+        '_languages_of_preference',
+        '_marketplace',
+        '_merchant',
+        '_offer_count',
+        '_partner_tag',
+        '_partner_type',
+        '_properties',
+        '_resources',
+    )
+
+    discriminator = None
+
     def __init__(self, condition=None, currency_of_preference=None, item_ids=None, item_id_type=None, languages_of_preference=None, marketplace=None, merchant=None, offer_count=None, partner_tag=None, partner_type=None, properties=None, resources=None):  # noqa: E501
         """GetItemsRequest - a model defined in Swagger"""  # noqa: E501
 
@@ -95,7 +112,6 @@ class GetItemsRequest(object):
         self._partner_type = None
         self._properties = None
         self._resources = None
-        self.discriminator = None
 
         if condition is not None:
             self.condition = condition
@@ -417,7 +433,8 @@ class GetItemsRequest(object):
         if not isinstance(other, GetItemsRequest):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in GetItemsRequest.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
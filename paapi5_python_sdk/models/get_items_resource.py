@@ -111,9 +111,12 @@ class GetItemsResource(object):
     attribute_map = {
     }
 
+    __slots__ = ()
+
+    discriminator = None
+
     def __init__(self):  # noqa: E501
         """GetItemsResource - a model defined in Swagger"""  # noqa: E501
-        self.discriminator = None
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -155,7 +158,8 @@ class GetItemsResource(object):
         if not isinstance(other, GetItemsResource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in GetItemsResource.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -55,12 +55,18 @@ class GetItemsResponse(object):
         'items_result': 'ItemsResult'
     }
 
+    __slots__ = (
+        '_errors',
+        '_items_result',
+    )
+
+    discriminator = None
+
     def __init__(self, errors=None, items_result=None):  # noqa: E501
         """GetItemsResponse - a model defined in Swagger"""  # noqa: E501
 
         self._errors = None
         self._items_result = None
-        self.discriminator = None
 
         if errors is not None:
             self.errors = errors
@@ -149,7 +155,8 @@ class GetItemsResponse(object):
         if not isinstance(other, GetItemsResponse):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in GetItemsResponse.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
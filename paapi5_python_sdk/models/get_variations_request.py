@@ -81,6 +81,24 @@ class GetVariationsRequest(object):
         'variation_page': 'VariationPage'
     }
 
+    __slots__ = (
+        '_asin',
+        '_condition',
+        '_currency_of_preference',
+        '_languages_of_preference',
+        '_marketplace',
+        '_merchant',
+        '_offer_count',
+        '_partner_tag',
+        '_partner_type',
+        '_properties',
+        '_resources',
+        '_variation_count',
+        '_variation_page',
+    )
+
+    discriminator = None
+
     def __init__(self, asin=None, condition=None, currency_of_preference=None, languages_of_preference=None, marketplace=None, merchant=None, offer_count=None, partner_tag=None, partner_type=None, properties=None, resources=None, variation_count=None, variation_page=None):  # noqa: E501
         """GetVariationsRequest - a model defined in Swagger"""  # noqa: E501
 
@@ -97,7 +115,6 @@ class GetVariationsRequest(object):
         self._resources = None
         self._variation_count = None
         self._variation_page = None
-        self.discriminator = None
 
         self.asin = asin
         if condition is not None:
@@ -442,7 +459,8 @@ class GetVariationsRequest(object):
         if not isinstance(other, GetVariationsRequest):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in GetVariationsRequest.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
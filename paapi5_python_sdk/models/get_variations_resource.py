@@ -114,9 +114,12 @@ class GetVariationsResource(object):
     attribute_map = {
     }
 
+    __slots__ = ()
+
+    discriminator = None
+
     def __init__(self):  # noqa: E501
         """GetVariationsResource - a model defined in Swagger"""  # noqa: E501
-        self.discriminator = None
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -158,7 +161,8 @@ class GetVariationsResource(object):
         if not isinstance(other, GetVariationsResource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in GetVariationsResource.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
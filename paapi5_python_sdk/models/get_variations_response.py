@@ -55,12 +55,18 @@ class GetVariationsResponse(object):
         'variations_result': 'VariationsResult'
     }
 
+    __slots__ = (
+        '_errors',
+        '_variations_result',
+    )
+
+    discriminator = None
+
     def __init__(self, errors=None, variations_result=None):  # noqa: E501
         """GetVariationsResponse - a model defined in Swagger"""  # noqa: E501
 
         self._errors = None
         self._variations_result = None
-        self.discriminator = None
 
         if errors is not None:
             self.errors = errors
@@ -149,7 +155,8 @@ class GetVariationsResponse(object):
         if not isinstance(other, GetVariationsResponse):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in GetVariationsResponse.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
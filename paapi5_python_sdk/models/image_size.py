@@ -54,13 +54,20 @@ class ImageSize(object):
         'width': 'Width'
     }
 
+    __slots__ = (
+        '_url',
+        '_height',
+        '_width',
+    )
+
+    discriminator = None
+
     def __init__(self, url=None, height=None, width=None):  # noqa: E501
         """ImageSize - a model defined in Swagger"""  # noqa: E501
 
         self._url = None
         self._height = None
         self._width = None
-        self.discriminator = None
 
         if url is not None:
             self.url = url
@@ -172,7 +179,8 @@ class ImageSize(object):
         if not isinstance(other, ImageSize):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in ImageSize.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -56,13 +56,20 @@ class ImageType(object):
         'large': 'Large'
     }
 
+    __slots__ = (
+        '_small',
+        '_medium',
+        '_large',
+    )
+
+    discriminator = None
+
     def __init__(self, small=None, medium=None, large=None):  # noqa: E501
         """ImageType - a model defined in Swagger"""  # noqa: E501
 
         self._small = None
         self._medium = None
         self._large = None
-        self.discriminator = None
 
         if small is not None:
             self.small = small
@@ -174,7 +181,8 @@ class ImageType(object):
         if not isinstance(other, ImageType):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in ImageType.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
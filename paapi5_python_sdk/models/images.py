@@ -54,12 +54,18 @@ class Images(object):
         'variants': 'Variants'
     }
 
+    __slots__ = (
+        '_primary',
+        '_variants',
+    )
+
+    discriminator = None
+
     def __init__(self, primary=None, variants=None):  # noqa: E501
         """Images - a model defined in Swagger"""  # noqa: E501
 
         self._primary = None
         self._variants = None
-        self.discriminator = None
 
         if primary is not None:
             self.primary = primary
@@ -148,7 +154,8 @@ class Images(object):
         if not isinstance(other, Images):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in Images.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -78,6 +78,22 @@ class Item(object):
         'variation_attributes': 'VariationAttributes'
     }
 
+    __slots__ = (
+        '_asin',
+        '_browse_node_info',
+        '_customer_reviews',
+        '_detail_page_url',
+        '_images',
+        '_item_info',
+        '_offers',
+        '_parent_asin',
+        '_rental_offers',
+        '_score',
+        '_variation_attributes',
+    )
+
+    discriminator = None
+
     def __init__(self, asin=None, browse_node_info=None, customer_reviews=None, detail_page_url=None, images=None, item_info=None, offers=None, parent_asin=None, rental_offers=None, score=None, variation_attributes=None):  # noqa: E501
         """Item - a model defined in Swagger"""  # noqa: E501
 
@@ -92,7 +108,6 @@ class Item(object):
         self._rental_offers = None
         self._score = None
         self._variation_attributes = None
-        self.discriminator = None
 
         if asin is not None:
             self.asin = asin
@@ -388,7 +403,8 @@ class Item(object):
         if not isinstance(other, Item):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in Item.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
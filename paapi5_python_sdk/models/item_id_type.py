@@ -53,9 +53,12 @@ class ItemIdType(object):
     attribute_map = {
     }
 
+    __slots__ = ()
+
+    discriminator = None
+
     def __init__(self):  # noqa: E501
         """ItemIdType - a model defined in Swagger"""  # noqa: E501
-        self.discriminator = None
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -97,7 +100,8 @@ class ItemIdType(object):
         if not isinstance(other, ItemIdType):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in ItemIdType.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
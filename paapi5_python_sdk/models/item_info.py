@@ -82,6 +82,22 @@ class ItemInfo(object):
         'trade_in_info': 'TradeInInfo'
     }
 
+    __slots__ = (
+        '_by_line_info',
+        '_classifications',
+        '_content_info',
+        '_content_rating',
+        '_external_ids',
+        '_features',
+        '_manufacture_info',
+        '_product_info',
+        '_technical_info',
+        '_title',
+        '_trade_in_info',
+    )
+
+    discriminator = None
+
     def __init__(self, by_line_info=None, classifications=None, content_info=None, content_rating=None, external_ids=None, features=None, manufacture_info=None, product_info=None, technical_info=None, title=None, trade_in_info=None):  # noqa: E501
         """ItemInfo - a model defined in Swagger"""  # noqa: E501
 
@@ -96,7 +112,6 @@ class ItemInfo(object):
         self._technical_info = None
         self._title = None
         self._trade_in_info = None
-        self.discriminator = None
 
         if by_line_info is not None:
             self.by_line_info = by_line_info
@@ -392,7 +407,8 @@ class ItemInfo(object):
         if not isinstance(other, ItemInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in ItemInfo.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -52,11 +52,16 @@ class ItemsResult(object):
         'items': 'Items'
     }
 
+    __slots__ = (
+        '_items',
+    )
+
+    discriminator = None
+
     def __init__(self, items=None):  # noqa: E501
         """ItemsResult - a model defined in Swagger"""  # noqa: E501
 
         self._items = None
-        self.discriminator = None
 
         if items is not None:
             self.items = items
@@ -122,7 +127,8 @@ class ItemsResult(object):
         if not isinstance(other, ItemsResult):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in ItemsResult.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
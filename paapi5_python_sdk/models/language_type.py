@@ -52,12 +52,18 @@ class LanguageType(object):
         'type': 'Type'
     }
 
+    __slots__ = (
+        '_display_value',
+        '_type',
+    )
+
+    discriminator = None
+
     def __init__(self, display_value=None, type=None):  # noqa: E501
         """LanguageType - a model defined in Swagger"""  # noqa: E501
 
         self._display_value = None
         self._type = None
-        self.discriminator = None
 
         if display_value is not None:
             self.display_value = display_value
@@ -146,7 +152,8 @@ class LanguageType(object):
         if not isinstance(other, LanguageType):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in LanguageType.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -56,13 +56,20 @@ class Languages(object):
         'locale': 'Locale'
     }
 
+    __slots__ = (
+        '_display_values',
+        '_label',
+        '_locale',
+    )
+
+    discriminator = None
+
     def __init__(self, display_values=None, label=None, locale=None):  # noqa: E501
         """Languages - a model defined in Swagger"""  # noqa: E501
 
         self._display_values = None
         self._label = None
         self._locale = None
-        self.discriminator = None
 
         if display_values is not None:
             self.display_values = display_values
@@ -174,7 +181,8 @@ class Languages(object):
         if not isinstance(other, Languages):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in Languages.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -56,13 +56,20 @@ class ManufactureInfo(object):
         'warranty': 'Warranty'
     }
 
+    __slots__ = (
+        '_item_part_number',
+        '_model',
+        '_warranty',
+    )
+
+    discriminator = None
+
     def __init__(self, item_part_number=None, model=None, warranty=None):  # noqa: E501
         """ManufactureInfo - a model defined in Swagger"""  # noqa: E501
 
         self._item_part_number = None
         self._model = None
         self._warranty = None
-        self.discriminator = None
 
         if item_part_number is not None:
             self.item_part_number = item_part_number
@@ -174,7 +181,8 @@ class ManufactureInfo(object):
         if not isinstance(other, ManufactureInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in ManufactureInfo.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -48,9 +48,12 @@ class MaxPrice(object):
     attribute_map = {
     }
 
+    __slots__ = ()
+
+    discriminator = None
+
     def __init__(self):  # noqa: E501
         """MaxPrice - a model defined in Swagger"""  # noqa: E501
-        self.discriminator = None
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -92,7 +95,8 @@ class MaxPrice(object):
         if not isinstance(other, MaxPrice):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in MaxPrice.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -54,9 +54,12 @@ class Merchant(object):
     attribute_map = {
     }
 
+    __slots__ = ()
+
+    discriminator = None
+
     def __init__(self):  # noqa: E501
         """Merchant - a model defined in Swagger"""  # noqa: E501
-        self.discriminator = None
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -98,7 +101,8 @@ class Merchant(object):
         if not isinstance(other, Merchant):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in Merchant.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -48,9 +48,12 @@ class MinReviewsRating(object):
     attribute_map = {
     }
 
+    __slots__ = ()
+
+    discriminator = None
+
     def __init__(self):  # noqa: E501
         """MinReviewsRating - a model defined in Swagger"""  # noqa: E501
-        self.discriminator = None
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -92,7 +95,8 @@ class MinReviewsRating(object):
         if not isinstance(other, MinReviewsRating):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in MinReviewsRating.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
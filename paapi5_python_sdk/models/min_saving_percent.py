@@ -48,9 +48,12 @@ class MinSavingPercent(object):
     attribute_map = {
     }
 
+    __slots__ = ()
+
+    discriminator = None
+
     def __init__(self):  # noqa: E501
         """MinSavingPercent - a model defined in Swagger"""  # noqa: E501
-        self.discriminator = None
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -92,7 +95,8 @@ class MinSavingPercent(object):
         if not isinstance(other, MinSavingPercent):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in MinSavingPercent.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
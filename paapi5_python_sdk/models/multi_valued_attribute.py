@@ -54,13 +54,20 @@ class MultiValuedAttribute(object):
         'locale': 'Locale'
     }
 
+    __slots__ = (
+        '_display_values',
+        '_label',
+        '_locale',
+    )
+
+    discriminator = None
+
     def __init__(self, display_values=None, label=None, locale=None):  # noqa: E501
         """MultiValuedAttribute - a model defined in Swagger"""  # noqa: E501
 
         self._display_values = None
         self._label = None
         self._locale = None
-        self.discriminator = None
 
         if display_values is not None:
             self.display_values = display_values
@@ -172,7 +179,8 @@ class MultiValuedAttribute(object):
         if not isinstance(other, MultiValuedAttribute):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in MultiValuedAttribute.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -56,6 +56,15 @@ class OfferAvailability(object):
         'type': 'Type'
     }
 
+    __slots__ = (
+        '_max_order_quantity',
+        '_message',
+        '_min_order_quantity',
+        '_type',
+    )
+
+    discriminator = None
+
     def __init__(self, max_order_quantity=None, message=None, min_order_quantity=None, type=None):  # noqa: E501
         """OfferAvailability - a model defined in Swagger"""  # noqa: E501
 
@@ -63,7 +72,6 @@ class OfferAvailability(object):
         self._message = None
         self._min_order_quantity = None
         self._type = None
-        self.discriminator = None
 
         if max_order_quantity is not None:
             self.max_order_quantity = max_order_quantity
@@ -198,7 +206,8 @@ class OfferAvailability(object):
         if not isinstance(other, OfferAvailability):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in OfferAvailability.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -63,6 +63,17 @@ class OfferCondition(object):
         'condition_note': 'ConditionNote'
     }
 
+    __slots__ = (
+        '_display_value',
+        '_label',
+        '_locale',
+        '_value',
+        '_sub_condition',
+        '_condition_note',
+    )
+
+    discriminator = None
+
     def __init__(self, display_value=None, label=None, locale=None, value=None, sub_condition=None, condition_note=None):  # noqa: E501
         """OfferCondition - a model defined in Swagger"""  # noqa: E501
 
@@ -72,7 +83,6 @@ class OfferCondition(object):
         self._value = None
         self._sub_condition = None
         self._condition_note = None
-        self.discriminator = None
 
         if display_value is not None:
             self.display_value = display_value
@@ -253,7 +263,8 @@ class OfferCondition(object):
         if not isinstance(other, OfferCondition):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in OfferCondition.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -52,12 +52,18 @@ class OfferConditionNote(object):
         'value': 'Value'
     }
 
+    __slots__ = (
+        '_locale',
+        '_value',
+    )
+
+    discriminator = None
+
     def __init__(self, locale=None, value=None):  # noqa: E501
         """OfferConditionNote - a model defined in Swagger"""  # noqa: E501
 
         self._locale = None
         self._value = None
-        self.discriminator = None
 
         if locale is not None:
             self.locale = locale
@@ -146,7 +152,8 @@ class OfferConditionNote(object):
         if not isinstance(other, OfferConditionNote):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in OfferConditionNote.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
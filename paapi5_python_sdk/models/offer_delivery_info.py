@@ -58,6 +58,15 @@ class OfferDeliveryInfo(object):
         'shipping_charges': 'ShippingCharges'
     }
 
+    __slots__ = (
+        '_is_amazon_fulfilled',
+        '_is_free_shipping_eligible',
+        '_is_prime_eligible',
+        '_shipping_charges',
+    )
+
+    discriminator = None
+
     def __init__(self, is_amazon_fulfilled=None, is_free_shipping_eligible=None, is_prime_eligible=None, shipping_charges=None):  # noqa: E501
         """OfferDeliveryInfo - a model defined in Swagger"""  # noqa: E501
 
@@ -65,7 +74,6 @@ class OfferDeliveryInfo(object):
         self._is_free_shipping_eligible = None
         self._is_prime_eligible = None
         self._shipping_charges = None
-        self.discriminator = None
 
         if is_amazon_fulfilled is not None:
             self.is_amazon_fulfilled = is_amazon_fulfilled
@@ -200,7 +208,8 @@ class OfferDeliveryInfo(object):
         if not isinstance(other, OfferDeliveryInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in OfferDeliveryInfo.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -81,6 +81,23 @@ class OfferListing(object):
         'violates_map': 'ViolatesMAP'
     }
 
+    __slots__ = (
+        '_availability',
+        '_condition',
+        '_delivery_info',
+        '_id',
+        '_is_buy_box_winner',
+        '_loyalty_points',
+        '_merchant_info',
+        '_price',
+        '_program_eligibility',
+        '_promotions',
+        '_saving_basis',
+        '_violates_map',
+    )
+
+    discriminator = None
+
     def __init__(self, availability=None, condition=None, delivery_info=None, id=None, is_buy_box_winner=None, loyalty_points=None, merchant_info=None, price=None, program_eligibility=None, promotions=None, saving_basis=None, violates_map=None):  # noqa: E501
         """OfferListing - a model defined in Swagger"""  # noqa: E501
 
@@ -96,7 +113,6 @@ class OfferListing(object):
         self._promotions = None
         self._saving_basis = None
         self._violates_map = None
-        self.discriminator = None
 
         if availability is not None:
             self.availability = availability
@@ -415,7 +431,8 @@ class OfferListing(object):
         if not isinstance(other, OfferListing):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in OfferListing.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -50,11 +50,16 @@ class OfferLoyaltyPoints(object):
         'points': 'Points'
     }
 
+    __slots__ = (
+        '_points',
+    )
+
+    discriminator = None
+
     def __init__(self, points=None):  # noqa: E501
         """OfferLoyaltyPoints - a model defined in Swagger"""  # noqa: E501
 
         self._points = None
-        self.discriminator = None
 
         if points is not None:
             self.points = points
@@ -120,7 +125,8 @@ class OfferLoyaltyPoints(object):
         if not isinstance(other, OfferLoyaltyPoints):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in OfferLoyaltyPoints.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
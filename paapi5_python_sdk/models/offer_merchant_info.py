@@ -58,6 +58,16 @@ class OfferMerchantInfo(object):
         'name': 'Name'
     }
 
+    __slots__ = (
+        '_default_shipping_country',
+        '_feedback_count',
+        '_feedback_rating',
+        '_id',
+        '_name',
+    )
+
+    discriminator = None
+
     def __init__(self, default_shipping_country=None, feedback_count=None, feedback_rating=None, id=None, name=None):  # noqa: E501
         """OfferMerchantInfo - a model defined in Swagger"""  # noqa: E501
 
@@ -66,7 +76,6 @@ class OfferMerchantInfo(object):
         self._feedback_rating = None
         self._id = None
         self._name = None
-        self.discriminator = None
 
         if default_shipping_country is not None:
             self.default_shipping_country = default_shipping_country
@@ -224,7 +233,8 @@ class OfferMerchantInfo(object):
         if not isinstance(other, OfferMerchantInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in OfferMerchantInfo.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -65,6 +65,18 @@ class OfferPrice(object):
         'savings': 'Savings'
     }
 
+    __slots__ = (
+        '_amount',
+        '_currency',
+        '_display_amount',
+        '_price_per_unit',
+        '_price_type',
+        '_price_type_label',
+        '_savings',
+    )
+
+    discriminator = None
+
     def __init__(self, amount=None, currency=None, display_amount=None, price_per_unit=None, price_type=None, price_type_label=None, savings=None):  # noqa: E501
         """OfferPrice - a model defined in Swagger"""  # noqa: E501
 
@@ -75,7 +87,6 @@ class OfferPrice(object):
         self._price_type = None
         self._price_type_label = None
         self._savings = None
-        self.discriminator = None
 
         if amount is not None:
             self.amount = amount
@@ -279,7 +290,8 @@ class OfferPrice(object):
         if not isinstance(other, OfferPrice):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in OfferPrice.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -52,12 +52,18 @@ class OfferProgramEligibility(object):
         'is_prime_pantry': 'IsPrimePantry'
     }
 
+    __slots__ = (
+        '_is_prime_exclusive',
+        '_is_prime_pantry',
+    )
+
+    discriminator = None
+
     def __init__(self, is_prime_exclusive=None, is_prime_pantry=None):  # noqa: E501
         """OfferProgramEligibility - a model defined in Swagger"""  # noqa: E501
 
         self._is_prime_exclusive = None
         self._is_prime_pantry = None
-        self.discriminator = None
 
         if is_prime_exclusive is not None:
             self.is_prime_exclusive = is_prime_exclusive
@@ -146,7 +152,8 @@ class OfferProgramEligibility(object):
         if not isinstance(other, OfferProgramEligibility):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in OfferProgramEligibility.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
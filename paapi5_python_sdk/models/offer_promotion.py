@@ -60,6 +60,17 @@ class OfferPromotion(object):
         'type': 'Type'
     }
 
+    __slots__ = (
+        '_amount',
+        '_currency',
+        '_discount_percent',
+        '_display_amount',
+        '_price_per_unit',
+        '_type',
+    )
+
+    discriminator = None
+
     def __init__(self, amount=None, currency=None, discount_percent=None, display_amount=None, price_per_unit=None, type=None):  # noqa: E501
         """OfferPromotion - a model defined in Swagger"""  # noqa: E501
 
@@ -69,7 +80,6 @@ class OfferPromotion(object):
         self._display_amount = None
         self._price_per_unit = None
         self._type = None
-        self.discriminator = None
 
         if amount is not None:
             self.amount = amount
@@ -250,7 +260,8 @@ class OfferPromotion(object):
         if not isinstance(other, OfferPromotion):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in OfferPromotion.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
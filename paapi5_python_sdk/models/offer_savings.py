@@ -58,6 +58,16 @@ class OfferSavings(object):
         'price_per_unit': 'PricePerUnit'
     }
 
+    __slots__ = (
+        '_amount',
+        '_currency',
+        '_display_amount',
+        '_percentage',
+        '_price_per_unit',
+    )
+
+    discriminator = None
+
     def __init__(self, amount=None, currency=None, display_amount=None, percentage=None, price_per_unit=None):  # noqa: E501
         """OfferSavings - a model defined in Swagger"""  # noqa: E501
 
@@ -66,7 +76,6 @@ class OfferSavings(object):
         self._display_amount = None
         self._percentage = None
         self._price_per_unit = None
-        self.discriminator = None
 
         if amount is not None:
             self.amount = amount
@@ -224,7 +233,8 @@ class OfferSavings(object):
         if not isinstance(other, OfferSavings):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in OfferSavings.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
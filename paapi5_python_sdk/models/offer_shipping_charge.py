@@ -58,6 +58,16 @@ class OfferShippingCharge(object):
         'type': 'Type'
     }
 
+    __slots__ = (
+        '_amount',
+        '_currency',
+        '_display_amount',
+        '_is_rate_tax_inclusive',
+        '_type',
+    )
+
+    discriminator = None
+
     def __init__(self, amount=None, currency=None, display_amount=None, is_rate_tax_inclusive=None, type=None):  # noqa: E501
         """OfferShippingCharge - a model defined in Swagger"""  # noqa: E501
 
@@ -66,7 +76,6 @@ class OfferShippingCharge(object):
         self._display_amount = None
         self._is_rate_tax_inclusive = None
         self._type = None
-        self.discriminator = None
 
         if amount is not None:
             self.amount = amount
@@ -224,7 +233,8 @@ class OfferShippingCharge(object):
         if not isinstance(other, OfferShippingCharge):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in OfferShippingCharge.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
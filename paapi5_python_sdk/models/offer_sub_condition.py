@@ -56,6 +56,15 @@ class OfferSubCondition(object):
         'value': 'Value'
     }
 
+    __slots__ = (
+        '_display_value',
+        '_label',
+        '_locale',
+        '_value',
+    )
+
+    discriminator = None
+
     def __init__(self, display_value=None, label=None, locale=None, value=None):  # noqa: E501
         """OfferSubCondition - a model defined in Swagger"""  # noqa: E501
 
@@ -63,7 +72,6 @@ class OfferSubCondition(object):
         self._label = None
         self._locale = None
         self._value = None
-        self.discriminator = None
 
         if display_value is not None:
             self.display_value = display_value
@@ -198,7 +206,8 @@ class OfferSubCondition(object):
         if not isinstance(other, OfferSubCondition):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in OfferSubCondition.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
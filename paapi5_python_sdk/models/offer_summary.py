@@ -59,6 +59,15 @@ class OfferSummary(object):
         'offer_count': 'OfferCount'
     }
 
+    __slots__ = (
+        '_condition',
+        '_highest_price',
+        '_lowest_price',
+        '_offer_count',
+    )
+
+    discriminator = None
+
     def __init__(self, condition=None, highest_price=None, lowest_price=None, offer_count=None):  # noqa: E501
         """OfferSummary - a model defined in Swagger"""  # noqa: E501
 
@@ -66,7 +75,6 @@ class OfferSummary(object):
         self._highest_price = None
         self._lowest_price = None
         self._offer_count = None
-        self.discriminator = None
 
         if condition is not None:
             self.condition = condition
@@ -201,7 +209,8 @@ class OfferSummary(object):
         if not isinstance(other, OfferSummary):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in OfferSummary.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
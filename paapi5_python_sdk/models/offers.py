@@ -55,12 +55,18 @@ class Offers(object):
         'summaries': 'Summaries'
     }
 
+    __slots__ = (
+        '_listings',
+        '_summaries',
+    )
+
+    discriminator = None
+
     def __init__(self, listings=None, summaries=None):  # noqa: E501
         """Offers - a model defined in Swagger"""  # noqa: E501
 
         self._listings = None
         self._summaries = None
-        self.discriminator = None
 
         if listings is not None:
             self.listings = listings
@@ -149,7 +155,8 @@ class Offers(object):
         if not isinstance(other, Offers):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in Offers.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -53,9 +53,12 @@ class PartnerType(object):
     attribute_map = {
     }
 
+    __slots__ = ()
+
+    discriminator = None
+
     def __init__(self):  # noqa: E501
         """PartnerType - a model defined in Swagger"""  # noqa: E501
-        self.discriminator = None
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -97,7 +100,8 @@ class PartnerType(object):
         if not isinstance(other, PartnerType):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in PartnerType.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -54,12 +54,18 @@ class Price(object):
         'lowest_price': 'LowestPrice'
     }
 
+    __slots__ = (
+        '_highest_price',
+        '_lowest_price',
+    )
+
+    discriminator = None
+
     def __init__(self, highest_price=None, lowest_price=None):  # noqa: E501
         """Price - a model defined in Swagger"""  # noqa: E501
 
         self._highest_price = None
         self._lowest_price = None
-        self.discriminator = None
 
         if highest_price is not None:
             self.highest_price = highest_price
@@ -148,7 +154,8 @@ class Price(object):
         if not isinstance(other, Price):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in Price.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -56,9 +56,12 @@ class PriceType(object):
     attribute_map = {
     }
 
+    __slots__ = ()
+
+    discriminator = None
+
     def __init__(self):  # noqa: E501
         """PriceType - a model defined in Swagger"""  # noqa: E501
-        self.discriminator = None
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -100,7 +103,8 @@ class PriceType(object):
         if not isinstance(other, PriceType):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in PriceType.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -52,11 +52,16 @@ class ProductAdvertisingAPIClientException(object):
         'errors': 'Errors'
     }
 
+    __slots__ = (
+        '_errors',
+    )
+
+    discriminator = None
+
     def __init__(self, errors=None):  # noqa: E501
         """ProductAdvertisingAPIClientException - a model defined in Swagger"""  # noqa: E501
 
         self._errors = None
-        self.discriminator = None
 
         if errors is not None:
             self.errors = errors
@@ -122,7 +127,8 @@ class ProductAdvertisingAPIClientException(object):
         if not isinstance(other, ProductAdvertisingAPIClientException):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in ProductAdvertisingAPIClientException.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
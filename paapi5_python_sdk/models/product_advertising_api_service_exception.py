@@ -50,11 +50,16 @@ class ProductAdvertisingAPIServiceException(object):
         'message': 'message'
     }
 
+    __slots__ = (
+        '_message',
+    )
+
+    discriminator = None
+
     def __init__(self, message=None):  # noqa: E501
         """ProductAdvertisingAPIServiceException - a model defined in Swagger"""  # noqa: E501
 
         self._message = None
-        self.discriminator = None
 
         if message is not None:
             self.message = message
@@ -120,7 +125,8 @@ class ProductAdvertisingAPIServiceException(object):
         if not isinstance(other, ProductAdvertisingAPIServiceException):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in ProductAdvertisingAPIServiceException.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
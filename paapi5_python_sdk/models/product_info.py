@@ -65,6 +65,17 @@ class ProductInfo(object):
         'unit_count': 'UnitCount'
     }
 
+    __slots__ = (
+        '_color',
+        '_is_adult_product',
+        '_item_dimensions',
+        '_release_date',
+        '_size',
+        '_unit_count',
+    )
+
+    discriminator = None
+
     def __init__(self, color=None, is_adult_product=None, item_dimensions=None, release_date=None, size=None, unit_count=None):  # noqa: E501
         """ProductInfo - a model defined in Swagger"""  # noqa: E501
 
@@ -74,7 +85,6 @@ class ProductInfo(object):
         self._release_date = None
         self._size = None
         self._unit_count = None
-        self.discriminator = None
 
         if color is not None:
             self.color = color
@@ -255,7 +265,8 @@ class ProductInfo(object):
         if not isinstance(other, ProductInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in ProductInfo.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
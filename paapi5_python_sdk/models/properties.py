@@ -48,9 +48,12 @@ class Properties(dict):
     attribute_map = {
     }
 
+    __slots__ = ()
+
+    discriminator = None
+
     def __init__(self):  # noqa: E501
         """Properties - a model defined in Swagger"""  # noqa: E501
-        self.discriminator = None
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -92,7 +95,8 @@ class Properties(dict):
         if not isinstance(other, Properties):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in Properties.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -50,11 +50,16 @@ class Rating(object):
         'value': 'Value'
     }
 
+    __slots__ = (
+        '_value',
+    )
+
+    discriminator = None
+
     def __init__(self, value=None):  # noqa: E501
         """Rating - a model defined in Swagger"""  # noqa: E501
 
         self._value = None
-        self.discriminator = None
 
         if value is not None:
             self.value = value
@@ -120,7 +125,8 @@ class Rating(object):
         if not isinstance(other, Rating):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in Rating.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
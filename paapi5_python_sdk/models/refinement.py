@@ -56,13 +56,20 @@ class Refinement(object):
         'id': 'Id'
     }
 
+    __slots__ = (
+        '_bins',
+        '_display_name',
+        '_id',
+    )
+
+    discriminator = None
+
     def __init__(self, bins=None, display_name=None, id=None):  # noqa: E501
         """Refinement - a model defined in Swagger"""  # noqa: E501
 
         self._bins = None
         self._display_name = None
         self._id = None
-        self.discriminator = None
 
         if bins is not None:
             self.bins = bins
@@ -174,7 +181,8 @@ class Refinement(object):
         if not isinstance(other, Refinement):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in Refinement.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
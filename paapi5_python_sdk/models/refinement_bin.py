@@ -52,12 +52,18 @@ class RefinementBin(object):
         'id': 'Id'
     }
 
+    __slots__ = (
+        '_display_name',
+        '_id',
+    )
+
+    discriminator = None
+
     def __init__(self, display_name=None, id=None):  # noqa: E501
         """RefinementBin - a model defined in Swagger"""  # noqa: E501
 
         self._display_name = None
         self._id = None
-        self.discriminator = None
 
         if display_name is not None:
             self.display_name = display_name
@@ -146,7 +152,8 @@ class RefinementBin(object):
         if not isinstance(other, RefinementBin):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in RefinementBin.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -66,6 +66,17 @@ class RentalOfferListing(object):
         'merchant_info': 'MerchantInfo'
     }
 
+    __slots__ = (
+        '_availability',
+        '_base_price',
+        '_condition',
+        '_delivery_info',
+        '_id',
+        '_merchant_info',
+    )
+
+    discriminator = None
+
     def __init__(self, availability=None, base_price=None, condition=None, delivery_info=None, id=None, merchant_info=None):  # noqa: E501
         """RentalOfferListing - a model defined in Swagger"""  # noqa: E501
 
@@ -75,7 +86,6 @@ class RentalOfferListing(object):
         self._delivery_info = None
         self._id = None
         self._merchant_info = None
-        self.discriminator = None
 
         if availability is not None:
             self.availability = availability
@@ -256,7 +266,8 @@ class RentalOfferListing(object):
         if not isinstance(other, RentalOfferListing):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in RentalOfferListing.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -52,11 +52,16 @@ class RentalOffers(object):
         'listings': 'Listings'
     }
 
+    __slots__ = (
+        '_listings',
+    )
+
+    discriminator = None
+
     def __init__(self, listings=None):  # noqa: E501
         """RentalOffers - a model defined in Swagger"""  # noqa: E501
 
         self._listings = None
-        self.discriminator = None
 
         if listings is not None:
             self.listings = listings
@@ -122,7 +127,8 @@ class RentalOffers(object):
         if not isinstance(other, RentalOffers):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in RentalOffers.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
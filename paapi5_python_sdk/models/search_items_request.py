@@ -116,6 +116,38 @@ class SearchItemsRequest(object):
         'title': 'Title'
     }
 
+    __slots__ = (
+        '_actor',
+        '_artist',
+        '_author',
+        '_availability',
+        '_brand',
+        '_browse_node_id',
+        '_condition',
+        '_currency_of_preference',
+        '_delivery_flags',
+        '_item_count',
+        '_item_page',
+        '_keywords',
+        '_languages_of_preference',
+        '_marketplace',
+        '_max_price',
+        '_merchant',
+        '_min_price',
+        '_min_reviews_rating',
+        '_min_saving_percent',
+        '_offer_count',
+        '_partner_tag',
+        '_partner_type',
+        '_properties',
+        '_resources',
+        '_search_index',
+        '_sort_by',
+        '_title',
+    )
+
+    discriminator = None
+
     def __init__(self, actor=None, artist=None, author=None, availability=None, brand=None, browse_node_id=None, condition=None, currency_of_preference=None, delivery_flags=None, item_count=None, item_page=None, keywords=None, languages_of_preference=None, marketplace=None, max_price=None, merchant=None, min_price=None, min_reviews_rating=None, min_saving_percent=None, offer_count=None, partner_tag=None, partner_type=None, properties=None, resources=None, search_index=None, sort_by=None, title=None):  # noqa: E501
         """SearchItemsRequest - a model defined in Swagger"""  # noqa: E501
 
@@ -146,7 +178,6 @@ class SearchItemsRequest(object):
         self._search_index = None
         self._sort_by = None
         self._title = None
-        self.discriminator = None
 
         if actor is not None:
             self.actor = actor
@@ -812,7 +843,8 @@ class SearchItemsRequest(object):
         if not isinstance(other, SearchItemsRequest):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in SearchItemsRequest.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -112,9 +112,12 @@ class SearchItemsResource(object):
     attribute_map = {
     }
 
+    __slots__ = ()
+
+    discriminator = None
+
     def __init__(self):  # noqa: E501
         """SearchItemsResource - a model defined in Swagger"""  # noqa: E501
-        self.discriminator = None
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -156,7 +159,8 @@ class SearchItemsResource(object):
         if not isinstance(other, SearchItemsResource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in SearchItemsResource.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -55,12 +55,18 @@ class SearchItemsResponse(object):
         'errors': 'Errors'
     }
 
+    __slots__ = (
+        '_search_result',
+        '_errors',
+    )
+
+    discriminator = None
+
     def __init__(self, search_result=None, errors=None):  # noqa: E501
         """SearchItemsResponse - a model defined in Swagger"""  # noqa: E501
 
         self._search_result = None
         self._errors = None
-        self.discriminator = None
 
         if search_result is not None:
             self.search_result = search_result
@@ -149,7 +155,8 @@ class SearchItemsResponse(object):
         if not isinstance(other, SearchItemsResponse):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in SearchItemsResponse.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -56,13 +56,20 @@ class SearchRefinements(object):
         'search_index': 'SearchIndex'
     }
 
+    __slots__ = (
+        '_browse_node',
+        '_other_refinements',
+        '_search_index',
+    )
+
+    discriminator = None
+
     def __init__(self, browse_node=None, other_refinements=None, search_index=None):  # noqa: E501
         """SearchRefinements - a model defined in Swagger"""  # noqa: E501
 
         self._browse_node = None
         self._other_refinements = None
         self._search_index = None
-        self.discriminator = None
 
         if browse_node is not None:
             self.browse_node = browse_node
@@ -174,7 +181,8 @@ class SearchRefinements(object):
         if not isinstance(other, SearchRefinements):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in SearchRefinements.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -59,6 +59,15 @@ class SearchResult(object):
         'search_refinements': 'SearchRefinements'
     }
 
+    __slots__ = (
+        '_total_result_count',
+        '_search_url',
+        '_items',
+        '_search_refinements',
+    )
+
+    discriminator = None
+
     def __init__(self, total_result_count=None, search_url=None, items=None, search_refinements=None):  # noqa: E501
         """SearchResult - a model defined in Swagger"""  # noqa: E501
 
@@ -66,7 +75,6 @@ class SearchResult(object):
         self._search_url = None
         self._items = None
         self._search_refinements = None
-        self.discriminator = None
 
         if total_result_count is not None:
             self.total_result_count = total_result_count
@@ -201,7 +209,8 @@ class SearchResult(object):
         if not isinstance(other, SearchResult):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in SearchResult.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -54,13 +54,20 @@ class SingleStringValuedAttribute(object):
         'locale': 'Locale'
     }
 
+    __slots__ = (
+        '_display_value',
+        '_label',
+        '_locale',
+    )
+
+    discriminator = None
+
     def __init__(self, display_value=None, label=None, locale=None):  # noqa: E501
         """SingleStringValuedAttribute - a model defined in Swagger"""  # noqa: E501
 
         self._display_value = None
         self._label = None
         self._locale = None
-        self.discriminator = None
 
         if display_value is not None:
             self.display_value = display_value
@@ -172,7 +179,8 @@ class SingleStringValuedAttribute(object):
         if not isinstance(other, SingleStringValuedAttribute):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in SingleStringValuedAttribute.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -58,9 +58,12 @@ class SortBy(object):
     attribute_map = {
     }
 
+    __slots__ = ()
+
+    discriminator = None
+
     def __init__(self):  # noqa: E501
         """SortBy - a model defined in Swagger"""  # noqa: E501
-        self.discriminator = None
 
     def to_dict(self):
         """Returns the model properties as a dict"""
@@ -102,7 +105,8 @@ class SortBy(object):
         if not isinstance(other, SortBy):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in SortBy.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -55,12 +55,18 @@ class TechnicalInfo(object):
         'formats': 'Formats'
     }
 
+    __slots__ = (
+        '_energy_efficiency_class',
+        '_formats',
+    )
+
+    discriminator = None
+
     def __init__(self, energy_efficiency_class=None, formats=None):  # noqa: E501
         """TechnicalInfo - a model defined in Swagger"""  # noqa: E501
 
         self._energy_efficiency_class = None
         self._formats = None
-        self.discriminator = None
 
         if energy_efficiency_class is not None:
             self.energy_efficiency_class = energy_efficiency_class
@@ -149,7 +155,8 @@ class TechnicalInfo(object):
         if not isinstance(other, TechnicalInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in TechnicalInfo.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -54,12 +54,18 @@ class TradeInInfo(object):
         'price': 'Price'
     }
 
+    __slots__ = (
+        '_is_eligible_for_trade_in',
+        '_price',
+    )
+
+    discriminator = None
+
     def __init__(self, is_eligible_for_trade_in=None, price=None):  # noqa: E501
         """TradeInInfo - a model defined in Swagger"""  # noqa: E501
 
         self._is_eligible_for_trade_in = None
         self._price = None
-        self.discriminator = None
 
         if is_eligible_for_trade_in is not None:
             self.is_eligible_for_trade_in = is_eligible_for_trade_in
@@ -148,7 +154,8 @@ class TradeInInfo(object):
         if not isinstance(other, TradeInInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in TradeInInfo.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
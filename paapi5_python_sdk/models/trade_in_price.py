@@ -54,13 +54,20 @@ class TradeInPrice(object):
         'display_amount': 'DisplayAmount'
     }
 
+    __slots__ = (
+        '_amount',
+        '_currency',
+        '_display_amount',
+    )
+
+    discriminator = None
+
     def __init__(self, amount=None, currency=None, display_amount=None):  # noqa: E501
         """TradeInPrice - a model defined in Swagger"""  # noqa: E501
 
         self._amount = None
         self._currency = None
         self._display_amount = None
-        self.discriminator = None
 
         if amount is not None:
             self.amount = amount
@@ -172,7 +179,8 @@ class TradeInPrice(object):
         if not isinstance(other, TradeInPrice):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in TradeInPrice.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
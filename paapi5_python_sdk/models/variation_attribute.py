@@ -52,12 +52,18 @@ class VariationAttribute(object):
         'value': 'Value'
     }
 
+    __slots__ = (
+        '_name',
+        '_value',
+    )
+
+    discriminator = None
+
     def __init__(self, name=None, value=None):  # noqa: E501
         """VariationAttribute - a model defined in Swagger"""  # noqa: E501
 
         self._name = None
         self._value = None
-        self.discriminator = None
 
         if name is not None:
             self.name = name
@@ -146,7 +152,8 @@ class VariationAttribute(object):
         if not isinstance(other, VariationAttribute):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in VariationAttribute.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -56,6 +56,15 @@ class VariationDimension(object):
         'values': 'Values'
     }
 
+    __slots__ = (
+        '_display_name',
+        '_locale',
+        '_name',
+        '_values',
+    )
+
+    discriminator = None
+
     def __init__(self, display_name=None, locale=None, name=None, values=None):  # noqa: E501
         """VariationDimension - a model defined in Swagger"""  # noqa: E501
 
@@ -63,7 +72,6 @@ class VariationDimension(object):
         self._locale = None
         self._name = None
         self._values = None
-        self.discriminator = None
 
         if display_name is not None:
             self.display_name = display_name
@@ -198,7 +206,8 @@ class VariationDimension(object):
         if not isinstance(other, VariationDimension):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in VariationDimension.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
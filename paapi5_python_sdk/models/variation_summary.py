@@ -59,6 +59,15 @@ class VariationSummary(object):
         'variation_dimensions': 'VariationDimensions'
     }
 
+    __slots__ = (
+        '_page_count',
+        '_price',
+        '_variation_count',
+        '_variation_dimensions',
+    )
+
+    discriminator = None
+
     def __init__(self, page_count=None, price=None, variation_count=None, variation_dimensions=None):  # noqa: E501
         """VariationSummary - a model defined in Swagger"""  # noqa: E501
 
@@ -66,7 +75,6 @@ class VariationSummary(object):
         self._price = None
         self._variation_count = None
         self._variation_dimensions = None
-        self.discriminator = None
 
         if page_count is not None:
             self.page_count = page_count
@@ -201,7 +209,8 @@ class VariationSummary(object):
         if not isinstance(other, VariationSummary):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in VariationSummary.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
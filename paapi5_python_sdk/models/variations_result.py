@@ -55,12 +55,18 @@ class VariationsResult(object):
         'variation_summary': 'VariationSummary'
     }
 
+    __slots__ = (
+        '_items',
+        '_variation_summary',
+    )
+
+    discriminator = None
+
     def __init__(self, items=None, variation_summary=None):  # noqa: E501
         """VariationsResult - a model defined in Swagger"""  # noqa: E501
 
         self._items = None
         self._variation_summary = None
-        self.discriminator = None
 
         if items is not None:
             self.items = items
@@ -149,7 +155,8 @@ class VariationsResult(object):
         if not isinstance(other, VariationsResult):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in VariationsResult.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
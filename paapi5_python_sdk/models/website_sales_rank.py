@@ -56,6 +56,15 @@ class WebsiteSalesRank(object):
         'sales_rank': 'SalesRank'
     }
 
+    __slots__ = (
+        '_context_free_name',
+        '_display_name',
+        '_id',
+        '_sales_rank',
+    )
+
+    discriminator = None
+
     def __init__(self, context_free_name=None, display_name=None, id=None, sales_rank=None):  # noqa: E501
         """WebsiteSalesRank - a model defined in Swagger"""  # noqa: E501
 
@@ -63,7 +72,6 @@ class WebsiteSalesRank(object):
         self._display_name = None
         self._id = None
         self._sales_rank = None
-        self.discriminator = None
 
         if context_free_name is not None:
             self.context_free_name = context_free_name
@@ -198,7 +206,8 @@ class WebsiteSalesRank(object):
         if not isinstance(other, WebsiteSalesRank):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in WebsiteSalesRank.__slots__)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
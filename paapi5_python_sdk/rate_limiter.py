@@ -0,0 +1,274 @@
+# coding: utf-8
+
+"""
+  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+  Licensed under the Apache License, Version 2.0 (the "License").
+  You may not use this file except in compliance with the License.
+  A copy of the License is located at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+  or in the "license" file accompanying this file. This file is distributed
+  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+  express or implied. See the License for the specific language governing
+  permissions and limitations under the License.
+"""
+
+"""
+    ProductAdvertisingAPI
+
+    https://webservices.amazon.com/paapi5/documentation/index.html  # noqa: E501
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+
+from paapi5_python_sdk.rest import ApiException
+
+# Lower values are served first.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+
+SECONDS_PER_DAY = 86400
+
+
+class RateLimitTimeout(ApiException):
+    """Raised when a call waited longer than its timeout for a request slot."""
+
+    def __init__(self, waited):
+        super(RateLimitTimeout, self).__init__(
+            status=0,
+            reason="Timed out after {0:.1f}s waiting for the PA-API rate "
+                   "limit".format(waited))
+        self.waited = waited
+
+
+class _AsyncEvent(object):
+    """threading.Event-like wake-up for a coroutine; set() is thread-safe."""
+
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+
+    def set(self):
+        self._loop.call_soon_threadsafe(self._event.set)
+
+    def clear(self):
+        self._event.clear()
+
+    async def wait(self, timeout=None):
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+class _Waiter(object):
+
+    __slots__ = ('priority', 'seq', 'event')
+
+    def __init__(self, priority, seq, event):
+        self.priority = priority
+        self.seq = seq
+        self.event = event
+
+    def __lt__(self, other):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class TokenBucketRateLimiter(object):
+    """Token bucket limiting calls to the PA-API account quota.
+
+    PA-API allows `rate` transactions per second (TPS) and `per_day`
+    transactions per day (TPD) per account. Calls that exceed the quota are
+    queued instead of failing; waiting calls are served in priority order
+    (lower first, FIFO within a priority), so interactive lookups overtake
+    background work.
+
+    Pass an instance as `rate_limiter` to ApiClient to limit every request it
+    sends.
+
+    :param rate: Sustained requests per second.
+    :param burst: Maximum number of requests sent back to back.
+    :param per_day: Requests per day, or None for no daily limit.
+    :param timeout: Default maximum seconds a call waits in the queue, or
+        None to wait forever.
+    """
+
+    def __init__(self, rate=1.0, burst=1, per_day=None, timeout=None,
+                 clock=time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = max(1, burst)
+        self.per_day = per_day
+        self.timeout = timeout
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._waiters = []
+        self._seq = itertools.count()
+        self._updated = clock()
+        self._tokens = float(self.burst)
+        self._day_tokens = float(per_day) if per_day else None
+
+        self.acquired = 0
+        self.timeouts = 0
+        self.queued = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    @property
+    def queue_depth(self):
+        """Number of calls currently waiting for a slot."""
+        return len(self._waiters)
+
+    def stats(self):
+        """Returns the limiter counters as a dict."""
+        return {
+            'queue_depth': self.queue_depth,
+            'acquired': self.acquired,
+            'queued': self.queued,
+            'timeouts': self.timeouts,
+            'wait_time_total': self.wait_time_total,
+            'wait_time_max': self.wait_time_max,
+            'wait_time_avg': (self.wait_time_total / self.acquired
+                              if self.acquired else 0.0),
+        }
+
+    def acquire(self, priority=PRIORITY_INTERACTIVE, timeout=None):
+        """Blocks until a request may be sent.
+
+        :param priority: Queue priority, lower is served first.
+        :param timeout: Maximum seconds to wait, defaults to the limiter's
+            `timeout`.
+        :return: The number of seconds spent waiting.
+        :raises RateLimitTimeout: if `timeout` elapsed first.
+        """
+        start = self.clock()
+        waiter = self._enqueue(priority, threading.Event())
+        granted = False
+        slept = False
+        try:
+            while True:
+                delay = self._poll(waiter)
+                if delay == 0:
+                    granted = True
+                    return self._record(self.clock() - start, slept)
+                waiter.event.wait(self._bound(delay, start, timeout))
+                slept = True
+        finally:
+            if not granted:
+                self._discard(waiter)
+
+    async def acquire_async(self, priority=PRIORITY_INTERACTIVE, timeout=None):
+        """Waits without blocking the event loop until a request may be sent.
+
+        Coroutines and threads share the same queue and quota.
+
+        :param priority: Queue priority, lower is served first.
+        :param timeout: Maximum seconds to wait, defaults to the limiter's
+            `timeout`.
+        :return: The number of seconds spent waiting.
+        :raises RateLimitTimeout: if `timeout` elapsed first.
+        """
+        start = self.clock()
+        waiter = self._enqueue(priority, _AsyncEvent())
+        granted = False
+        slept = False
+        try:
+            while True:
+                delay = self._poll(waiter)
+                if delay == 0:
+                    granted = True
+                    return self._record(self.clock() - start, slept)
+                await waiter.event.wait(self._bound(delay, start, timeout))
+                slept = True
+        finally:
+            if not granted:
+                self._discard(waiter)
+
+    def _enqueue(self, priority, event):
+        waiter = _Waiter(priority, next(self._seq), event)
+        with self._lock:
+            heapq.heappush(self._waiters, waiter)
+            if self._waiters[0] is waiter:
+                self._wake_head()
+        return waiter
+
+    def _poll(self, waiter):
+        """Returns 0 once `waiter` got a slot, else the seconds to wait for
+        one (None when other calls are ahead of it)."""
+        with self._lock:
+            delay = None
+            if self._waiters[0] is waiter:
+                delay = self._take()
+                if delay == 0:
+                    heapq.heappop(self._waiters)
+                    self._wake_head()
+                    return 0
+            waiter.event.clear()
+            return delay
+
+    def _bound(self, delay, start, timeout):
+        """Caps `delay` by the time left before `timeout`, raising once it
+        has elapsed."""
+        if timeout is None:
+            timeout = self.timeout
+        if timeout is None:
+            return delay
+        remaining = start + timeout - self.clock()
+        if remaining <= 0:
+            with self._lock:
+                self.timeouts += 1
+            raise RateLimitTimeout(self.clock() - start)
+        return remaining if delay is None else min(delay, remaining)
+
+    def _take(self):
+        """Consumes a token, returning 0, or the seconds until one is free."""
+        now = self.clock()
+        elapsed = max(0.0, now - self._updated)
+        self._updated = now
+        self._tokens = min(float(self.burst),
+                           self._tokens + elapsed * self.rate)
+        delay = 0.0
+        if self._tokens < 1:
+            delay = (1 - self._tokens) / self.rate
+        if self._day_tokens is not None:
+            day_rate = float(self.per_day) / SECONDS_PER_DAY
+            self._day_tokens = min(float(self.per_day),
+                                   self._day_tokens + elapsed * day_rate)
+            if self._day_tokens < 1:
+                delay = max(delay, (1 - self._day_tokens) / day_rate)
+        if delay > 0:
+            return delay
+        self._tokens -= 1
+        if self._day_tokens is not None:
+            self._day_tokens -= 1
+        return 0
+
+    def _record(self, waited, slept):
+        with self._lock:
+            self.acquired += 1
+            if slept:
+                self.queued += 1
+            self.wait_time_total += waited
+            self.wait_time_max = max(self.wait_time_max, waited)
+        return waited
+
+    def _wake_head(self):
+        if self._waiters:
+            self._waiters[0].event.set()
+
+    def _discard(self, waiter):
+        with self._lock:
+            if waiter in self._waiters:
+                was_head = self._waiters[0] is waiter
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+                if was_head:
+                    self._wake_head()
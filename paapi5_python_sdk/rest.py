@@ -29,8 +29,11 @@ from __future__ import absolute_import
 import io
 import json
 import logging
+import random
 import re
 import ssl
+import threading
+import time
 
 import certifi
 # python 2 and python 3 compatibility library
@@ -42,17 +45,19 @@ try:
 except ImportError:
     raise ImportError('Swagger python client requires urllib3.')
 
+from paapi5_python_sdk.metrics import operation_of
+
 
 logger = logging.getLogger(__name__)
 
 
 class RESTResponse(io.IOBase):
 
-    def __init__(self, resp):
+    def __init__(self, resp, data=None):
         self.urllib3_response = resp
         self.status = resp.status
         self.reason = resp.reason
-        self.data = resp.data
+        self.data = resp.data if data is None else data
 
     def getheaders(self):
         """Returns a dictionary of the response headers."""
@@ -63,15 +68,26 @@ class RESTResponse(io.IOBase):
         return self.urllib3_response.getheader(name, default)
 
 
+def _response_size(response):
+    """Returns the body size of a response without reading an unread one."""
+    if isinstance(response, urllib3.HTTPResponse):
+        length = response.headers.get('Content-Length')
+        return int(length) if length and length.isdigit() else 0
+    return len(response.data or b'')
+
+
 class RESTClientObject(object):
 
-    def __init__(self, configuration, pools_size=4, maxsize=None):
+    def __init__(self, configuration, pools_size=4, maxsize=None,
+                 metrics=None):
         # urllib3.PoolManager will pass all kw parameters to connectionpool
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
         # maxsize is the number of requests to host that are allowed in parallel  # noqa: E501
         # Custom SSL certificates and client certificates: http://urllib3.readthedocs.io/en/latest/advanced-usage.html  # noqa: E501
 
+        self.metrics = metrics
+
         # cert_reqs
         if configuration.verify_ssl:
             cert_reqs = ssl.CERT_REQUIRED
@@ -118,6 +134,10 @@ class RESTClientObject(object):
                 **addition_pool_args
             )
 
+    def close(self):
+        """Closes all pooled connections."""
+        self.pool_manager.clear()
+
     def request(self, method, url, query_params=None, headers=None,
                 body=None, post_params=None, _preload_content=True,
                 _request_timeout=None):
@@ -139,6 +159,33 @@ class RESTClientObject(object):
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
         """
+        if self.metrics is None:
+            return self._request(method, url, query_params, headers, body,
+                                 post_params, _preload_content,
+                                 _request_timeout)
+
+        headers = headers or {}
+        started = time.perf_counter()
+        status, response_bytes = 0, 0
+        try:
+            r = self._request(method, url, query_params, headers, body,
+                              post_params, _preload_content, _request_timeout)
+            status = r.status
+            response_bytes = _response_size(r)
+            return r
+        except ApiException as e:
+            status = e.status or 0
+            response_bytes = len(e.body.encode('utf8')) if e.body else 0
+            raise
+        finally:
+            self.metrics.observe_request(
+                operation_of(headers), status, time.perf_counter() - started,
+                len(body) if isinstance(body, bytes) else 0, response_bytes)
+
+    def _request(self, method, url, query_params=None, headers=None,
+                 body=None, post_params=None, _preload_content=True,
+                 _request_timeout=None):
+        """Sends the request; see `request`."""
         method = method.upper()
         assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
                           'PATCH', 'OPTIONS']
@@ -170,12 +217,15 @@ class RESTClientObject(object):
                     url += '?' + urlencode(query_params)
                 if re.search('json', headers['Content-Type'], re.IGNORECASE):
                     request_body = None
-                    if body is not None:
+                    if isinstance(body, bytes):
+                        # already serialized (and signed) by ApiClient
+                        request_body = body
+                    elif body is not None:
                         request_body = json.dumps(body)
                     r = self.pool_manager.request(
                         method, url,
                         body=request_body,
-                        preload_content=_preload_content,
+                        preload_content=False,
                         timeout=timeout,
                         headers=headers)
                 elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
@@ -183,7 +233,7 @@ class RESTClientObject(object):
                         method, url,
                         fields=post_params,
                         encode_multipart=False,
-                        preload_content=_preload_content,
+                        preload_content=False,
                         timeout=timeout,
                         headers=headers)
                 elif headers['Content-Type'] == 'multipart/form-data':
@@ -195,7 +245,7 @@ class RESTClientObject(object):
                         method, url,
                         fields=post_params,
                         encode_multipart=True,
-                        preload_content=_preload_content,
+                        preload_content=False,
                         timeout=timeout,
                         headers=headers)
                 # Pass a `string` parameter directly in the body to support
@@ -206,7 +256,7 @@ class RESTClientObject(object):
                     r = self.pool_manager.request(
                         method, url,
                         body=request_body,
-                        preload_content=_preload_content,
+                        preload_content=False,
                         timeout=timeout,
                         headers=headers)
                 else:
@@ -219,7 +269,7 @@ class RESTClientObject(object):
             else:
                 r = self.pool_manager.request(method, url,
                                               fields=query_params,
-                                              preload_content=_preload_content,
+                                              preload_content=False,
                                               timeout=timeout,
                                               headers=headers)
         except urllib3.exceptions.SSLError as e:
@@ -227,15 +277,19 @@ class RESTClientObject(object):
             raise ApiException(status=0, reason=msg)
 
         if _preload_content:
-            r = RESTResponse(r)
-
-            # In the python 3, the response.data is bytes.
-            # we need to decode it to string.
-            if six.PY3:
-                r.data = r.data.decode('utf8')
+            # read the body ourselves rather than with urllib3's preloading,
+            # so RESTResponse.data holds the only copy and the body is freed
+            # once it has been parsed. It stays bytes; json.loads reads it
+            # directly, without decoding to str first.
+            try:
+                data = r.read()
+            finally:
+                r.release_conn()
+            r = RESTResponse(r, data)
 
             # log response body
-            logger.debug("response body: %s", r.data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("response body: %s", data.decode('utf8'))
 
         if not 200 <= r.status <= 299:
             raise ApiException(http_resp=r)
@@ -308,6 +362,110 @@ class RESTClientObject(object):
                             body=body)
 
 
+class RetryPolicy(object):
+    """Decides whether and when a failed request is retried.
+
+    Throttling (HTTP 429 or a `TooManyRequests` error code in the response
+    `Errors`) and 5xx responses are retried up to `max_attempts` times in
+    total, sleeping a random ("full jitter") delay between 0 and
+    min(max_delay, base_delay * 2 ** retry) seconds, or the `Retry-After`
+    header when the server sends a longer one.
+
+    Retries are also limited by a budget shared by every request using the
+    policy: each request adds `budget_ratio` tokens (up to `budget_max`)
+    and each retry spends one, so a persistent outage cannot multiply the
+    request rate.
+
+    :param max_attempts: Total attempts per request, including the first.
+    :param base_delay: Backoff base in seconds.
+    :param max_delay: Maximum backoff in seconds.
+    :param budget_ratio: Retry tokens earned per request.
+    :param budget_max: Maximum (and initial) number of retry tokens.
+    """
+
+    RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+    RETRY_ERROR_CODES = frozenset(['TooManyRequests', 'InternalFailure'])
+
+    def __init__(self, max_attempts=4, base_delay=0.5, max_delay=8.0,
+                 budget_ratio=0.2, budget_max=10.0, random=random.random):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget_ratio = budget_ratio
+        self.budget_max = float(budget_max)
+        self.random = random
+
+        self._lock = threading.Lock()
+        self._budget = self.budget_max
+
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.exhausted = 0
+        self.budget_exhausted = 0
+        self.retry_wait_total = 0.0
+
+    def stats(self):
+        """Returns the retry counters as a dict."""
+        return {
+            'requests': self.requests,
+            'retries': self.retries,
+            'throttled': self.throttled,
+            'exhausted': self.exhausted,
+            'budget_exhausted': self.budget_exhausted,
+            'budget': self._budget,
+            'retry_wait_total': self.retry_wait_total,
+        }
+
+    def on_request(self):
+        """Records a new request (not a retry) and refills the budget."""
+        with self._lock:
+            self.requests += 1
+            self._budget = min(self.budget_max,
+                               self._budget + self.budget_ratio)
+
+    def is_retryable(self, exception):
+        """Returns True if `exception` is a transient PA-API failure."""
+        if not isinstance(exception, ApiException):
+            return False
+        return (exception.status in self.RETRY_STATUSES or
+                bool(self.RETRY_ERROR_CODES.intersection(
+                    exception.error_codes)))
+
+    def next_delay(self, attempt, exception):
+        """Returns the seconds to sleep before retrying, or None to give up.
+
+        :param attempt: Number of attempts made so far (1 after the first).
+        :param exception: The ApiException raised by the last attempt.
+        """
+        if not self.is_retryable(exception):
+            return None
+        with self._lock:
+            if (exception.status == 429 or
+                    'TooManyRequests' in exception.error_codes):
+                self.throttled += 1
+            if attempt >= self.max_attempts:
+                self.exhausted += 1
+                return None
+            if self._budget < 1:
+                self.budget_exhausted += 1
+                return None
+            self._budget -= 1
+            self.retries += 1
+
+            ceiling = min(self.max_delay,
+                          self.base_delay * (2 ** (attempt - 1)))
+            delay = self.random() * ceiling
+            retry_after = exception.retry_after
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, self.max_delay))
+            self.retry_wait_total += delay
+        logger.info("retrying after %s (attempt %d of %d) in %.2fs",
+                    exception.error_codes or exception.status, attempt + 1,
+                    self.max_attempts, delay)
+        return delay
+
+
 class ApiException(Exception):
 
     def __init__(self, status=None, reason=None, http_resp=None):
@@ -315,6 +473,8 @@ class ApiException(Exception):
             self.status = http_resp.status
             self.reason = http_resp.reason
             self.body = http_resp.data
+            if isinstance(self.body, bytes):
+                self.body = self.body.decode('utf8', 'replace')
             self.headers = http_resp.getheaders()
         else:
             self.status = status
@@ -334,3 +494,22 @@ class ApiException(Exception):
             error_message += "HTTP response body: {0}\n".format(self.body)
 
         return error_message
+
+    @property
+    def error_codes(self):
+        """The `Code` of every entry in the response body's `Errors`."""
+        try:
+            errors = json.loads(self.body).get('Errors') or []
+            return [error.get('Code') for error in errors]
+        except (TypeError, ValueError, AttributeError):
+            return []
+
+    @property
+    def retry_after(self):
+        """The `Retry-After` header in seconds, if the server sent one."""
+        if not self.headers:
+            return None
+        try:
+            return float(self.headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,127 @@
+# coding: utf-8
+
+"""
+  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+  Licensed under the Apache License, Version 2.0 (the "License").
+  You may not use this file except in compliance with the License.
+  A copy of the License is located at
+
+      http://www.apache.org/licenses/LICENSE-2.0
+
+  or in the "license" file accompanying this file. This file is distributed
+  on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+  express or implied. See the License for the specific language governing
+  permissions and limitations under the License.
+"""
+
+"""
+    ProductAdvertisingAPI
+
+    https://webservices.amazon.com/paapi5/documentation/index.html  # noqa: E501
+"""
+
+import asyncio
+import threading
+
+
+class SingleFlight(object):
+    """Shares one execution between identical concurrent calls.
+
+    The first call for a key runs; calls made with the same key while it is
+    in flight wait for it and receive the same result (or exception). Once
+    it has finished the key is forgotten, so nothing is cached.
+
+    Pass an instance as `single_flight` to ApiClient to coalesce identical
+    requests (same operation, headers and serialized body) in flight at the
+    same time. Coalesced callers share the deserialized response object.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._tasks = {}
+
+        self.calls = 0
+        self.coalesced = 0
+
+    @property
+    def in_flight(self):
+        """Number of distinct calls currently running."""
+        return len(self._calls) + len(self._tasks)
+
+    def stats(self):
+        """Returns the coalescing counters as a dict."""
+        return {
+            'calls': self.calls,
+            'coalesced': self.coalesced,
+            'in_flight': self.in_flight,
+        }
+
+    def do(self, key, fn):
+        """Runs `fn()` unless a call with `key` is in flight, else waits for
+        that call and returns its result.
+
+        :param key: Hashable identity of the call.
+        :param fn: Function making the call.
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    async def do_async(self, key, coroutine_fn):
+        """Coroutine version of `do`.
+
+        The call runs in its own task, so cancelling one of the waiting
+        callers (even the first) does not cancel it for the others.
+
+        :param key: Hashable identity of the call.
+        :param coroutine_fn: Function returning the coroutine making the call.
+        """
+        loop_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            self.calls += 1
+            task = self._tasks.get(loop_key)
+            if task is not None:
+                self.coalesced += 1
+            else:
+                task = self._tasks[loop_key] = asyncio.ensure_future(
+                    coroutine_fn())
+                task.add_done_callback(
+                    lambda _: self._forget(loop_key))
+        return await asyncio.shield(task)
+
+    def _forget(self, loop_key):
+        with self._lock:
+            self._tasks.pop(loop_key, None)
+
+
+class _Call(object):
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None